@@ -0,0 +1,197 @@
+"""
+Autoplayer: der Computer spielt selbst
+
+Bewertet jede erreichbare Platzierung des aktuellen Tetrominos zusammen mit jeder Platzierung
+des nächsten (naechstes_tetromino) über eine gewichtete Spielfeldbewertung aus Löchern,
+Gesamthöhe, Unebenheit und entfernten Reihen. Im Spiel steuert er TetrisSpiel über
+Autoplayer.zug(); ohne Darstellung und so schnell wie möglich spielt er über turnier.py:
+
+    python turnier.py --strategie heuristik --spiele 100
+"""
+
+from config import SPALTEN, ZEILEN
+from engine import AKTION_RUNTER, AKTION_HARD_DROP
+from formen import FORM_TABELLEN
+from platzierungen import reihen_platzierungen, endpositionen
+from spielfeld import VOLLE_REIHE, maske_verschieben, bits_zaehlen
+from zobrist import Transpositionstabelle, reihen_hash, reihe_aendern, stein_hash
+
+# Gewichte der Spielfeldbewertung (klassische Vier-Merkmale-Heuristik)
+GEWICHTE = {
+    "hoehe": -0.510066,   # Summe der Spaltenhöhen
+    "linien": 0.760666,   # Entfernte Reihen
+    "loecher": -0.35663,  # Leere Zellen mit belegter Zelle darüber
+    "huegel": -0.184483,  # Summe der Höhenunterschiede benachbarter Spalten
+}
+
+# Abzug für Platzierungen, nach denen der nächste Stein nicht mehr erscheinen kann
+VERLOREN = -1e6
+
+# Bit x steht für das Spaltenpaar (x, x + 1)
+_SPALTENPAARE = VOLLE_REIHE >> 1
+
+
+def platzieren(reihen, form_idx, rotation, x, y, schluessel=None):
+    """Setzt eine Form in eine Kopie der Reihen und entfernt volle Reihen
+
+    Gibt (reihen, linien, schluessel) zurück oder None, wenn die Form über den oberen Rand ragt
+    (Game Over). Ein übergebener schluessel (Zobrist-Hash der Reihen) wird fortgeschrieben.
+    """
+    neu = list(reihen)
+    for i, maske in FORM_TABELLEN[form_idx][rotation].masken:
+        ry = y + i
+        if ry < 0:
+            return None
+        zeile = neu[ry] | maske_verschieben(maske, x)
+        if schluessel is not None:
+            schluessel = reihe_aendern(schluessel, ry, neu[ry], zeile)
+        neu[ry] = zeile
+
+    if VOLLE_REIHE not in neu:
+        return neu, 0, schluessel
+    rest = [reihe for reihe in neu if reihe != VOLLE_REIHE]
+    linien = ZEILEN - len(rest)
+    neu = [0] * linien + rest
+    return neu, linien, None if schluessel is None else reihen_hash(neu)
+
+
+def reihen_tabelle(gewichte=GEWICHTE):
+    """Berechnet den Bewertungsbeitrag jeder möglichen Maske begonnener Spalten vorab
+
+    Läuft man die Reihen von oben nach unten durch, enthält oben die Spalten, die auf dieser
+    Höhe schon begonnen haben. Jede davon zählt einmal zur Höhe; ein Spaltenpaar, von dem nur
+    eine Spalte begonnen hat, trägt eine Stufe zur Unebenheit bei. Löcher ergeben sich als
+    Gesamthöhe minus belegte Zellen und stecken deshalb ebenfalls in der Tabelle.
+    """
+    tabelle = []
+    for oben in range(VOLLE_REIHE + 1):
+        hoehe = bits_zaehlen(oben)
+        huegel = bits_zaehlen((oben ^ (oben >> 1)) & _SPALTENPAARE)
+        tabelle.append((gewichte["hoehe"] + gewichte["loecher"]) * hoehe + gewichte["huegel"] * huegel)
+    return tabelle
+
+
+def brett_bewerten(reihen, linien, belegt, gewichte=GEWICHTE, tabelle=None):
+    """Bewertet ein Spielfeld (höher ist besser); belegt ist die Anzahl belegter Zellen"""
+    tabelle = tabelle or reihen_tabelle(gewichte)
+    wert = gewichte["linien"] * linien - gewichte["loecher"] * belegt
+    oben = 0
+    for reihe in reihen:
+        oben |= reihe
+        wert += tabelle[oben]
+    return wert
+
+
+class Autoplayer:
+    """Wählt für jedes Tetromino die beste Platzierung und gibt die Eingaben dorthin aus"""
+
+    def __init__(self, gewichte=None, vorausschau=True, transpositionen=None):
+        """gewichte überschreibt einzelne Werte aus GEWICHTE; vorausschau bezieht das nächste Tetromino ein
+
+        transpositionen (zobrist.Transpositionstabelle) speichert Bewertungen bereits gesehener
+        Spielfelder; sie gelten nur für diese Gewichte und werden daher nicht geteilt.
+        """
+        self.gewichte = dict(GEWICHTE, **(gewichte or {}))
+        self.tabelle = reihen_tabelle(self.gewichte)
+        self.vorausschau = vorausschau
+        self.transpositionen = Transpositionstabelle() if transpositionen is None else transpositionen
+        self.plan = []
+        self.erwartet = None
+
+    def beste_platzierung(self, engine):
+        """Gibt die beste erreichbare Platzierung des aktuellen Tetrominos zurück (None, wenn keine)"""
+        tetromino = engine.aktuelles_tetromino
+        naechstes = engine.naechstes_tetromino if self.vorausschau else None
+        reihen = engine.spielfeld.reihen
+        schluessel = engine.spielfeld.hash
+        belegt = sum(engine.spielfeld.fuellstand) + len(tetromino.daten.zellen)
+
+        beste, bester_wert = None, None
+        for platzierung in reihen_platzierungen(reihen, tetromino.form_idx, tetromino.aktuelle_rotation,
+                                                tetromino.x, tetromino.y):
+            ergebnis = platzieren(reihen, tetromino.form_idx, platzierung.rotation, platzierung.x, platzierung.y,
+                                  schluessel)
+            if ergebnis is None:
+                wert = VERLOREN
+            else:
+                neue_reihen, linien, neuer_schluessel = ergebnis
+                if naechstes is None:
+                    wert = self.bewerten(neue_reihen, linien, belegt - SPALTEN * linien)
+                else:
+                    wert = self._folgewert(neue_reihen, linien, belegt - SPALTEN * linien, naechstes,
+                                           neuer_schluessel)
+            if bester_wert is None or wert > bester_wert:
+                beste, bester_wert = platzierung, wert
+        return beste
+
+    def _folgewert(self, reihen, linien, belegt, naechstes, schluessel):
+        """Bester Wert über alle Platzierungen des nächsten Tetrominos ab seiner Startposition
+
+        Das Ergebnis landet in der Transpositionstabelle, und zwar ohne die bisherigen linien,
+        damit es für jeden Weg zu diesem Spielfeld gilt. Wiederholt wird die Suche vor allem
+        beim Neuplanen in zug(), wenn die Schwerkraft den Stein verschoben hat: die Spielfelder
+        nach dem aktuellen Stein sind dann dieselben wie beim ersten Planen.
+        """
+        form_idx, rotation, x, y = naechstes.form_idx, naechstes.aktuelle_rotation, naechstes.x, naechstes.y
+        tt_schluessel = schluessel ^ stein_hash(form_idx, rotation, x, y)
+        bester_wert = self.transpositionen.nachschlagen(tt_schluessel, tiefe=1)
+        if bester_wert is None:
+            belegt += len(naechstes.daten.zellen)
+            for end_rotation, end_x, end_y in endpositionen(reihen, form_idx, rotation, x, y):
+                ergebnis = platzieren(reihen, form_idx, end_rotation, end_x, end_y)
+                if ergebnis is None:
+                    continue
+                neue_reihen, neue_linien, _ = ergebnis
+                wert = self.bewerten(neue_reihen, neue_linien, belegt - SPALTEN * neue_linien)
+                if bester_wert is None or wert > bester_wert:
+                    bester_wert = wert
+            if bester_wert is None:
+                bester_wert = VERLOREN + self.bewerten(reihen, 0, belegt - len(naechstes.daten.zellen))
+            self.transpositionen.speichern(tt_schluessel, bester_wert, tiefe=1)
+        return bester_wert + self.gewichte["linien"] * linien
+
+    def bewerten(self, reihen, linien, belegt):
+        """Bewertet ein Spielfeld mit den Gewichten dieses Autoplayers (höher ist besser)"""
+        return brett_bewerten(reihen, linien, belegt, self.gewichte, self.tabelle)
+
+    def planen(self, engine):
+        """Gibt die Eingaben bis zur besten Platzierung zurück, abgeschlossen mit Hard Drop
+
+        Das abschließende AKTION_RUNTER fixiert den Stein, falls er schon aufliegt
+        (der Hard Drop bewirkt dann nichts).
+        """
+        platzierung = self.beste_platzierung(engine)
+        if platzierung is None:
+            return [AKTION_RUNTER]
+        aktionen = list(platzierung.pfad)
+        while aktionen and aktionen[-1] == AKTION_RUNTER:
+            aktionen.pop()
+        return aktionen + [AKTION_HARD_DROP, AKTION_RUNTER]
+
+    def zug(self, engine):
+        """Führt die nächste Eingabe aus; plant neu, wenn ein neuer Stein da ist oder er abgewichen ist
+
+        Abweichungen entstehen durch die automatische Schwerkraft und den Gravitations-Gimmick.
+        """
+        tetromino = engine.aktuelles_tetromino
+        if tetromino is None or not engine.spiel_aktiv or engine.pause:
+            return False
+
+        if self._zustand(tetromino) != self.erwartet:
+            self.plan = self.planen(engine)
+            self.plan.reverse()
+        ergebnis = engine.step(self.plan.pop() if self.plan else AKTION_RUNTER)
+
+        # Ist ein neuer Stein erschienen, passt der Plan nicht mehr: beim nächsten Zug neu planen
+        if engine.aktuelles_tetromino is tetromino:
+            self.erwartet = self._zustand(tetromino)
+        else:
+            self.erwartet = None
+        return ergebnis
+
+    @staticmethod
+    def _zustand(tetromino):
+        """Stein und Position, an denen der aktuelle Plan ausgerichtet ist"""
+        if tetromino is None:
+            return None
+        return (tetromino, tetromino.x, tetromino.y, tetromino.aktuelle_rotation)
@@ -0,0 +1,234 @@
+"""
+Vektorisierter Simulator, der viele unabhängige Tetris-Spiele im Gleichschritt mit NumPy berechnet
+"""
+
+import numpy as np
+from config import (
+    SPALTEN, ZEILEN, ANFANGS_FALLZEIT, LEVEL_GESCHWINDIGKEIT,
+    PUNKTE_EINE_REIHE, PUNKTE_ZWEI_REIHEN, PUNKTE_DREI_REIHEN, PUNKTE_VIER_REIHEN
+)
+from formen import FORM_TABELLEN
+
+# Aktionscodes für BatchSimulator.step()
+KEINE = 0
+LINKS = 1
+RECHTS = 2
+RUNTER = 3
+DREHEN = 4
+HARD_DROP = 5
+
+# Startposition neuer Tetrominos (wie TetrisEngine.neues_tetromino)
+START_X = SPALTEN // 2 - 2
+START_Y = 0
+
+# Verschiebungen beim Drehen am Rand, in derselben Reihenfolge wie TetrisEngine.tetromino_rotieren
+DREH_VERSCHIEBUNGEN = (0, 1, -1, 2, -2)
+
+# Punkte nach Anzahl gleichzeitig entfernter Reihen (mehr als vier gibt wie in der Engine keine Punkte)
+PUNKTE_TABELLE = np.zeros(ZEILEN + 1, dtype=np.int64)
+PUNKTE_TABELLE[1:5] = (PUNKTE_EINE_REIHE, PUNKTE_ZWEI_REIHEN, PUNKTE_DREI_REIHEN, PUNKTE_VIER_REIHEN)
+
+# Anzahl der Rotationen je Form und Zell-Offsets als Array (form, rotation, block, [spalte, zeile]);
+# Formen mit weniger als vier Rotationen wiederholen ihre Rotationen zyklisch
+ANZAHL_FORMEN = len(FORM_TABELLEN)
+ROTATIONEN = np.array([len(rotationen) for rotationen in FORM_TABELLEN], dtype=np.int8)
+FORM_ZELLEN = np.array(
+    [[rotationen[r % len(rotationen)].zellen for r in range(4)] for rotationen in FORM_TABELLEN],
+    dtype=np.int16
+)
+
+
+class BatchSimulator:
+    """Simuliert N Spiele gleichzeitig; alle Spielfelder liegen in einem (N, ZEILEN, SPALTEN)-Array
+
+    Die Regeln entsprechen TetrisEngine (Kollision, Drehen mit Randverschiebung, Hard Drop,
+    Reihen entfernen, Punkte und Level). Gimmick-Blöcke werden nicht simuliert, das entspricht
+    SPEZIAL_CHANCE = 0. Zeit wird ebenfalls nicht simuliert: schwerkraft() ist ein Fall-Schritt.
+    """
+
+    def __init__(self, anzahl, seed=None):
+        """Legt anzahl Spiele an; seed macht die Formenfolge reproduzierbar"""
+        self.anzahl = anzahl
+        self.rng = np.random.default_rng(seed)
+
+        # Spielfelder (0 = leer, 1-7 = Tetromino-Farbe wie TetrisEngine.spielfeld)
+        self.spielfelder = np.zeros((anzahl, ZEILEN, SPALTEN), dtype=np.uint8)
+
+        # Aktive und nächste Tetrominos
+        self.form = np.zeros(anzahl, dtype=np.int16)
+        self.rotation = np.zeros(anzahl, dtype=np.int16)
+        self.x = np.zeros(anzahl, dtype=np.int16)
+        self.y = np.zeros(anzahl, dtype=np.int16)
+        self.naechste_form = np.zeros(anzahl, dtype=np.int16)
+
+        # Spielwerte
+        self.score = np.zeros(anzahl, dtype=np.int64)
+        self.linien = np.zeros(anzahl, dtype=np.int64)
+        self.level = np.ones(anzahl, dtype=np.int64)
+        self.steine = np.zeros(anzahl, dtype=np.int64)
+        self.aktiv = np.ones(anzahl, dtype=bool)
+
+        self.neustart()
+
+    def neustart(self, auswahl=None):
+        """Startet die ausgewählten Spiele (Standard: alle) neu"""
+        idx = self._indizes(auswahl)
+        self.spielfelder[idx] = 0
+        self.score[idx] = 0
+        self.linien[idx] = 0
+        self.level[idx] = 1
+        self.steine[idx] = 0
+        self.aktiv[idx] = True
+        self.form[idx] = self._neue_formen(len(idx))
+        self.naechste_form[idx] = self._neue_formen(len(idx))
+        self.rotation[idx] = 0
+        self.x[idx] = START_X
+        self.y[idx] = START_Y
+
+    @property
+    def fallzeit(self):
+        """Fallzeit je Spiel in Sekunden (wie TetrisEngine.fallzeit)"""
+        return np.maximum(0.05, ANFANGS_FALLZEIT - (self.level - 1) * LEVEL_GESCHWINDIGKEIT)
+
+    def step(self, aktionen):
+        """Führt pro Spiel eine Aktion (KEINE, LINKS, RECHTS, RUNTER, DREHEN, HARD_DROP) aus"""
+        aktionen = np.broadcast_to(np.asarray(aktionen), (self.anzahl,))
+        aktiv = self.aktiv
+
+        self._verschieben(np.flatnonzero(aktiv & (aktionen == LINKS)), -1, 0)
+        self._verschieben(np.flatnonzero(aktiv & (aktionen == RECHTS)), 1, 0)
+        self._verschieben(np.flatnonzero(aktiv & (aktionen == RUNTER)), 0, 1)
+        self._drehen(np.flatnonzero(aktiv & (aktionen == DREHEN)))
+        self._hard_drop(np.flatnonzero(aktiv & (aktionen == HARD_DROP)))
+
+    def schwerkraft(self):
+        """Lässt alle laufenden Spiele einen Fall-Schritt machen"""
+        self._verschieben(np.flatnonzero(self.aktiv), 0, 1)
+
+    def _indizes(self, auswahl):
+        """Wandelt eine Auswahl (None, Bool-Maske oder Indizes) in ein Index-Array um"""
+        if auswahl is None:
+            return np.arange(self.anzahl)
+        auswahl = np.asarray(auswahl)
+        if auswahl.dtype == bool:
+            return np.flatnonzero(auswahl)
+        return auswahl
+
+    def _neue_formen(self, anzahl):
+        """Zieht anzahl zufällige Formen"""
+        return self.rng.integers(0, ANZAHL_FORMEN, size=anzahl)
+
+    def _zellen(self, form, rotation, x, y):
+        """Gibt die absoluten Spalten und Zeilen (M, 4) der Tetrominos zurück"""
+        offsets = FORM_ZELLEN[form, rotation]
+        return offsets[:, :, 0] + x[:, None], offsets[:, :, 1] + y[:, None]
+
+    def _kollision(self, idx, form, rotation, x, y):
+        """Vektorisierte Entsprechung zu TetrisEngine.kollision_pruefen"""
+        spalten, zeilen = self._zellen(form, rotation, x, y)
+        ausserhalb = (spalten < 0) | (spalten >= SPALTEN) | (zeilen >= ZEILEN)
+        belegt = self.spielfelder[idx[:, None],
+                                  np.clip(zeilen, 0, ZEILEN - 1),
+                                  np.clip(spalten, 0, SPALTEN - 1)] != 0
+        return (ausserhalb | ((zeilen >= 0) & belegt)).any(axis=1)
+
+    def _verschieben(self, idx, dx, dy):
+        """Bewegt die Tetrominos wenn möglich; blockierte Abwärtsbewegungen fixieren sie"""
+        if len(idx) == 0:
+            return
+        kollision = self._kollision(idx, self.form[idx], self.rotation[idx],
+                                    self.x[idx] + dx, self.y[idx] + dy)
+        frei = idx[~kollision]
+        self.x[frei] += dx
+        self.y[frei] += dy
+        if dy > 0:
+            self._fixieren(idx[kollision])
+
+    def _drehen(self, idx):
+        """Dreht die Tetrominos im Uhrzeigersinn, notfalls mit Verschiebung nach links/rechts"""
+        if len(idx) == 0:
+            return
+        form = self.form[idx]
+        neue_rotation = (self.rotation[idx] + 1) % ROTATIONEN[form]
+        offen = np.ones(len(idx), dtype=bool)
+        for dx in DREH_VERSCHIEBUNGEN:
+            kandidaten = np.flatnonzero(offen)
+            if len(kandidaten) == 0:
+                break
+            ziel = idx[kandidaten]
+            kollision = self._kollision(ziel, form[kandidaten], neue_rotation[kandidaten],
+                                        self.x[ziel] + dx, self.y[ziel])
+            gueltig = kandidaten[~kollision]
+            self.rotation[idx[gueltig]] = neue_rotation[gueltig]
+            self.x[idx[gueltig]] += dx
+            offen[gueltig] = False
+
+    def _hard_drop(self, idx):
+        """Lässt die Tetrominos sofort fallen und fixiert sie (ohne Wirkung am Boden)"""
+        if len(idx) == 0:
+            return
+        form, rotation, x, y = self.form[idx], self.rotation[idx], self.x[idx], self.y[idx]
+        drops = np.zeros(len(idx), dtype=np.int16)
+        fallend = np.ones(len(idx), dtype=bool)
+        for _ in range(ZEILEN):
+            kandidaten = np.flatnonzero(fallend)
+            if len(kandidaten) == 0:
+                break
+            kollision = self._kollision(idx[kandidaten], form[kandidaten], rotation[kandidaten],
+                                        x[kandidaten], y[kandidaten] + drops[kandidaten] + 1)
+            drops[kandidaten[~kollision]] += 1
+            fallend[kandidaten[kollision]] = False
+
+        bewegt = drops > 0
+        self.y[idx[bewegt]] += drops[bewegt]
+        self._fixieren(idx[bewegt])
+
+    def _fixieren(self, idx):
+        """Schreibt die Tetrominos ins Spielfeld, entfernt volle Reihen und holt neue Steine"""
+        if len(idx) == 0:
+            return
+        spalten, zeilen = self._zellen(self.form[idx], self.rotation[idx], self.x[idx], self.y[idx])
+
+        # Spielende, wenn ein Block oberhalb des Spielfelds liegt
+        oben_raus = (zeilen < 0).any(axis=1)
+        self.aktiv[idx[oben_raus]] = False
+        idx, spalten, zeilen = idx[~oben_raus], spalten[~oben_raus], zeilen[~oben_raus]
+        if len(idx) == 0:
+            return
+
+        self.spielfelder[idx[:, None], zeilen, spalten] = (self.form[idx] + 1)[:, None]
+        self.steine[idx] += 1
+        self._reihen_entfernen(idx)
+
+        # Nächstes Tetromino vorbereiten
+        self.form[idx] = self.naechste_form[idx]
+        self.naechste_form[idx] = self._neue_formen(len(idx))
+        self.rotation[idx] = 0
+        self.x[idx] = START_X
+        self.y[idx] = START_Y
+
+        # Spielende, wenn das neue Tetromino schon beim Erscheinen blockiert ist
+        blockiert = self._kollision(idx, self.form[idx], self.rotation[idx], self.x[idx], self.y[idx])
+        self.aktiv[idx[blockiert]] = False
+
+    def _reihen_entfernen(self, idx):
+        """Entfernt volle Reihen per stabiler Sortierung und vergibt Punkte und Level"""
+        felder = self.spielfelder[idx]
+        voll = (felder != 0).all(axis=2)
+        anzahl = voll.sum(axis=1)
+        betroffen = anzahl > 0
+        if not betroffen.any():
+            return
+
+        idx, felder, voll, anzahl = idx[betroffen], felder[betroffen], voll[betroffen], anzahl[betroffen]
+
+        # Volle Reihen nach oben sortieren (Reihenfolge der übrigen bleibt erhalten) und leeren
+        reihenfolge = np.argsort(~voll, axis=1, kind="stable")
+        felder = np.take_along_axis(felder, reihenfolge[:, :, None], axis=1)
+        felder[np.arange(ZEILEN)[None, :] < anzahl[:, None]] = 0
+        self.spielfelder[idx] = felder
+
+        # Punkte mit dem Level vor dem Entfernen, danach Linien und Level aktualisieren
+        self.score[idx] += PUNKTE_TABELLE[anzahl] * self.level[idx]
+        self.linien[idx] += anzahl
+        self.level[idx] = np.maximum(self.level[idx], self.linien[idx] // 10 + 1)
@@ -0,0 +1,345 @@
+"""
+Mikro-Benchmarks für die heißen Pfade von Engine und Darstellung
+
+Misst Kollision, Rotation, Fixieren, Reihen entfernen, Platzierungssuche, Partikel und das
+Zeichnen auf gesetzten Spielfeldern (leer, halb voll, fast voll mit vielen Gimmicks).
+Gezeichnet wird mit dem SDL-Dummy-Treiber, also ohne Fenster.
+
+Beispiel:
+    python benchmark.py --ausgabe basis.json
+    python benchmark.py --vergleich basis.json --toleranz 0.15
+"""
+
+import os
+
+# Darstellung ohne Fenster (muss vor dem Import von pygame gesetzt sein)
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import copy
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import pygame
+from config import BREITE, HOEHE, SPALTEN, ZEILEN, FARBEN, SPEZIAL_FARBEN, MAX_PARTIKEL
+from engine import TetrisEngine
+
+# Spielfelder: name -> (gefüllte Reihen von unten, Anteil der Gimmick-Zellen)
+BRETTER = {
+    "leer": (0, 0.0),
+    "halb": (10, 0.05),
+    "fast_voll": (17, 0.4),
+}
+
+# Anzahl Messrunden; berichtet werden Median und Minimum der Zeit pro Aufruf
+RUNDEN = 7
+
+# Regressionsgrenze beim Vergleich: so viel langsamer darf der Median werden
+TOLERANZ = 0.10
+
+# Registrierte Benchmarks: name -> (funktion(brett, seed) -> (aufruf, vorbereiten), mit_brettern, aufrufe)
+BENCHMARKS = {}
+
+
+def benchmark(name, aufrufe, mit_brettern=True):
+    """Registriert einen Benchmark; mit_brettern=False misst ihn nur einmal statt je Spielfeld"""
+    def registrieren(funktion):
+        BENCHMARKS[name] = (funktion, mit_brettern, aufrufe)
+        return funktion
+    return registrieren
+
+
+def brett_erstellen(name, seed, stein_klasse=None):
+    """Erstellt eine Engine mit gesetztem Spielfeld; jede gefüllte Reihe behält eine Lücke"""
+    rng = random.Random(seed)  # Belegung des Spielfelds
+    # Der seed der Engine bestimmt Formen und Gimmicks der Tetrominos
+    engine = TetrisEngine(stein_klasse=stein_klasse, seed=seed) if stein_klasse else TetrisEngine(seed=seed)
+
+    reihen, gimmick_anteil = BRETTER[name]
+    for y in range(ZEILEN - reihen, ZEILEN):
+        luecke = rng.randrange(SPALTEN)
+        for x in range(SPALTEN):
+            if x != luecke:
+                zelle_setzen(engine, x, y, rng, gimmick_anteil)
+    return engine
+
+
+def zelle_setzen(engine, x, y, rng, gimmick_anteil=0.0):
+    """Belegt eine Zelle mit zufälliger Farbe, mit der Wahrscheinlichkeit gimmick_anteil als Gimmick"""
+    form_idx = rng.randrange(len(FARBEN))
+    if rng.random() < gimmick_anteil:
+        gimmick = rng.randrange(len(SPEZIAL_FARBEN))
+        farbe = SPEZIAL_FARBEN[gimmick]
+    else:
+        gimmick = -1
+        farbe = FARBEN[form_idx]
+    engine.spielfeld.setzen(x, y, form_idx + 1)
+    engine.spielfeld_farben[y][x] = farbe
+    engine.spielfeld_gimmicks[y][x] = gimmick
+
+
+def messen(aufruf, vorbereiten=None, aufrufe=1000, runden=RUNDEN):
+    """Gibt die Zeit pro Aufruf je Runde in Sekunden zurück
+
+    Mit vorbereiten wird vor jedem Aufruf ein frischer Zustand hergestellt; gemessen wird dann
+    jeder Aufruf einzeln, damit die Vorbereitung nicht in die Zeit eingeht.
+    """
+    uhr = time.perf_counter
+    zeiten = []
+    for _ in range(runden):
+        if vorbereiten is None:
+            start = uhr()
+            for _ in range(aufrufe):
+                aufruf()
+            dauer = uhr() - start
+        else:
+            dauer = 0.0
+            for _ in range(aufrufe):
+                vorbereiten()
+                start = uhr()
+                aufruf()
+                dauer += uhr() - start
+        zeiten.append(dauer / aufrufe)
+    return zeiten
+
+
+# --- Engine ---
+
+@benchmark("kollision_pruefen", aufrufe=20000)
+def _kollision(brett, seed):
+    """Kollisionstest des Tetrominos direkt über seiner Landeposition"""
+    engine = brett_erstellen(brett, seed)
+    tetromino = engine.aktuelles_tetromino
+    tetromino.y += engine.fall_distanz()
+    return lambda: engine.kollision_pruefen(0, 1, tetromino), None
+
+
+@benchmark("tetromino_rotieren", aufrufe=20000)
+def _rotieren(brett, seed):
+    """Drehung an der Landeposition (mit Wandverschiebung, wenn nötig)"""
+    engine = brett_erstellen(brett, seed)
+    engine.aktuelles_tetromino.y += engine.fall_distanz()
+    return engine.tetromino_rotieren, None
+
+
+@benchmark("tetromino_fixieren", aufrufe=300)
+def _fixieren(brett, seed):
+    """Fixieren an der Landeposition inklusive Reihenprüfung und neuem Tetromino"""
+    vorlage = brett_erstellen(brett, seed)
+    vorlage.aktuelles_tetromino.y += vorlage.fall_distanz()
+    zustand = {}
+
+    def vorbereiten():
+        zustand["engine"] = copy.deepcopy(vorlage)
+
+    return lambda: zustand["engine"].tetromino_fixieren(), vorbereiten
+
+
+@benchmark("reihen_entfernen", aufrufe=300)
+def _reihen_entfernen(brett, seed):
+    """Entfernen der zwei untersten Reihen (Lücken vorher geschlossen, Gimmicks lösen aus)"""
+    vorlage = brett_erstellen(brett, seed)
+    rng = random.Random(seed)
+    gimmick_anteil = BRETTER[brett][1]
+    for y in (ZEILEN - 2, ZEILEN - 1):
+        for x in range(SPALTEN):
+            if not vorlage.spielfeld.belegt(x, y):
+                zelle_setzen(vorlage, x, y, rng, gimmick_anteil)
+    zustand = {}
+
+    def vorbereiten():
+        zustand["engine"] = copy.deepcopy(vorlage)
+
+    return lambda: zustand["engine"].reihen_entfernen(), vorbereiten
+
+
+@benchmark("platzierungen", aufrufe=500)
+def _platzierungen(brett, seed):
+    """Alle erreichbaren Endpositionen des aktuellen Tetrominos mit Eingabepfad"""
+    from platzierungen import platzierungen_fuer
+    engine = brett_erstellen(brett, seed)
+    return lambda: platzierungen_fuer(engine), None
+
+
+# --- Partikel und Darstellung ---
+
+_anzeige = None
+
+
+def anzeige():
+    """Initialisiert pygame mit dem Dummy-Treiber und gibt die Zeichenfläche zurück"""
+    global _anzeige
+    if _anzeige is None:
+        from sprites import ATLAS
+        pygame.init()
+        _anzeige = pygame.display.set_mode((BREITE, HOEHE))
+        ATLAS.erstellen()
+    return _anzeige
+
+
+def spiel_erstellen(brett, seed):
+    """Erstellt ein TetrisSpiel, dessen Engine auf dem angegebenen Spielfeld steht"""
+    anzeige()
+    from game import TetrisSpiel
+    from tetromino import Tetromino
+    spiel = TetrisSpiel()
+    spiel.engine = brett_erstellen(brett, seed, stein_klasse=Tetromino)
+    return spiel
+
+
+@benchmark("partikel_bewegen", aufrufe=2000, mit_brettern=False)
+def _partikel_bewegen(brett, seed):
+    """Bewegen eines vollen Partikel-Pools (ersetzt das frühere partikel_aktualisieren)"""
+    from partikel import PartikelPool
+    pool = PartikelPool(MAX_PARTIKEL, seed=seed, auto_qualitaet=False)
+
+    def vorbereiten():
+        # Abgelaufene Partikel nachfüllen, damit der Pool annähernd voll bleibt
+        while len(pool) < MAX_PARTIKEL * 3 // 4:
+            pool.erstellen(BREITE // 2, HOEHE // 2, FARBEN[len(pool) % len(FARBEN)], 20)
+
+    return pool.bewegen, vorbereiten
+
+
+@benchmark("partikel_zeichnen", aufrufe=500, mit_brettern=False)
+def _partikel_zeichnen(brett, seed):
+    """Zeichnen eines vollen Partikel-Pools"""
+    from partikel import PartikelPool
+    screen = anzeige()
+    pool = PartikelPool(MAX_PARTIKEL, seed=seed, auto_qualitaet=False)
+    while len(pool) < MAX_PARTIKEL:
+        pool.erstellen(BREITE // 2, HOEHE // 2, FARBEN[len(pool) % len(FARBEN)], 20)
+    return lambda: pool.zeichnen(screen), None
+
+
+@benchmark("spielfeld_zeichnen", aufrufe=200)
+def _spielfeld_zeichnen(brett, seed):
+    """Vollständiges Zeichnen von Spielfeld, Geist, Tetromino und Vorschau"""
+    spiel = spiel_erstellen(brett, seed)
+    screen = anzeige()
+    return lambda: spiel.spielfeld_zeichnen(screen), None
+
+
+@benchmark("renderer_frame", aufrufe=1000)
+def _renderer_frame(brett, seed):
+    """Inkrementelles Zeichnen eines Frames nach einer Bewegung des Tetrominos (wie im Spiel)"""
+    from renderer import SpielRenderer
+    spiel = spiel_erstellen(brett, seed)
+    screen = anzeige()
+    renderer = SpielRenderer(spiel)
+
+    def frame():
+        renderer.spielfeld_zeichnen(screen)
+        renderer.ui_zeichnen(screen)
+
+    frame()
+    richtung = [1]
+
+    def vorbereiten():
+        if not spiel.engine.tetromino_bewegen(richtung[0], 0):
+            richtung[0] = -richtung[0]
+            spiel.engine.tetromino_bewegen(richtung[0], 0)
+        renderer.rechtecke_abholen()
+
+    return frame, vorbereiten
+
+
+@benchmark("zeichne_ui", aufrufe=1000)
+def _zeichne_ui(brett, seed):
+    """Infobereich und Overlays mit wechselndem Punktestand"""
+    spiel = spiel_erstellen(brett, seed)
+    screen = anzeige()
+
+    def vorbereiten():
+        spiel.engine.score += 10
+
+    return lambda: spiel.zeichne_ui(screen), vorbereiten
+
+
+def ausfuehren(namen=None, seed=0, runden=RUNDEN, faktor=1.0):
+    """Führt die Benchmarks aus und gibt {"name/brett": {median_us, min_us, aufrufe}} zurück"""
+    ergebnisse = {}
+    for name, (funktion, mit_brettern, aufrufe) in BENCHMARKS.items():
+        if namen and name not in namen:
+            continue
+        aufrufe = max(1, int(aufrufe * faktor))
+        for brett in (BRETTER if mit_brettern else (None,)):
+            aufruf, vorbereiten = funktion(brett or "leer", seed)
+            zeiten = messen(aufruf, vorbereiten, aufrufe, runden)
+            schluessel = f"{name}/{brett}" if brett else name
+            ergebnisse[schluessel] = {
+                "median_us": statistics.median(zeiten) * 1e6,
+                "min_us": min(zeiten) * 1e6,
+                "aufrufe": aufrufe,
+            }
+            print(f"{schluessel:<32} {ergebnisse[schluessel]['median_us']:10.2f} µs", file=sys.stderr)
+    return ergebnisse
+
+
+def vergleichen(ergebnisse, basis, toleranz=TOLERANZ):
+    """Vergleicht die Mediane mit einer gespeicherten Basis; gibt (name, alt, neu, faktor, regression) zurück"""
+    vergleich = []
+    for name, wert in ergebnisse.items():
+        alt = basis.get(name)
+        if alt is None:
+            continue
+        faktor = wert["median_us"] / alt["median_us"] if alt["median_us"] else float("inf")
+        vergleich.append((name, alt["median_us"], wert["median_us"], faktor, faktor > 1 + toleranz))
+    return vergleich
+
+
+def main():
+    """Kommandozeilen-Einstieg für die Benchmarks"""
+    parser = argparse.ArgumentParser(description="Mikro-Benchmarks für Engine und Darstellung")
+    parser.add_argument("--nur", action="append", choices=sorted(BENCHMARKS),
+                        help="Nur diesen Benchmark ausführen (mehrfach möglich)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed für Spielfelder und Tetrominos")
+    parser.add_argument("--runden", type=int, default=RUNDEN, help="Messrunden je Benchmark")
+    parser.add_argument("--faktor", type=float, default=1.0, help="Aufrufe je Runde skalieren (z.B. 0.1 für einen Schnelltest)")
+    parser.add_argument("--ausgabe", metavar="DATEI", help="Ergebnisse als JSON in diese Datei schreiben")
+    parser.add_argument("--vergleich", metavar="DATEI", help="Mit einer gespeicherten JSON-Basis vergleichen")
+    parser.add_argument("--toleranz", type=float, default=TOLERANZ,
+                        help="Erlaubte Verlangsamung des Medians (0.1 = 10%%)")
+    args = parser.parse_args()
+
+    ergebnisse = ausfuehren(args.nur, args.seed, args.runden, args.faktor)
+    bericht = {
+        "zeitpunkt": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "plattform": platform.platform(),
+        "seed": args.seed,
+        "runden": args.runden,
+        "ergebnisse": ergebnisse,
+    }
+
+    if args.ausgabe:
+        with open(args.ausgabe, "w") as datei:
+            json.dump(bericht, datei, indent=2)
+    else:
+        print(json.dumps(bericht, indent=2))
+
+    if args.vergleich:
+        try:
+            with open(args.vergleich) as datei:
+                basis = json.load(datei)["ergebnisse"]
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Fehler beim Laden der Basis {args.vergleich}: {e}", file=sys.stderr)
+            sys.exit(2)
+
+        regressionen = 0
+        for name, alt, neu, faktor, regression in vergleichen(ergebnisse, basis, args.toleranz):
+            markierung = "  REGRESSION" if regression else ""
+            print(f"{name:<32} {alt:10.2f} -> {neu:10.2f} µs  x{faktor:.2f}{markierung}", file=sys.stderr)
+            regressionen += regression
+        if regressionen:
+            print(f"{regressionen} Regression(en) über {args.toleranz:.0%}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
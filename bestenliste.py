@@ -0,0 +1,271 @@
+"""
+Bestenliste: Ergebnisse und Statistiken aller beendeten Spiele in einer lokalen SQLite-Datenbank
+
+Geschrieben wird in einem eigenen Thread mit eigener Verbindung: eintragen() reiht das Ergebnis
+nur ein, ein Game Over kostet in der Spielschleife also keine Festplattenzugriffe. Der Thread
+fasst alles Wartende zu einer Transaktion zusammen, damit auch die vielen Ergebnisse aus
+turnier.py zügig landen.
+
+Abfragen laden nie die ganze Historie:
+    - beste(n) und beste(n, spieler) laufen über die Indizes auf (score) und (spieler, score)
+      und lesen nur n Zeilen, egal wie viele Millionen Spiele gespeichert sind.
+    - Bestwerte und Summen je Spieler hält die Tabelle spieler; ein Trigger schreibt sie bei
+      jedem neuen Spiel fort, statt sie bei der Abfrage über alle Spiele zu berechnen.
+
+Beispiel:
+    python bestenliste.py --top 20
+    python bestenliste.py --spieler Autoplay
+    python bestenliste.py --spielerliste
+"""
+
+import argparse
+import getpass
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from config import BESTENLISTE_DATEI, BESTENLISTE_WARTESCHLANGE, BESTENLISTE_STAPEL
+from zeitschritt import TICK_DAUER
+
+# eintragen(warten=True) prüft in diesem Abstand (Sekunden), ob der Schreib-Thread noch läuft
+PRUEF_INTERVALL = 0.5
+
+# Namen der Gimmick-Typen (Index wie spezial_typ), zugleich Spaltennamen
+GIMMICK_NAMEN = ("zeitlupe", "zeitraffer", "explosion", "gravitation")
+
+# Spielername für Spiele des Autoplayers
+AUTOPLAY_SPIELER = "Autoplay"
+
+Eintrag = namedtuple("Eintrag", ["spieler", "score", "level", "linien", "steine", "dauer", "gimmicks",
+                                 "seed", "zeitpunkt"])
+Spielerwerte = namedtuple("Spielerwerte", ["spieler", "spiele", "beste_score", "beste_linien",
+                                           "summe_score", "summe_linien", "summe_dauer"])
+
+_SPIEL_SPALTEN = "spieler, score, level, linien, steine, dauer, " + ", ".join(GIMMICK_NAMEN) + ", seed, zeitpunkt"
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS spiele (
+    id INTEGER PRIMARY KEY,
+    spieler TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    linien INTEGER NOT NULL,
+    steine INTEGER NOT NULL,
+    dauer REAL NOT NULL,
+    {", ".join(f"{name} INTEGER NOT NULL" for name in GIMMICK_NAMEN)},
+    seed INTEGER,
+    zeitpunkt REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS spiele_score ON spiele (score DESC);
+CREATE INDEX IF NOT EXISTS spiele_spieler_score ON spiele (spieler, score DESC);
+
+CREATE TABLE IF NOT EXISTS spieler (
+    name TEXT PRIMARY KEY,
+    spiele INTEGER NOT NULL,
+    beste_score INTEGER NOT NULL,
+    beste_linien INTEGER NOT NULL,
+    summe_score INTEGER NOT NULL,
+    summe_linien INTEGER NOT NULL,
+    summe_dauer REAL NOT NULL
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS spieler_fortschreiben AFTER INSERT ON spiele
+BEGIN
+    INSERT INTO spieler VALUES (NEW.spieler, 1, NEW.score, NEW.linien, NEW.score, NEW.linien, NEW.dauer)
+    ON CONFLICT (name) DO UPDATE SET
+        spiele = spiele + 1,
+        beste_score = max(beste_score, NEW.score),
+        beste_linien = max(beste_linien, NEW.linien),
+        summe_score = summe_score + NEW.score,
+        summe_linien = summe_linien + NEW.linien,
+        summe_dauer = summe_dauer + NEW.dauer;
+END;
+"""
+
+_EINFUEGEN = f"INSERT INTO spiele ({_SPIEL_SPALTEN}) VALUES ({', '.join('?' * (len(GIMMICK_NAMEN) + 8))})"
+
+# Markiert in der Warteschlange das Ende des Schreib-Threads
+_ENDE = None
+
+
+def standard_spieler():
+    """Name des angemeldeten Benutzers als Spielername"""
+    try:
+        return getpass.getuser()
+    except Exception:
+        return "Spieler"
+
+
+def eintrag_erstellen(engine, spieler, zeitpunkt=None):
+    """Fasst das Ergebnis einer Engine als Eintrag zusammen (Dauer in Spielzeit, ohne Pausen)"""
+    return Eintrag(spieler, engine.score, engine.level, engine.linien, engine.steine,
+                   engine.ticks * TICK_DAUER, tuple(engine.gimmick_zaehler), engine.seed,
+                   time.time() if zeitpunkt is None else zeitpunkt)
+
+
+def _zeile(eintrag):
+    """Eintrag als Parameter für _EINFUEGEN"""
+    return (eintrag.spieler, eintrag.score, eintrag.level, eintrag.linien, eintrag.steine, eintrag.dauer,
+            *eintrag.gimmicks, eintrag.seed, eintrag.zeitpunkt)
+
+
+def _eintrag(zeile):
+    """Zeile aus spiele (in der Reihenfolge von _SPIEL_SPALTEN) als Eintrag"""
+    anzahl = len(GIMMICK_NAMEN)
+    return Eintrag(*zeile[:6], tuple(zeile[6:6 + anzahl]), *zeile[6 + anzahl:])
+
+
+def verbinden(pfad):
+    """Öffnet die Datenbank und legt fehlende Tabellen an
+
+    WAL erlaubt Lesen, während der Schreib-Thread schreibt; synchronous=NORMAL spart im
+    WAL-Modus das fsync pro Transaktion (ein Absturz kann nur die letzten Spiele kosten).
+    """
+    os.makedirs(os.path.dirname(pfad) or ".", exist_ok=True)
+    verbindung = sqlite3.connect(pfad)
+    verbindung.execute("PRAGMA journal_mode=WAL")
+    verbindung.execute("PRAGMA synchronous=NORMAL")
+    verbindung.executescript(SCHEMA)
+    return verbindung
+
+
+class Bestenliste:
+    """Speichert Ergebnisse über einen Schreib-Thread und beantwortet Abfragen über eine eigene Verbindung"""
+
+    def __init__(self, pfad=BESTENLISTE_DATEI, warteschlange=BESTENLISTE_WARTESCHLANGE,
+                 stapel=BESTENLISTE_STAPEL):
+        self.pfad = pfad
+        self.warteschlange = queue.Queue(maxsize=warteschlange)
+        self.stapel = stapel
+        self.verworfen = 0  # Ergebnisse, die wegen voller Warteschlange verloren gingen
+        self.geschrieben = 0
+        self._lesen = None
+        self._thread = None
+
+    def oeffnen(self):
+        """Öffnet die Datenbank nur zum Abfragen; gibt False zurück, wenn das nicht geht"""
+        try:
+            self._lesen = verbinden(self.pfad)
+        except (sqlite3.Error, OSError) as e:
+            print(f"Bestenliste konnte nicht geöffnet werden ({self.pfad}): {e}")
+            return False
+        return True
+
+    def starten(self):
+        """Öffnet die Datenbank und startet den Schreib-Thread; gibt False zurück, wenn das nicht geht"""
+        if not self.oeffnen():
+            return False
+        self._thread = threading.Thread(target=self._schreiben_schleife, name="bestenliste", daemon=True)
+        self._thread.start()
+        return True
+
+    def beenden(self):
+        """Schreibt alles Wartende, stoppt den Schreib-Thread und schließt die Datenbank"""
+        if self._thread is not None:
+            if self._thread.is_alive():
+                self.warteschlange.put(_ENDE)
+                self._thread.join()
+            self._thread = None
+        if self._lesen is not None:
+            self._lesen.close()
+            self._lesen = None
+
+    def eintragen(self, eintrag, warten=False):
+        """Reiht ein Ergebnis zum Schreiben ein; blockiert nur mit warten=True (z.B. in turnier.py)
+
+        Ohne warten wird bei voller Warteschlange verworfen, statt die Spielschleife aufzuhalten.
+        Läuft der Schreib-Thread nicht mehr (z.B. weil er die Datenbank nicht öffnen konnte),
+        wird ebenfalls verworfen; mit warten würde die volle Warteschlange sonst ewig blockieren.
+        """
+        if self._thread is None:
+            return False
+        while self._thread.is_alive():
+            try:
+                self.warteschlange.put(eintrag, block=warten, timeout=PRUEF_INTERVALL if warten else None)
+                return True
+            except queue.Full:
+                if not warten:
+                    break
+        self.verworfen += 1
+        return False
+
+    def _schreiben_schleife(self):
+        """Schreib-Thread: sammelt wartende Ergebnisse und schreibt sie in einer Transaktion"""
+        try:
+            verbindung = verbinden(self.pfad)
+        except (sqlite3.Error, OSError) as e:
+            print(f"Bestenliste konnte nicht geöffnet werden ({self.pfad}): {e}")
+            return
+        laeuft = True
+        while laeuft:
+            eintraege = [self.warteschlange.get()]
+            while len(eintraege) < self.stapel:
+                try:
+                    eintraege.append(self.warteschlange.get_nowait())
+                except queue.Empty:
+                    break
+            if _ENDE in eintraege:
+                laeuft = False
+                eintraege = [eintrag for eintrag in eintraege if eintrag is not _ENDE]
+            if not eintraege:
+                continue
+            try:
+                with verbindung:
+                    verbindung.executemany(_EINFUEGEN, [_zeile(eintrag) for eintrag in eintraege])
+                self.geschrieben += len(eintraege)
+            except sqlite3.Error as e:
+                print(f"Fehler beim Schreiben der Bestenliste: {e}")
+        verbindung.close()
+
+    def beste(self, n=10, spieler=None):
+        """Die n besten Spiele, insgesamt oder eines Spielers (nur über den Index, ohne die Historie zu laden)"""
+        if spieler is None:
+            zeilen = self._lesen.execute(
+                f"SELECT {_SPIEL_SPALTEN} FROM spiele ORDER BY score DESC LIMIT ?", (n,))
+        else:
+            zeilen = self._lesen.execute(
+                f"SELECT {_SPIEL_SPALTEN} FROM spiele WHERE spieler = ? ORDER BY score DESC LIMIT ?",
+                (spieler, n))
+        return [_eintrag(zeile) for zeile in zeilen]
+
+    def spielerwerte(self, spieler=None):
+        """Bestwerte und Summen aller Spieler (nach bestem Score) oder eines Spielers (None, wenn unbekannt)"""
+        if spieler is None:
+            zeilen = self._lesen.execute("SELECT * FROM spieler ORDER BY beste_score DESC")
+            return [Spielerwerte(*zeile) for zeile in zeilen]
+        zeile = self._lesen.execute("SELECT * FROM spieler WHERE name = ?", (spieler,)).fetchone()
+        return Spielerwerte(*zeile) if zeile else None
+
+
+def main():
+    """Kommandozeilen-Einstieg: zeigt Bestenliste und Spielerstatistiken"""
+    parser = argparse.ArgumentParser(description="Tetris-Bestenliste anzeigen")
+    parser.add_argument("--datei", default=BESTENLISTE_DATEI, help="Datenbank der Bestenliste")
+    parser.add_argument("--top", type=int, default=10, help="Anzahl der angezeigten Spiele")
+    parser.add_argument("--spieler", help="Nur Spiele dieses Spielers")
+    parser.add_argument("--spielerliste", action="store_true", help="Bestwerte und Summen je Spieler")
+    args = parser.parse_args()
+
+    liste = Bestenliste(args.datei)
+    if not liste.oeffnen():
+        return 1
+
+    if args.spielerliste:
+        print(f"{'Spieler':<20} {'Spiele':>8} {'Bester':>10} {'Linien':>7} {'Mittel':>10}")
+        for werte in liste.spielerwerte():
+            print(f"{werte.spieler:<20} {werte.spiele:>8} {werte.beste_score:>10} {werte.beste_linien:>7} "
+                  f"{werte.summe_score / werte.spiele:>10.0f}")
+    else:
+        print(f"{'#':>3} {'Spieler':<20} {'Score':>10} {'Level':>5} {'Linien':>7} {'Dauer':>8} Gimmicks")
+        for platz, eintrag in enumerate(liste.beste(args.top, args.spieler), 1):
+            minuten, sekunden = divmod(int(eintrag.dauer), 60)
+            print(f"{platz:>3} {eintrag.spieler:<20} {eintrag.score:>10} {eintrag.level:>5} {eintrag.linien:>7} "
+                  f"{minuten:>5}:{sekunden:02d} {sum(eintrag.gimmicks)}")
+    liste.beenden()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
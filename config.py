@@ -2,6 +2,14 @@
 Konfigurationsdatei für das Tetris-Spiel mit allen Konstanten
 """
 
+import os
+
+# Verzeichnis für Spielstand, Bestenliste und Schriften-Cache: pro Benutzer statt im Arbeitsverzeichnis
+# (Windows: %APPDATA%\tetris, sonst $XDG_DATA_HOME/tetris bzw. ~/.local/share/tetris)
+_BENUTZER_DATEN = (os.environ.get("APPDATA") or os.environ.get("XDG_DATA_HOME")
+                   or os.path.join(os.path.expanduser("~"), ".local", "share"))
+DATEN_VERZEICHNIS = os.path.join(_BENUTZER_DATEN, "tetris")
+
 # Fenstergröße
 BREITE = 800
 HOEHE = 700
@@ -59,6 +67,7 @@ EXPLOSION_RADIUS = 1  # Radius der Linienexplosion (Blöcke in jede Richtung)
 SCHRIFT_GROSS = 48
 SCHRIFT_MITTEL = 36
 SCHRIFT_KLEIN = 24
+SCHRIFT_CACHE_DATEI = os.path.join(DATEN_VERZEICHNIS, "schriften.json")  # Gefundene Schriftdateien, damit nicht jeder Start alle Systemschriften durchsucht
 
 # Farben für UI-Elemente
 UI_HINTERGRUND = (30, 30, 50)
@@ -68,4 +77,33 @@ UI_HIGHLIGHT = (255, 255, 100)
 
 # Performance-Parameter
 MAX_PARTIKEL = 300  # Maximale Anzahl gleichzeitiger Partikel
-MAX_FPS = 60  # Ziel-Bildwiederholrate 
\ No newline at end of file
+PARTIKEL_QUALITAET = 1.0  # Anteil der Partikel, die ein Effekt erzeugt (0 = keine, 1 = alle)
+PARTIKEL_AUTO_QUALITAET = True  # Bei langsamen Frames automatisch weniger Partikel erzeugen
+MAX_FPS = 60  # Ziel-Bildwiederholrate (0 = unbegrenzt)
+VSYNC = False  # Bildwiederholung an den Monitor koppeln (falls vom Treiber unterstützt)
+TICK_RATE = 60  # Simulationsschritte pro Sekunde, unabhängig von der Bildrate
+MAX_AUFHOLSCHRITTE = 15  # Höchstens so viele Schritte pro Frame nachholen (danach wird Zeit verworfen)
+
+# Autoplay (Computer spielt selbst)
+AUTOPLAY_ZUG_TICKS = 3  # Simulationsschritte zwischen zwei Eingaben des Autoplayers
+AUTOPLAY_NEUSTART_TICKS = 180  # Wartezeit nach Game Over, bevor der Autoplayer neu startet
+
+# Transpositionstabelle der Suche (siehe zobrist.py)
+TT_GROESSE = 200000  # Höchstzahl gespeicherter Einträge
+TT_VERDRAENGUNG = "lru"  # "lru" (am längsten ungenutzt) oder "fifo" (ältester Eintrag)
+
+# Zuschauer-Stream (siehe zuschauer.py)
+ZUSCHAUER_ADRESSE = "127.0.0.1:7777"  # host:port für TCP oder Pfad eines Unix-Sockets
+ZUSCHAUER_WARTESCHLANGE = 256  # Höchstzahl noch nicht verteilter Pakete
+ZUSCHAUER_PUFFER = 65536  # Höchstgröße des Sendepuffers je Zuschauer in Bytes
+
+# Spielstand (siehe spielstand.py)
+SPIELSTAND_DATEI = os.path.join(DATEN_VERZEICHNIS, "spielstand.bin")  # Standarddatei für Speichern (F5) und Fortsetzen (F9)
+
+# Aufzeichnungen (siehe replay.py)
+REPLAY_KEYFRAME_STEINE = 50  # Abstand der Keyframes (vollständiger Spielstand) in fixierten Steinen
+
+# Bestenliste (siehe bestenliste.py)
+BESTENLISTE_DATEI = os.path.join(DATEN_VERZEICHNIS, "bestenliste.db")  # SQLite-Datenbank mit allen beendeten Spielen
+BESTENLISTE_WARTESCHLANGE = 4096  # Höchstzahl noch nicht geschriebener Ergebnisse
+BESTENLISTE_STAPEL = 1000  # Höchstzahl Ergebnisse pro Schreibtransaktion
@@ -0,0 +1,371 @@
+"""
+Headless-Spielkern für den Tetris-Klon (reine Spielregeln, ohne pygame und ohne Uhrzeit)
+"""
+
+import random
+from config import (
+    SPALTEN, ZEILEN, ANFANGS_FALLZEIT, LEVEL_GESCHWINDIGKEIT,
+    PUNKTE_EINE_REIHE, PUNKTE_ZWEI_REIHEN, PUNKTE_DREI_REIHEN, PUNKTE_VIER_REIHEN,
+    SPEZIAL_CHANCE, ZEITLUPE_FAKTOR, ZEITRAFFER_FAKTOR, EXPLOSION_RADIUS, SCHWARZ, SPEZIAL_FARBEN
+)
+from formen import Stein
+from spielfeld import Spielfeld, reihen_verdichten
+from zobrist import stein_hash
+
+# Aktionen für TetrisEngine.step()
+AKTION_LINKS = "links"
+AKTION_RECHTS = "rechts"
+AKTION_RUNTER = "runter"
+AKTION_DREHEN = "drehen"
+AKTION_HARD_DROP = "hard_drop"
+
+AKTIONEN = (AKTION_LINKS, AKTION_RECHTS, AKTION_RUNTER, AKTION_DREHEN, AKTION_HARD_DROP)
+
+# Ereignisse für die Darstellung, jeweils (art, spalte, zeile, wert)
+EREIGNIS_SPEZIAL_FIXIERT = "spezial_fixiert"  # wert = Farbe des Spezialblocks
+EREIGNIS_REIHE_ENTFERNT = "reihe_entfernt"    # wert = Farbe der entfernten Zelle
+EREIGNIS_GIMMICK = "gimmick"                  # wert = Gimmick-Typ
+EREIGNIS_EXPLOSION = "explosion"              # wert = Farbe des gesprengten Blocks
+
+# Verzögerung nach dem Fixieren, damit das neue Tetromino nicht sofort fällt
+SPAWN_VERZOEGERUNG = 0.3
+
+# Dauer der Gimmick-Effekte in Ticks (bei festem Takt von TICK_RATE = 60 gut drei Sekunden)
+GIMMICK_DAUER = 200
+
+# Regelparameter, die pro Engine überschrieben werden können (z.B. für Turniere)
+STANDARD_REGELN = {
+    "SPEZIAL_CHANCE": SPEZIAL_CHANCE,
+    "ZEITLUPE_FAKTOR": ZEITLUPE_FAKTOR,
+    "ZEITRAFFER_FAKTOR": ZEITRAFFER_FAKTOR,
+    "EXPLOSION_RADIUS": EXPLOSION_RADIUS,
+    "PUNKTE_EINE_REIHE": PUNKTE_EINE_REIHE,
+    "PUNKTE_ZWEI_REIHEN": PUNKTE_ZWEI_REIHEN,
+    "PUNKTE_DREI_REIHEN": PUNKTE_DREI_REIHEN,
+    "PUNKTE_VIER_REIHEN": PUNKTE_VIER_REIHEN,
+}
+
+
+class TetrisEngine:
+    """Spielzustand und Regeln; wird über step(aktion) und tick(dt) gesteuert"""
+
+    def __init__(self, stein_klasse=Stein, regeln=None, seed=None):
+        """Initialisiert ein neues Spiel; stein_klasse erzeugt die Tetrominos,
+        regeln überschreibt einzelne Werte aus STANDARD_REGELN, seed legt die Formenfolge fest"""
+        self.stein_klasse = stein_klasse
+        self.regeln = dict(STANDARD_REGELN)
+        for name, wert in (regeln or {}).items():
+            if name not in STANDARD_REGELN:
+                raise ValueError(f"Unbekannte Spielregel: {name}")
+            self.regeln[name] = wert
+
+        # Punkte nach Anzahl gleichzeitig entfernter Reihen
+        self.punkte_tabelle = {
+            1: self.regeln["PUNKTE_EINE_REIHE"],
+            2: self.regeln["PUNKTE_ZWEI_REIHEN"],
+            3: self.regeln["PUNKTE_DREI_REIHEN"],
+            4: self.regeln["PUNKTE_VIER_REIHEN"],
+        }
+        self.neustart(seed)
+
+    def neustart(self, seed=None):
+        """Setzt den kompletten Spielzustand zurück
+
+        Formen und Gimmicks kommen aus einem eigenen Zufallsgenerator pro Spiel (self.rng),
+        sodass Seed und Eingaben ein Spiel vollständig bestimmen (siehe replay.py).
+        Ohne seed wird einer gezogen und in self.seed festgehalten.
+        """
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self.ticks = 0
+        self.aufzeichnung = None  # replay.Aufzeichnung, die Eingaben und Keyframes mitschreibt
+
+        # Spielfeld (Bitboard, 0 = leer, 1-7 = Tetromino-Farbe)
+        self.spielfeld = Spielfeld()
+        self.spielfeld_farben = [[SCHWARZ for _ in range(SPALTEN)] for _ in range(ZEILEN)]
+        self.spielfeld_gimmicks = [[-1 for _ in range(SPALTEN)] for _ in range(ZEILEN)]
+
+        # Spielwerte
+        self.score = 0
+        self.level = 1
+        self.linien = 0
+        self.steine = 0
+        self.fallzeit = ANFANGS_FALLZEIT
+        self.fall_timer = 0.0
+
+        # Aktives Tetromino
+        self.aktuelles_tetromino = self.neues_tetromino()
+        self.naechstes_tetromino = self.neues_tetromino()
+
+        # Spielstatus
+        self.spiel_aktiv = True
+        self.pause = False
+        self.automatisch_fallen = True
+
+        # Gimmick-Status
+        self.aktiver_zeitfaktor = 1.0
+        self.zeitfaktor_timer = 0
+        self.gravitation_richtung = 0  # 0=runter, 1=rechts, 2=links
+        self.gravitation_timer = 0
+        self.gimmick_zaehler = [0] * len(SPEZIAL_FARBEN)  # ausgelöste Gimmicks je Typ (Statistik)
+
+        # Ereignisse seit dem letzten ereignisse_abholen()
+        self.ereignisse = []
+
+    def neues_tetromino(self):
+        """Erstellt ein neues zufälliges Tetromino"""
+        return self.stein_klasse(SPALTEN // 2 - 2, 0, spezial_chance=self.regeln["SPEZIAL_CHANCE"], rng=self.rng)
+
+    def zustand_hash(self):
+        """Zobrist-Hash aus Spielfeld und Position des aktuellen Tetrominos"""
+        wert = self.spielfeld.hash
+        tetromino = self.aktuelles_tetromino
+        if tetromino:
+            wert ^= stein_hash(tetromino.form_idx, tetromino.aktuelle_rotation, tetromino.x, tetromino.y)
+        return wert
+
+    def ereignisse_abholen(self):
+        """Gibt die gesammelten Ereignisse zurück und leert die Liste"""
+        ereignisse = self.ereignisse
+        self.ereignisse = []
+        return ereignisse
+
+    def step(self, aktion):
+        """Führt eine Spieleraktion aus und gibt zurück, ob sie etwas bewirkt hat"""
+        if self.aufzeichnung is not None and self.spiel_aktiv and not self.pause:
+            self.aufzeichnung.eingabe(aktion)
+        if aktion == AKTION_LINKS:
+            return self.tetromino_bewegen(-1, 0)
+        if aktion == AKTION_RECHTS:
+            return self.tetromino_bewegen(1, 0)
+        if aktion == AKTION_RUNTER:
+            return self.tetromino_bewegen(0, 1)
+        if aktion == AKTION_DREHEN:
+            return self.tetromino_rotieren()
+        if aktion == AKTION_HARD_DROP:
+            return self.hard_drop()
+        raise ValueError(f"Unbekannte Aktion: {aktion}")
+
+    def tick(self, dt):
+        """Lässt dt Sekunden Spielzeit verstreichen (Gimmick-Timer zählen pro Tick, daher mit festem dt aufrufen)"""
+        if not self.spiel_aktiv or self.pause:
+            return
+
+        # Zeitstempel für Aufzeichnungen: Eingaben gehören zum Tick, vor dem sie kommen
+        self.ticks += 1
+        self.zeitfaktor_aktualisieren()
+        self.gravitation_aktualisieren()
+
+        # Automatisches Fallen
+        self.fall_timer += dt
+        if self.automatisch_fallen and self.fall_timer > self.fallzeit * self.aktiver_zeitfaktor:
+            self.fall_timer = 0.0
+            self.gravitation_anwenden()
+
+        if self.aufzeichnung is not None:
+            self.aufzeichnung.tick_beendet()
+
+    def kollision_pruefen(self, dx, dy, tetromino):
+        """Prüft, ob das Tetromino mit dem Spielfeld oder dem Rand kollidieren würde"""
+        if not tetromino:
+            return False
+
+        return self.spielfeld.kollidiert(tetromino.masken, tetromino.x + dx, tetromino.y + dy)
+
+    def tetromino_bewegen(self, dx, dy):
+        """Bewegt das aktuelle Tetromino wenn möglich"""
+        if not self.aktuelles_tetromino or not self.spiel_aktiv or self.pause:
+            return False
+
+        if not self.kollision_pruefen(dx, dy, self.aktuelles_tetromino):
+            self.aktuelles_tetromino.x += dx
+            self.aktuelles_tetromino.y += dy
+            return True
+
+        # Wenn das Tetromino nicht nach unten bewegt werden kann, setze es fest
+        if dy > 0:
+            self.tetromino_fixieren()
+            return True
+
+        return False
+
+    def tetromino_rotieren(self):
+        """Rotiert das aktuelle Tetromino wenn möglich (mit Verschiebung am Rand)"""
+        if not self.aktuelles_tetromino or not self.spiel_aktiv or self.pause:
+            return False
+
+        self.aktuelles_tetromino.rotieren()
+
+        if not self.kollision_pruefen(0, 0, self.aktuelles_tetromino):
+            return True
+
+        # Versuche das Tetromino nach links/rechts zu schieben, falls es am Rand kollidiert
+        for dx in (1, -1, 2, -2):
+            if not self.kollision_pruefen(dx, 0, self.aktuelles_tetromino):
+                self.aktuelles_tetromino.x += dx
+                return True
+
+        # Keine gültige Position gefunden, Drehung rückgängig machen
+        self.aktuelles_tetromino.pos_rückgängig_rotieren()
+        return False
+
+    def fall_distanz(self, tetromino=None):
+        """Gibt zurück, wie viele Zeilen das (aktuelle) Tetromino bis zur Landeposition fallen kann"""
+        tetromino = tetromino or self.aktuelles_tetromino
+        return self.spielfeld.fall_distanz(tetromino.daten, tetromino.x, tetromino.y)
+
+    def hard_drop(self):
+        """Lässt das Tetromino sofort fallen und fixiert es"""
+        if not self.aktuelles_tetromino or not self.spiel_aktiv or self.pause:
+            return False
+
+        drops = self.fall_distanz()
+        if drops == 0:
+            return False
+
+        self.aktuelles_tetromino.y += drops
+        self.tetromino_fixieren()
+        return True
+
+    def tetromino_fixieren(self):
+        """Fügt das aktuelle Tetromino dem Spielfeld hinzu"""
+        tetromino = self.aktuelles_tetromino
+        if not tetromino:
+            return
+
+        positions = tetromino.get_positions()
+
+        # Prüfe ob das Spiel vorbei ist (Tetromino kann nicht mehr platziert werden)
+        for x, y in positions:
+            if y < 0:
+                self.spiel_aktiv = False
+                return
+
+        # Tetromino zum Spielfeld hinzufügen (Bitmasken per ODER)
+        self.spielfeld.fixieren(tetromino.masken, tetromino.x, tetromino.y, tetromino.form_idx + 1)
+        for x, y in positions:
+            if 0 <= y < ZEILEN and 0 <= x < SPALTEN:
+                self.spielfeld_farben[y][x] = tetromino.farbe
+
+                # Speichere Gimmick-Effekt wenn vorhanden
+                if tetromino.ist_spezial:
+                    self.spielfeld_gimmicks[y][x] = tetromino.gimmick_effekt
+                    self.ereignisse.append((EREIGNIS_SPEZIAL_FIXIERT, x, y, tetromino.farbe))
+
+        self.steine += 1
+
+        # Volle Reihen entfernen
+        self.reihen_entfernen()
+
+        # Nächstes Tetromino vorbereiten
+        self.aktuelles_tetromino = self.naechstes_tetromino
+        self.naechstes_tetromino = self.neues_tetromino()
+
+        # Kleine Verzögerung, damit das neue Tetromino nicht sofort fallen gelassen wird
+        self.fall_timer = -SPAWN_VERZOEGERUNG
+
+        # Spielende, wenn das neue Tetromino schon beim Erscheinen blockiert ist
+        if self.kollision_pruefen(0, 0, self.aktuelles_tetromino):
+            self.spiel_aktiv = False
+
+        if self.aufzeichnung is not None:
+            self.aufzeichnung.stein_fixiert()
+
+    def reihen_entfernen(self):
+        """Entfernt volle Reihen und aktualisiert den Score"""
+        volle_reihen = self.spielfeld.volle_reihen()
+
+        anzahl_reihen = len(volle_reihen)
+        if anzahl_reihen == 0:
+            return
+
+        # Prüfe auf Gimmick-Effekte in den zu entfernenden Reihen
+        for reihe in volle_reihen:
+            for x in range(SPALTEN):
+                if self.spielfeld_gimmicks[reihe][x] >= 0:
+                    self.gimmick_aktivieren(self.spielfeld_gimmicks[reihe][x], x, reihe)
+
+        # Punkte hinzufügen
+        self.score += self.punkte_tabelle.get(anzahl_reihen, 0) * self.level
+
+        for reihe in volle_reihen:
+            for x in range(SPALTEN):
+                self.ereignisse.append((EREIGNIS_REIHE_ENTFERNT, x, reihe, self.spielfeld_farben[reihe][x]))
+
+        # Entferne alle Reihen in einem Durchgang; die darüber liegenden rutschen als Ganzes nach
+        entfernen = set(volle_reihen)
+        self.spielfeld.reihen_entfernen(entfernen)
+        reihen_verdichten(self.spielfeld_farben, entfernen, lambda: [SCHWARZ] * SPALTEN)
+        reihen_verdichten(self.spielfeld_gimmicks, entfernen, lambda: [-1] * SPALTEN)
+
+        # Linien und Level aktualisieren
+        self.linien += anzahl_reihen
+
+        # Level erhöhen je 10 Linien
+        neues_level = self.linien // 10 + 1
+        if neues_level > self.level:
+            self.level = neues_level
+            self.fallzeit = max(0.05, ANFANGS_FALLZEIT - (self.level - 1) * LEVEL_GESCHWINDIGKEIT)
+
+    def gimmick_aktivieren(self, gimmick_typ, x, y):
+        """Aktiviert den Effekt eines Gimmick-Blocks"""
+        self.ereignisse.append((EREIGNIS_GIMMICK, x, y, gimmick_typ))
+        self.gimmick_zaehler[gimmick_typ] += 1
+
+        if gimmick_typ == 0:  # Zeitlupe
+            self.aktiver_zeitfaktor = self.regeln["ZEITLUPE_FAKTOR"]
+            self.zeitfaktor_timer = GIMMICK_DAUER
+
+        elif gimmick_typ == 1:  # Zeitraffer
+            self.aktiver_zeitfaktor = self.regeln["ZEITRAFFER_FAKTOR"]
+            self.zeitfaktor_timer = GIMMICK_DAUER
+
+        elif gimmick_typ == 2:  # Linienexplosion
+            # Entferne Blöcke im Umkreis
+            radius = self.regeln["EXPLOSION_RADIUS"]
+            for dy in range(-radius, radius + 1):
+                for dx in range(-radius, radius + 1):
+                    nx, ny = x + dx, y + dy
+                    if 0 <= nx < SPALTEN and 0 <= ny < ZEILEN and self.spielfeld.belegt(nx, ny):
+                        self.ereignisse.append((EREIGNIS_EXPLOSION, nx, ny, self.spielfeld_farben[ny][nx]))
+
+                        # Block entfernen
+                        self.spielfeld.setzen(nx, ny, 0)
+                        self.spielfeld_farben[ny][nx] = SCHWARZ
+                        self.spielfeld_gimmicks[ny][nx] = -1
+
+            # Zusätzlicher Punktebonus
+            self.score += 50 * self.level
+
+        elif gimmick_typ == 3:  # Gravitation ändern
+            # Wechsele zwischen den Gravitationsrichtungen
+            self.gravitation_richtung = (self.gravitation_richtung + 1) % 3
+            self.gravitation_timer = GIMMICK_DAUER
+
+    def zeitfaktor_aktualisieren(self):
+        """Aktualisiert den aktiven Zeitfaktor"""
+        if self.zeitfaktor_timer > 0:
+            self.zeitfaktor_timer -= 1
+            if self.zeitfaktor_timer == 0:
+                self.aktiver_zeitfaktor = 1.0
+
+    def gravitation_aktualisieren(self):
+        """Aktualisiert die Gravitationsrichtung"""
+        if self.gravitation_timer > 0:
+            self.gravitation_timer -= 1
+
+            # Wenn Timer abgelaufen, zurück zur normalen Gravitation
+            if self.gravitation_timer == 0:
+                self.gravitation_richtung = 0
+
+    def gravitation_anwenden(self):
+        """Wendet die aktuelle Gravitationsrichtung an"""
+        if not self.aktuelles_tetromino or not self.spiel_aktiv or self.pause:
+            return
+
+        if self.gravitation_richtung == 0:  # Nach unten
+            self.tetromino_bewegen(0, 1)
+        elif self.gravitation_richtung == 1:  # Nach rechts
+            self.tetromino_bewegen(1, 0)
+        elif self.gravitation_richtung == 2:  # Nach links
+            self.tetromino_bewegen(-1, 0)
@@ -0,0 +1,280 @@
+"""
+Tetromino-Formen und Spiellogik der Steine (ohne pygame-Abhängigkeit)
+"""
+
+import random
+from collections import namedtuple
+from config import FARBEN, SPEZIAL_FARBEN, SPEZIAL_CHANCE
+
+# Definition aller Tetromino-Formen
+TETROMINOS = [
+    # I-Form
+    [
+        [".....",
+         ".....",
+         "OOOO.",
+         ".....",
+         "....."],
+        [".....",
+         "..O..",
+         "..O..",
+         "..O..",
+         "..O.."]
+    ],
+    # J-Form
+    [
+        [".....",
+         ".....",
+         ".OOO.",
+         "...O.",
+         "....."],
+        [".....",
+         "..O..",
+         "..O..",
+         ".OO..",
+         "....."],
+        [".....",
+         ".....",
+         ".O...",
+         ".OOO.",
+         "....."],
+        [".....",
+         "..OO.",
+         "..O..",
+         "..O..",
+         "....."]
+    ],
+    # L-Form
+    [
+        [".....",
+         ".....",
+         ".OOO.",
+         ".O...",
+         "....."],
+        [".....",
+         ".OO..",
+         "..O..",
+         "..O..",
+         "....."],
+        [".....",
+         ".....",
+         "...O.",
+         ".OOO.",
+         "....."],
+        [".....",
+         "..O..",
+         "..O..",
+         "..OO.",
+         "....."]
+    ],
+    # O-Form
+    [
+        [".....",
+         ".....",
+         ".OO..",
+         ".OO..",
+         "....."]
+    ],
+    # S-Form
+    [
+        [".....",
+         ".....",
+         "..OO.",
+         ".OO..",
+         "....."],
+        [".....",
+         "..O..",
+         "..OO.",
+         "...O.",
+         "....."]
+    ],
+    # T-Form
+    [
+        [".....",
+         ".....",
+         ".OOO.",
+         "..O..",
+         "....."],
+        [".....",
+         "..O..",
+         ".OO..",
+         "..O..",
+         "....."],
+        [".....",
+         ".....",
+         "..O..",
+         ".OOO.",
+         "....."],
+        [".....",
+         "..O..",
+         "..OO.",
+         "..O..",
+         "....."]
+    ],
+    # Z-Form
+    [
+        [".....",
+         ".....",
+         ".OO..",
+         "..OO.",
+         "....."],
+        [".....",
+         "...O.",
+         "..OO.",
+         "..O..",
+         "....."]
+    ]
+]
+
+# Kompilierte Form einer Rotation:
+# zellen = (spalte, zeile)-Offsets der Blöcke, masken = (zeilen_offset, bitmaske) pro belegter Zeile,
+# box = (min_spalte, min_zeile, max_spalte, max_zeile), profil = (spalte, unterste_zeile) pro belegter Spalte
+FormDaten = namedtuple("FormDaten", ["zellen", "masken", "box", "profil"])
+
+def _form_kompilieren(form):
+    """Übersetzt eine 5x5-Form aus Strings einmalig in Offsets, Bitmasken, Begrenzungsbox und Bodenprofil"""
+    zellen = []
+    masken = []
+    for i, zeile in enumerate(form):
+        maske = 0
+        for j, zelle in enumerate(zeile):
+            if zelle == 'O':
+                zellen.append((j, i))
+                maske |= 1 << j
+        if maske:
+            masken.append((i, maske))
+    spalten = [j for j, _ in zellen]
+    zeilen = [i for _, i in zellen]
+    box = (min(spalten), min(zeilen), max(spalten), max(zeilen))
+    unterste = {}
+    for j, i in zellen:
+        unterste[j] = max(i, unterste.get(j, i))
+    profil = tuple(sorted(unterste.items()))
+    return FormDaten(tuple(zellen), tuple(masken), box, profil)
+
+# Kompilierte Tabellen aller Formen und Rotationen (einmalig beim Import berechnet);
+# die String-Grafiken oben bleiben die editierbare Quelle
+FORM_TABELLEN = [[_form_kompilieren(form) for form in formen] for formen in TETROMINOS]
+
+# Leere Zellenmenge (z.B. für eine nicht angezeigte Landevorschau)
+KEINE_ZELLEN = frozenset()
+
+class Stein:
+    """Spiellogik eines Tetrominos (Form, Rotation, Position, Gimmick) ohne Darstellung
+
+    Die Formdaten sind unveränderlich und liegen in TETROMINOS und FORM_TABELLEN; ein Stein
+    hält nur seinen eigenen Zustand (in __slots__). Steine mit vorgegebenem Zustand entstehen
+    über aus_zustand(), ohne Zufallszahlen zu ziehen.
+    """
+    
+    __slots__ = ("form_idx", "aktuelle_rotation", "ist_spezial", "spezial_typ", "farbe", "gimmick_effekt",
+                 "x", "y", "_zellen", "_zellen_x", "_zellen_y", "_zellen_rotation")
+    
+    def __init__(self, x, y, form_idx=None, spezial_chance=SPEZIAL_CHANCE, rng=None):
+        """Initialisiert einen neuen Stein mit zufälliger oder vorgegebener Form
+
+        rng (random.Random) liefert Form und Gimmick; ohne ihn dient das globale random-Modul.
+        Die Engine übergibt ihren Generator pro Spiel, damit Spiele aus dem Seed reproduzierbar sind.
+        """
+        zufall = rng or random
+        try:
+            if form_idx is None:
+                # Zufällige Form auswählen
+                self.form_idx = zufall.randint(0, len(TETROMINOS) - 1)
+            else:
+                # Sicherstellen, dass form_idx gültig ist
+                self.form_idx = max(0, min(form_idx, len(TETROMINOS) - 1))
+            
+            self.aktuelle_rotation = 0
+            
+            # Initialisiere spezial_typ immer, unabhängig davon, ob es ein Spezialblock ist
+            self.spezial_typ = 0
+            
+            # Standardfarbe oder spezielle Farbe (Gimmick)
+            self.ist_spezial = zufall.random() < spezial_chance
+            
+            if self.ist_spezial:
+                self.spezial_typ = zufall.randint(0, len(SPEZIAL_FARBEN) - 1)
+                self.farbe = SPEZIAL_FARBEN[self.spezial_typ]
+                self.gimmick_effekt = self.spezial_typ
+            else:
+                self.farbe = FARBEN[self.form_idx]
+                self.gimmick_effekt = -1
+            
+            # Position auf dem Spielfeld
+            self.x = x
+            self.y = y
+        except Exception as e:
+            print(f"Fehler bei Tetromino-Initialisierung: {e}")
+            # Fallback zu sicheren Werten
+            self.form_idx = 0
+            self.aktuelle_rotation = 0
+            self.ist_spezial = False
+            self.spezial_typ = 0  # Auch hier initialisieren
+            self.farbe = FARBEN[0]
+            self.gimmick_effekt = -1
+            self.x = x
+            self.y = y
+        self._zellen = None
+    
+    @classmethod
+    def aus_zustand(cls, form_idx, rotation, x, y, spezial_typ=-1, farbe=None):
+        """Erzeugt einen Stein mit vorgegebenem Zustand (spezial_typ -1: kein Gimmick), ohne Zufall"""
+        stein = cls.__new__(cls)
+        stein.form_idx = form_idx
+        stein.aktuelle_rotation = rotation
+        stein.ist_spezial = spezial_typ >= 0
+        stein.spezial_typ = max(0, spezial_typ)
+        stein.gimmick_effekt = spezial_typ
+        if farbe is None:
+            farbe = SPEZIAL_FARBEN[spezial_typ] if spezial_typ >= 0 else FARBEN[form_idx]
+        stein.farbe = farbe
+        stein.x = x
+        stein.y = y
+        stein._zellen = None
+        return stein
+    
+    @property
+    def formen(self):
+        """Formgrafiken aller Rotationen (unveränderlich, gemeinsam für alle Steine einer Form)"""
+        return TETROMINOS[self.form_idx]
+    
+    @property
+    def form(self):
+        """Formgrafik der aktuellen Rotation"""
+        return TETROMINOS[self.form_idx][self.aktuelle_rotation]
+        
+    def rotieren(self):
+        """Tetromino im Uhrzeigersinn drehen"""
+        self.aktuelle_rotation = (self.aktuelle_rotation + 1) % len(FORM_TABELLEN[self.form_idx])
+        
+    def pos_rückgängig_rotieren(self):
+        """Rotationsindex zurücksetzen (wird bei Kollision verwendet)"""
+        self.aktuelle_rotation = (self.aktuelle_rotation - 1) % len(FORM_TABELLEN[self.form_idx])
+        
+    @property
+    def daten(self):
+        """Kompilierte Formdaten der aktuellen Rotation"""
+        return FORM_TABELLEN[self.form_idx][self.aktuelle_rotation]
+        
+    @property
+    def masken(self):
+        """Zeilenmasken der aktuellen Rotation für die Bitboard-Kollision"""
+        return FORM_TABELLEN[self.form_idx][self.aktuelle_rotation].masken
+        
+    def get_positions(self):
+        """Gibt die absoluten Positionen der Blöcke zurück"""
+        x, y = self.x, self.y
+        return [(x + j, y + i) for j, i in self.daten.zellen]
+    
+    def zellen(self):
+        """Absolute Positionen als frozenset; neu berechnet nur nach Bewegung oder Rotation
+
+        Solange der Stein liegt, kommt bei jedem Aufruf dasselbe Objekt zurück, sodass
+        Zeichnen und Vergleichen pro Frame nichts anlegen.
+        """
+        if (self._zellen is None or self._zellen_x != self.x or self._zellen_y != self.y
+                or self._zellen_rotation != self.aktuelle_rotation):
+            self._zellen = frozenset(self.get_positions())
+            self._zellen_x, self._zellen_y, self._zellen_rotation = self.x, self.y, self.aktuelle_rotation
+        return self._zellen
@@ -11,19 +11,59 @@ Steuerung:
 - R: Neustart
 - ESC: Zurück zum Hauptmenü (mit Bestätigungsdialog)
 - J/N: Bestätigen/Abbrechen in Dialogen
+- F3: Frame-Profiler ein/aus
+- F5/F9: Spielstand speichern/fortsetzen
+- K (im Hauptmenü): Computer spielt (Autoplay)
+
+Optionen:
+- --autoplay: ohne Hauptmenü direkt im Autoplay starten (Dauerläufe, Schaufenster)
+- --zuschauer [ADRESSE]: Spielzustand für Zuschauer veröffentlichen (siehe zuschauer.py)
+- --spielstand [DATEI]: gespeichertes Spiel direkt fortsetzen und beim Schließen wieder speichern
+- --aufnahme DATEI: Spiele aufzeichnen (Seed und Eingaben, siehe replay.py)
+- --spieler NAME: Name für die Bestenliste (Standard: angemeldeter Benutzer, siehe bestenliste.py)
+- --ohne-bestenliste: beendete Spiele nicht in der Bestenliste speichern
+- --replay DATEI: Aufnahme im Spieltakt abspielen (ohne Steuerung, R beginnt von vorn)
+- --profil: Frame-Profiler direkt einblenden
+- --startzeit: Dauer von Importen, Initialisierung und erstem Bild ausgeben
+- --profil-csv DATEI: Rohdaten des Profilers beim Beenden als CSV speichern
 
 Navigation:
 - Hauptmenü -> Spiel: Beliebige Taste drücken
+- Hauptmenü -> Autoplay: K drücken oder warten (nach 2 Minuten startet der Autoplay)
 - Spiel -> Hauptmenü: ESC drücken und Bestätigung mit J
 """
 
+import time
+
+# Beginn der Startzeitmessung (--startzeit), vor den übrigen Importen: pygame und numpy laden am längsten
+PROGRAMM_START = time.perf_counter()
+
+import argparse
+import os
 import pygame
 import sys
-import time
 import traceback
 import random
-from config import BREITE, HOEHE, UI_HINTERGRUND, UI_TEXT, UI_AKZENT, ZEILEN
+from config import (
+    BREITE, HOEHE, UI_HINTERGRUND, UI_TEXT, UI_AKZENT, MAX_FPS, VSYNC, ZUSCHAUER_ADRESSE, SPIELSTAND_DATEI,
+    BESTENLISTE_DATEI
+)
 from game import TetrisSpiel
+from renderer import SpielRenderer
+from sprites import ATLAS
+from texte import TEXT_CACHE, schrift
+from profiler import FrameProfiler, Startmessung
+from autoplayer import Autoplayer
+from zuschauer import ZuschauerServer
+import replay
+from bestenliste import Bestenliste, standard_spieler
+
+# Rückgabewert des Startbildschirms, wenn der Computer spielen soll
+START_AUTOPLAY = "autoplay"
+
+# Phasen des Programmstarts bis zum ersten Bild
+STARTMESSUNG = Startmessung(PROGRAMM_START)
+STARTMESSUNG.markieren("Importe")
 
 def zeige_bestaetigung(screen, frage):
     """Zeigt einen Bestätigungsdialog an und gibt True oder False zurück"""
@@ -98,58 +138,149 @@ def zeige_bestaetigung(screen, frage):
         traceback.print_exc()
         return False  # Im Fehlerfall nicht beenden
 
-def main():
+def argumente_parsen(argv=None):
+    """Liest die Kommandozeilenoptionen"""
+    parser = argparse.ArgumentParser(description="Tetris mit Gimmicks")
+    parser.add_argument("--autoplay", action="store_true", help="Direkt im Autoplay starten (Computer spielt)")
+    parser.add_argument("--zuschauer", nargs="?", const=ZUSCHAUER_ADRESSE, metavar="ADRESSE",
+                        help=f"Spielzustand für Zuschauer veröffentlichen (Standard {ZUSCHAUER_ADRESSE})")
+    parser.add_argument("--spielstand", nargs="?", const=SPIELSTAND_DATEI, metavar="DATEI",
+                        help=f"Spielstand fortsetzen und beim Schließen speichern (Standard {SPIELSTAND_DATEI})")
+    parser.add_argument("--aufnahme", metavar="DATEI", help="Spiele als Seed und Eingaben aufzeichnen")
+    parser.add_argument("--replay", metavar="DATEI", help="Aufnahme abspielen statt selbst zu spielen")
+    parser.add_argument("--spieler", default=standard_spieler(), help="Name für die Bestenliste")
+    parser.add_argument("--bestenliste", default=BESTENLISTE_DATEI, metavar="DATEI",
+                        help=f"Datenbank der Bestenliste (Standard {BESTENLISTE_DATEI})")
+    parser.add_argument("--ohne-bestenliste", action="store_true", help="Ergebnisse nicht speichern")
+    parser.add_argument("--profil", action="store_true", help="Frame-Profiler direkt einblenden (F3)")
+    parser.add_argument("--profil-csv", metavar="DATEI", help="Profiler-Rohdaten beim Beenden als CSV speichern")
+    parser.add_argument("--startzeit", action="store_true",
+                        help="Dauer von Importen, Initialisierung und erstem Bild ausgeben")
+    return parser.parse_args(argv)
+
+def main(args=None):
     """Hauptfunktion des Spiels"""
+    if args is None:
+        args = argumente_parsen([])
+    STARTMESSUNG.ausgeben = args.startzeit
+    
+    # Aufnahme zum Abspielen
+    wiedergabe = None
+    if args.replay:
+        try:
+            wiedergabe = replay.laden(args.replay)
+        except (OSError, ValueError) as e:
+            print(f"Fehler beim Laden der Aufnahme: {e}")
+            return
+    
+    # Frame-Profiler (Phasenzeiten in Ringpuffern, Overlay mit F3)
+    profiler = FrameProfiler()
+    profiler.overlay_aktiv = args.profil
+    if args.profil_csv:
+        profiler.rohdaten_sammeln()
+    
+    # Zuschauer-Stream (läuft in einem eigenen Thread, die Spielschleife wartet nie darauf)
+    zuschauer = None
+    if args.zuschauer:
+        zuschauer = ZuschauerServer(args.zuschauer)
+        if not zuschauer.starten():
+            zuschauer = None
+    
+    # Bestenliste (schreibt in einem eigenen Thread, ein Game Over hält die Spielschleife nicht auf)
+    bestenliste = None
+    if not args.ohne_bestenliste:
+        bestenliste = Bestenliste(args.bestenliste)
+        if not bestenliste.starten():
+            bestenliste = None
+    
     try:
-        # Pygame initialisieren
-        pygame.init()
+        # Nur die benötigten Pygame-Module initialisieren (pygame.init() startet auch Audio,
+        # Joystick usw., was beim Start spürbar Zeit kostet und nie benutzt wird)
+        pygame.display.init()
+        pygame.font.init()
         
         # Prüfen, ob Pygame erfolgreich initialisiert wurde
         if pygame.get_error() != "":
             print(f"Pygame Initialisierungsfehler: {pygame.get_error()}")
         
-        # Bildschirmmodus setzen
+        # Bildschirmmodus setzen (VSync braucht in Pygame 2 ein skaliertes Fenster)
         try:
-            screen = pygame.display.set_mode((BREITE, HOEHE))
+            screen = None
+            if VSYNC:
+                try:
+                    screen = pygame.display.set_mode((BREITE, HOEHE), pygame.SCALED, vsync=1)
+                except pygame.error as e:
+                    print(f"VSync nicht verfügbar, verwende normales Fenster: {e}")
+            if screen is None:
+                screen = pygame.display.set_mode((BREITE, HOEHE))
         except pygame.error as e:
             print(f"Fehler beim Setzen des Bildschirmmodus: {e}")
             return
             
         pygame.display.set_caption("Tetris mit Gimmicks")
         
-        # Prüfen ob Schriftarten verfügbar sind
-        system_fonts = pygame.font.get_fonts()
-        if "arial" not in system_fonts:
-            print("Warnung: Arial-Schriftart nicht gefunden, verwende Systemstandard")
+        # Blöcke einmalig im Bildschirmformat vorrendern
+        ATLAS.erstellen()
+        STARTMESSUNG.markieren("Initialisierung")
+        
+        # Schriftarten werden erst beim ersten Gebrauch gesucht (texte.schrift, mit Dateicache)
         
         # Uhr für FPS-Begrenzung
         clock = pygame.time.Clock()
         
         # Hauptspielschleife
         spiel_laeuft = True
+        erster_start = True
+        spielstand_datei = args.spielstand or SPIELSTAND_DATEI
         while spiel_laeuft:
-            # Anfangsbildschirm anzeigen
-            print("Zeige Startbildschirm...")
-            start_game = zeige_startbildschirm(screen)
+            fortsetzen = erster_start and args.spielstand and os.path.exists(args.spielstand)
+            abspielen = erster_start and wiedergabe is not None
+            if abspielen:
+                # Aufnahme ohne Hauptmenü abspielen
+                start_game = True
+            elif erster_start and args.autoplay:
+                # Mit --autoplay ohne Hauptmenü direkt loslegen
+                start_game = START_AUTOPLAY
+            elif fortsetzen:
+                # Gespeichertes Spiel ohne Hauptmenü fortsetzen
+                start_game = True
+            else:
+                # Anfangsbildschirm anzeigen
+                print("Zeige Startbildschirm...")
+                start_game = zeige_startbildschirm(screen)
+            erster_start = False
             if not start_game:
                 print("Spiel im Startbildschirm beendet")
                 break
                 
-            print("Startbildschirm verlassen, starte Spiel...")
+            autoplay = start_game == START_AUTOPLAY
+            if abspielen:
+                print(f"Spiele Aufnahme {args.replay} ab...")
+            else:
+                print("Startbildschirm verlassen, starte Autoplay..." if autoplay
+                      else "Startbildschirm verlassen, starte Spiel...")
                 
             # Tastaturwiederholrate setzen (für schnellere Bewegung bei gedrückter Taste)
             pygame.key.set_repeat(150, 50)
             
             # Spielobjekt erstellen
-            spiel = TetrisSpiel()
+            if abspielen:
+                spiel = TetrisSpiel(wiedergabe=wiedergabe)
+            else:
+                spiel = TetrisSpiel(Autoplayer() if autoplay else None, aufnahme=args.aufnahme,
+                                    bestenliste=bestenliste, spieler=args.spieler)
+            if fortsetzen and not abspielen and spiel.laden(args.spielstand):
+                print(f"Spielstand {args.spielstand} fortgesetzt")
+            renderer = SpielRenderer(spiel, UI_HINTERGRUND)
             
             # Spielschleife
             running = True
-            last_frame_time = time.time()
+            last_frame_time = time.perf_counter()
             
             while running:
                 try:
-                    current_time = time.time()
+                    profiler.frame_beginnen()
+                    current_time = time.perf_counter()
                     frame_time = current_time - last_frame_time
                     last_frame_time = current_time
                     
@@ -160,22 +291,42 @@ def main():
                     # Ereignisse verarbeiten
                     for event in pygame.event.get():
                         if event.type == pygame.QUIT:
-                            # Fenster schließen ohne Nachfrage
+                            # Fenster schließen ohne Nachfrage (mit --spielstand wird vorher gesichert)
+                            if args.spielstand and spiel.spiel_aktiv:
+                                spiel.speichern(args.spielstand)
                             running = False
                             spiel_laeuft = False
+                        elif event.type == pygame.VIDEOEXPOSE:
+                            # Fensterinhalt wurde verdeckt oder neu aufgebaut
+                            renderer.alles_neu()
                         elif event.type == pygame.KEYDOWN:
                             if event.key == pygame.K_ESCAPE:
                                 # Sicherheitsabfrage anzeigen
                                 if zeige_bestaetigung(screen, "Zum Hauptmenü zurückkehren?"):
                                     running = False  # Beendet nur die aktuelle Spielschleife
                                     # spiel_laeuft bleibt true, damit wir zum Hauptmenü zurückkehren
+                                # Der Dialog hat das Spielfeld übermalt und die Spielzeit angehalten
+                                renderer.alles_neu()
+                                spiel.zeitschritt.zuruecksetzen()
                             elif event.key == pygame.K_p:
                                 spiel.pause_toggle()
                             elif event.key == pygame.K_r:
                                 spiel.neustart()
+                                renderer.alles_neu()
+                            elif event.key == pygame.K_F3:
+                                if not profiler.overlay_umschalten():
+                                    # Bereich unter dem Overlay wiederherstellen
+                                    renderer.alles_neu()
+                            elif event.key == pygame.K_F5:
+                                if spiel.speichern(spielstand_datei):
+                                    print(f"Spielstand in {spielstand_datei} gespeichert")
+                            elif event.key == pygame.K_F9 and not abspielen:
+                                if spiel.laden(spielstand_datei):
+                                    renderer.alles_neu()
                             
-                            # Spielsteuerung (nur wenn nicht pausiert und aktiv)
-                            if spiel.spiel_aktiv and not spiel.pause:
+                            # Spielsteuerung (nur wenn nicht pausiert und aktiv, im Autoplay steuert der Computer,
+                            # bei einer Wiedergabe die Aufnahme)
+                            if spiel.spiel_aktiv and not spiel.pause and not autoplay and not abspielen:
                                 if event.key == pygame.K_a:
                                     spiel.tetromino_bewegen(-1, 0)
                                 elif event.key == pygame.K_d:
@@ -186,42 +337,43 @@ def main():
                                     spiel.tetromino_rotieren()
                                 elif event.key == pygame.K_w:
                                     # Hard Drop - lässt das Tetromino sofort fallen
-                                    # Finde zuerst heraus, wie weit das Tetromino fallen kann
-                                    max_drops = ZEILEN  # Maximale mögliche Fallhöhe
-                                    drops = 0
-                                    
-                                    # Speichere die aktuelle Position
-                                    original_y = spiel.aktuelles_tetromino.y
-                                    
-                                    # Simuliere das Fallen, ohne tatsächlich zu bewegen
-                                    while not spiel.kollision_pruefen(0, drops + 1, spiel.aktuelles_tetromino) and drops < max_drops:
-                                        drops += 1
-                                    
-                                    # Wenn wir eine gültige Fallhöhe gefunden haben, setze das Tetromino dorthin
-                                    if drops > 0:
-                                        # Setze direkt auf die finale Position
-                                        spiel.aktuelles_tetromino.y += drops
-                                        
-                                        # Füge das Tetromino dem Spielfeld hinzu
-                                        spiel.tetromino_fixieren()
-                                        
+                                    if spiel.hard_drop():
                                         # Kleine Verzögerung, damit der Spieler sehen kann, was passiert ist
                                         pygame.time.delay(50)
                             
+                    profiler.markieren("ereignisse")
+                    
+                    # Rechenzeit des Frames messen (ohne Eingabe-Verzögerungen und Warten)
+                    arbeit_start = time.perf_counter()
+                    
                     # Spiellogik aktualisieren
                     spiel.update()
+                    if zuschauer:
+                        zuschauer.veroeffentlichen(spiel.engine)
+                    profiler.markieren("update")
                     
-                    # Bildschirm zeichnen
-                    screen.fill(UI_HINTERGRUND)
-                    spiel.spielfeld_zeichnen(screen)
-                    spiel.zeichne_ui(screen)
+                    # Nur geänderte Bereiche zeichnen
+                    renderer.spielfeld_zeichnen(screen)
+                    profiler.markieren("spielfeld")
+                    renderer.ui_zeichnen(screen)
+                    rechtecke = renderer.rechtecke_abholen()
+                    overlay_rect = profiler.overlay_zeichnen(screen)
+                    if overlay_rect:
+                        rechtecke.append(overlay_rect)
+                    profiler.markieren("ui")
                     
-                    # Bildschirm aktualisieren
-                    pygame.display.flip()
+                    # Nur geänderte Bereiche aktualisieren
+                    pygame.display.update(rechtecke)
+                    STARTMESSUNG.erstes_bild()
+                    profiler.markieren("anzeige")
+                    profiler.frame_beenden()
                     
-                    # FPS begrenzen und kleinen Delay einbauen
-                    # Um sicherzustellen, dass die Hauptschleife nicht zu viel CPU-Zeit beansprucht
-                    clock.tick(60)
+                    # Bei knapper Frame-Zeit weniger Partikel erzeugen
+                    spiel.partikel.frame_zeit_melden(time.perf_counter() - arbeit_start)
+                    
+                    # Bildrate begrenzen (MAX_FPS = 0: unbegrenzt bzw. nur durch VSync);
+                    # die Spielgeschwindigkeit hängt nicht davon ab, sie läuft im festen Takt
+                    clock.tick(MAX_FPS)
                     
                 except Exception as e:
                     # Bei Fehlern Traceback ausgeben und weitermachen
@@ -231,17 +383,117 @@ def main():
             
             # Hier endet die Spielschleife, aber die Hauptschleife könnte weiterlaufen
             # (wenn wir zum Hauptmenü zurückkehren wollen)
+            if spiel.aufnahme_speichern():
+                print(f"Aufnahme in {args.aufnahme} gespeichert")
                 
     except Exception as e:
         print(f"Kritischer Fehler: {e}")
         traceback.print_exc()
     finally:
+        if zuschauer:
+            zuschauer.beenden()
+        if bestenliste:
+            bestenliste.beenden()
+        
+        # Profiler-Rohdaten sichern
+        if args.profil_csv:
+            try:
+                anzahl = profiler.csv_schreiben(args.profil_csv)
+                print(f"{anzahl} Frames nach {args.profil_csv} geschrieben")
+            except OSError as e:
+                print(f"Fehler beim Schreiben der Profiler-Daten: {e}")
+        
         # Pygame ordnungsgemäß beenden
         pygame.quit()
         sys.exit()
 
+# Vorgerenderte Grafiken des Startbildschirms (einmal erstellt, bei jedem Aufruf wiederverwendet);
+# die Hintergrundblöcke haben bei jedem Aufruf neue Größen und liegen daher nur im Cache des Aufrufs
+_startbildschirm_grafiken = {}
+
+# Bildrate des Startbildschirms (die Animation ist nicht zeitkritisch)
+STARTBILDSCHIRM_FPS = 30
+
+# Rotationen der Hintergrundblöcke werden auf diese Schrittweite (Grad) gerundet
+BLOCK_WINKEL_SCHRITT = 6
+
+def _startbildschirm_grafik(schluessel, erstellen, *argumente):
+    """Gibt eine Grafik aus dem Cache zurück und erstellt sie beim ersten Zugriff"""
+    grafik = _startbildschirm_grafiken.get(schluessel)
+    if grafik is None:
+        grafik = erstellen(*argumente)
+        _startbildschirm_grafiken[schluessel] = grafik
+    return grafik
+
+def _farbverlauf_erstellen(oben, unten):
+    """Zeichnet den Farbverlauf-Hintergrund"""
+    surface = pygame.Surface((BREITE, HOEHE))
+    for y in range(0, HOEHE, 2):
+        progress = y / HOEHE
+        r = oben[0] + int((unten[0] - oben[0]) * progress)
+        g = oben[1] + int((unten[1] - oben[1]) * progress)
+        b = oben[2] + int((unten[2] - oben[2]) * progress)
+        pygame.draw.line(surface, (r, g, b), (0, y), (BREITE, y), 2)
+    return surface.convert()
+
+def _menue_hintergrund_erstellen():
+    """Erstellt den halbdurchsichtigen Hintergrund für die Menüoptionen"""
+    menu_background = pygame.Surface((BREITE - 200, 310), pygame.SRCALPHA)
+    menu_background.fill((30, 30, 50, 180))
+    return menu_background.convert_alpha()
+
+def _fussbereich_erstellen():
+    """Erstellt den Farbverlauf am unteren Rand"""
+    gradient_surface = pygame.Surface((BREITE, 70), pygame.SRCALPHA)
+    for line in range(70):
+        alpha = int(150 * (line / 70))
+        pygame.draw.line(gradient_surface, (0, 0, 0, alpha), (0, line), (BREITE, line))
+    return gradient_surface.convert_alpha()
+
+def _block_erstellen(größe, farbe):
+    """Zeichnet einen halbdurchsichtigen Hintergrundblock mit 3D-Effekt"""
+    surface = pygame.Surface((größe, größe), pygame.SRCALPHA)
+    try:
+        pygame.draw.rect(surface, (farbe[0], farbe[1], farbe[2], 100), (0, 0, größe, größe))
+        
+        # 3D-Effekt
+        pygame.draw.line(surface, (farbe[0], farbe[1], farbe[2], 150), (0, 0), (größe, 0), 3)
+        pygame.draw.line(surface, (farbe[0], farbe[1], farbe[2], 150), (0, 0), (0, größe), 3)
+        pygame.draw.line(surface, (farbe[0], farbe[1], farbe[2], 50), (größe, 0), (größe, größe), 3)
+        pygame.draw.line(surface, (farbe[0], farbe[1], farbe[2], 50), (0, größe), (größe, größe), 3)
+    except Exception as e:
+        print(f"Fehler beim Zeichnen eines Blocks: {e}, Farbe: {farbe}")
+        # Fallback zu einer sicheren Farbe
+        pygame.draw.rect(surface, (100, 100, 100, 100), (0, 0, größe, größe))
+    return surface
+
+def _block_gedreht(bloecke, größe, farbe, winkel_stufe):
+    """Gibt einen Hintergrundblock in einer gerundeten Winkelstufe zurück
+
+    bloecke ist der Cache des laufenden Startbildschirm-Aufrufs (ungedrehte und gedrehte Blöcke).
+    """
+    schluessel = (größe, farbe, winkel_stufe)
+    gedreht = bloecke.get(schluessel)
+    if gedreht is None:
+        block = bloecke.get((größe, farbe))
+        if block is None:
+            block = bloecke[(größe, farbe)] = _block_erstellen(größe, farbe)
+        gedreht = pygame.transform.rotate(block, winkel_stufe * BLOCK_WINKEL_SCHRITT).convert_alpha()
+        bloecke[schluessel] = gedreht
+    return gedreht
+
+def _titel_skalieren(title_text, title_scale):
+    """Skaliert den Titel für den Pulseffekt"""
+    return pygame.transform.scale(title_text,
+                                  (int(title_text.get_width() * title_scale),
+                                   int(title_text.get_height() * title_scale)))
+
 def zeige_startbildschirm(screen):
-    """Zeigt den Startbildschirm an"""
+    """Zeigt den Startbildschirm an
+
+    Gibt False zum Beenden zurück, START_AUTOPLAY für den Autoplay (K oder Timeout),
+    sonst True.
+    """
     try:
         # Konstanten für das Design
         GRADIENT_TOP = (30, 30, 60)     # Dunkelblau oben
@@ -291,6 +543,7 @@ def zeige_startbildschirm(screen):
                 
             if not isinstance(farbe, (list, tuple)) or len(farbe) != 3:
                 farbe = random.choice(default_colors)
+            farbe = tuple(farbe)  # Als Cache-Schlüssel verwendbar
                 
             geschwindigkeit = random.uniform(1.0, 3.0)
             rotation_speed = random.uniform(-2.0, 2.0)
@@ -299,20 +552,27 @@ def zeige_startbildschirm(screen):
                 'geschwindigkeit': geschwindigkeit, 'rotation': 0,
                 'rotation_speed': rotation_speed
             })
+        
+        # Gedrehte Blöcke nur für diesen Aufruf zwischenspeichern (beim Verlassen freigegeben)
+        gedrehte_bloecke = {}
             
-        # Schriftarten für verschiedene Elemente
-        try:
-            title_font = pygame.font.Font(None, 100)  # Pygame-Standardschriftart
-            subtitle_font = pygame.font.Font(None, 50)
-            menu_font = pygame.font.Font(None, 36)
-            small_font = pygame.font.Font(None, 24)
-        except Exception as e:
-            print(f"Fehler beim Laden der Schriften: {e}")
-            # Fallback auf SysFont
-            title_font = pygame.font.SysFont("Arial", 100, bold=True)
-            subtitle_font = pygame.font.SysFont("Arial", 50, bold=True)
-            menu_font = pygame.font.SysFont("Arial", 36)
-            small_font = pygame.font.SysFont("Arial", 24)
+        # Schriftarten für verschiedene Elemente (Pygame-Standardschriftart, einmal geladen)
+        title_font = schrift(100, name=None)
+        subtitle_font = schrift(50, name=None)
+        menu_font = schrift(36, name=None)
+        small_font = schrift(24, name=None)
+        
+        # Statische Grafiken und Texte (nur beim ersten Aufruf gerendert)
+        hintergrund = _startbildschirm_grafik("farbverlauf", _farbverlauf_erstellen, GRADIENT_TOP, GRADIENT_BOTTOM)
+        menu_background = _startbildschirm_grafik("menue", _menue_hintergrund_erstellen)
+        gradient_surface = _startbildschirm_grafik("fussbereich", _fussbereich_erstellen)
+        title_shadow = TEXT_CACHE.rendern(title_font, "TETRIS", SHADOW_COLOR)
+        title_text = TEXT_CACHE.rendern(title_font, "TETRIS", TITLE_COLOR)
+        title_rect = title_text.get_rect(center=(BREITE // 2, 120))
+        copyright_text = TEXT_CACHE.rendern(small_font, "© 2025 - Tetris-Klon", (180, 180, 180))
+        copyright_rect = copyright_text.get_rect(center=(BREITE // 2, HOEHE - 30))
+        
+        clock = pygame.time.Clock()
         
         # Event-Queue leeren (wichtig!)
         pygame.event.clear()
@@ -356,59 +616,25 @@ def zeige_startbildschirm(screen):
                     print(f"Tastendruck erkannt im Startmenü: {event.key}")
                     if event.key == pygame.K_ESCAPE:
                         return False
+                    elif event.key == pygame.K_k:
+                        return START_AUTOPLAY
                     else:
                         return True
             
             # Zeichne Farbverlauf-Hintergrund
-            for y in range(0, HOEHE, 2):
-                progress = y / HOEHE
-                r = GRADIENT_TOP[0] + int((GRADIENT_BOTTOM[0] - GRADIENT_TOP[0]) * progress)
-                g = GRADIENT_TOP[1] + int((GRADIENT_BOTTOM[1] - GRADIENT_TOP[1]) * progress)
-                b = GRADIENT_TOP[2] + int((GRADIENT_BOTTOM[2] - GRADIENT_TOP[2]) * progress)
-                pygame.draw.line(screen, (r, g, b), (0, y), (BREITE, y), 2)
+            screen.blit(hintergrund, (0, 0))
             
-            # Zeichne animierte Tetris-Blöcke im Hintergrund
+            # Zeichne animierte Tetris-Blöcke im Hintergrund (gedrehte Bilder aus dem Cache)
             for block in tetris_blöcke:
-                # Zeichne einen rotierten Block
-                surface = pygame.Surface((block['größe'], block['größe']), pygame.SRCALPHA)
-                # Sicheres Zeichnen mit Fehlerprüfung für die Farbe
-                try:
-                    farbe = block['farbe']
-                    # Stellen sicher, dass 'farbe' ein RGB-Tupel ist
-                    if isinstance(farbe, (list, tuple)) and len(farbe) == 3:
-                        pygame.draw.rect(surface, (farbe[0], farbe[1], farbe[2], 100), 
-                                      (0, 0, block['größe'], block['größe']))
-                        
-                        # 3D-Effekt
-                        pygame.draw.line(surface, (farbe[0], farbe[1], farbe[2], 150), 
-                                       (0, 0), (block['größe'], 0), 3)
-                        pygame.draw.line(surface, (farbe[0], farbe[1], farbe[2], 150), 
-                                       (0, 0), (0, block['größe']), 3)
-                        pygame.draw.line(surface, (farbe[0], farbe[1], farbe[2], 50), 
-                                       (block['größe'], 0), (block['größe'], block['größe']), 3)
-                        pygame.draw.line(surface, (farbe[0], farbe[1], farbe[2], 50), 
-                                       (0, block['größe']), (block['größe'], block['größe']), 3)
-                except Exception as e:
-                    print(f"Fehler beim Zeichnen eines Blocks: {e}, Farbe: {block['farbe']}")
-                    # Fallback zu einer sicheren Farbe
-                    pygame.draw.rect(surface, (100, 100, 100, 100), 
-                                  (0, 0, block['größe'], block['größe']))
-                
-                # Rotiere den Block
-                rotated_surface = pygame.transform.rotate(surface, block['rotation'])
+                winkel_stufe = round(block['rotation'] / BLOCK_WINKEL_SCHRITT) % (360 // BLOCK_WINKEL_SCHRITT)
+                rotated_surface = _block_gedreht(gedrehte_bloecke, block['größe'], block['farbe'], winkel_stufe)
                 new_rect = rotated_surface.get_rect(center=(block['x'], block['y']))
                 screen.blit(rotated_surface, new_rect.topleft)
             
-            # Titel mit Schatten
-            title_shadow = title_font.render("TETRIS", True, SHADOW_COLOR)
-            title_text = title_font.render("TETRIS", True, TITLE_COLOR)
-            title_rect = title_text.get_rect(center=(BREITE // 2, 120))
-            
-            # Pulsierender Effekt für den Titel
-            title_scale = 1.0 + pulse * 0.05
-            scaled_title = pygame.transform.scale(title_text, 
-                                               (int(title_text.get_width() * title_scale),
-                                                int(title_text.get_height() * title_scale)))
+            # Pulsierender Effekt für den Titel (Skalierung je Pulsstufe zwischengespeichert)
+            pulse_stufe = round(pulse * 50)
+            scaled_title = _startbildschirm_grafik(("titel", pulse_stufe), _titel_skalieren,
+                                                   title_text, 1.0 + pulse_stufe / 50 * 0.05)
             scaled_rect = scaled_title.get_rect(center=(BREITE // 2, 120))
             
             # Zeichne Schatten und dann den Titel
@@ -424,13 +650,11 @@ def zeige_startbildschirm(screen):
                 b = int(UI_AKZENT[2] * (0.7 + 0.3 * pulse))
                 subtitle_color = (r, g, b)
                 
-            subtitle_text = subtitle_font.render("mit Gimmicks", True, subtitle_color)
+            subtitle_text = TEXT_CACHE.rendern(subtitle_font, "mit Gimmicks", subtitle_color)
             subtitle_rect = subtitle_text.get_rect(center=(BREITE // 2, 190))
             screen.blit(subtitle_text, subtitle_rect)
             
             # Hintergrund für Menüoptionen
-            menu_background = pygame.Surface((BREITE - 200, 280), pygame.SRCALPHA)
-            menu_background.fill((30, 30, 50, 180))
             screen.blit(menu_background, (100, 250))
             
             # Steuerungshinweise
@@ -443,6 +667,7 @@ def zeige_startbildschirm(screen):
                 "Leertaste: Tetromino drehen",
                 "P: Pause",
                 "R: Neustart",
+                "K: Computer spielt (Autoplay)",
                 "ESC: Beenden"
             ]
             
@@ -451,10 +676,10 @@ def zeige_startbildschirm(screen):
             for i, text in enumerate(info_texte):
                 # Hervorhebung für den Titel "Steuerung:"
                 if i == 0:
-                    info_render = menu_font.render(text, True, HIGHLIGHT_COLOR)
+                    info_render = TEXT_CACHE.rendern(menu_font, text, HIGHLIGHT_COLOR)
                     y_pos += 10  # Zusätzlicher Abstand vor dem Titel
                 else:
-                    info_render = small_font.render(text, True, UI_TEXT)
+                    info_render = TEXT_CACHE.rendern(small_font, text, UI_TEXT)
                 
                 info_rect = info_render.get_rect(center=(BREITE // 2, y_pos))
                 screen.blit(info_render, info_rect)
@@ -468,32 +693,27 @@ def zeige_startbildschirm(screen):
                 int(255 * (0.7 + 0.3 * pulse)),
                 100
             )
-            start_text = menu_font.render("Drücke eine beliebige Taste zum Starten", True, start_color)
+            start_text = TEXT_CACHE.rendern(menu_font, "Drücke eine beliebige Taste zum Starten", start_color)
             start_rect = start_text.get_rect(center=(BREITE // 2, y_pos))
             screen.blit(start_text, start_rect)
             
             # Unterer Bereich mit Farbverlauf
-            gradient_surface = pygame.Surface((BREITE, 70), pygame.SRCALPHA)
-            for line in range(70):
-                alpha = int(150 * (line / 70))
-                pygame.draw.line(gradient_surface, (0, 0, 0, alpha), (0, line), (BREITE, line))
             screen.blit(gradient_surface, (0, HOEHE - 70))
             
             # Copyright
-            copyright_text = small_font.render("© 2025 - Tetris-Klon", True, (180, 180, 180))
-            copyright_rect = copyright_text.get_rect(center=(BREITE // 2, HOEHE - 30))
             screen.blit(copyright_text, copyright_rect)
             
             # Bildschirm aktualisieren
             pygame.display.flip()
+            STARTMESSUNG.erstes_bild()
             
-            # Kleine Pause, um CPU-Last zu reduzieren
-            pygame.time.delay(30)
+            # Bildrate begrenzen; die restliche Zeit schläft der Prozess
+            clock.tick(STARTBILDSCHIRM_FPS)
         
         # Falls Timeout erreicht wurde
         if time.time() - start_time >= MAX_WAIT_TIME:
             print("Timeout beim Warten auf Tastendruck im Startbildschirm")
-            return True  # Starte trotzdem das Spiel
+            return START_AUTOPLAY  # Ohne Spieler zeigt der Computer, wie es geht
             
         return True
         
@@ -505,7 +725,7 @@ def zeige_startbildschirm(screen):
 if __name__ == "__main__":
     try:
         print("Starte Tetris-Spiel...")
-        main()
+        main(argumente_parsen())
     except Exception as e:
         print(f"Fehler beim Starten des Spiels: {e}")
         traceback.print_exc()
@@ -0,0 +1,158 @@
+"""
+Partikelsystem mit fester Kapazität: alle Partikel liegen in vorab angelegten NumPy-Arrays
+"""
+
+import numpy as np
+import pygame
+from config import MAX_PARTIKEL, MAX_FPS, TICK_RATE, PARTIKEL_QUALITAET, PARTIKEL_AUTO_QUALITAET
+
+# Höchstens so viele Partikel pro Effekt
+MAX_PARTIKEL_PRO_EFFEKT = 20
+
+# Schrumpfen pro Frame und Mindestradius, unter dem ein Partikel verschwindet
+SCHRUMPF_FAKTOR = 0.95
+MIN_RADIUS = 0.5
+
+# Automatische Qualität: Anteil am Frame-Budget, ab dem halbiert bzw. wieder verdoppelt wird
+# (bei unbegrenzter Bildrate, MAX_FPS = 0, gilt der Simulationstakt als Budget)
+FRAME_BUDGET = 1.0 / (MAX_FPS or TICK_RATE)
+LAST_GRENZE_HOCH = 0.75
+LAST_GRENZE_NIEDRIG = 0.4
+MIN_QUALITAET = 0.125
+RUHIGE_FRAMES = 60  # So viele schnelle Frames in Folge, bevor die Qualität wieder steigt
+
+class PartikelPool:
+    """Verwaltet bis zu kapazitaet Partikel als Struct-of-Arrays
+
+    Freie Plätze liegen in einer Freiliste und werden wiederverwendet. Ist der Pool voll,
+    werden die ältesten Partikel überschrieben; zur Laufzeit wird nichts neu angelegt.
+    Gezeichnet wird mit vorgerenderten Kreisen in einem einzigen blits()-Aufruf.
+    """
+
+    def __init__(self, kapazitaet=MAX_PARTIKEL, seed=None, qualitaet=PARTIKEL_QUALITAET,
+                 auto_qualitaet=PARTIKEL_AUTO_QUALITAET):
+        self.kapazitaet = kapazitaet
+        self.rng = np.random.default_rng(seed)
+
+        # Qualität skaliert die Partikelzahl pro Effekt; bei Last wird sie automatisch gesenkt
+        self.max_qualitaet = qualitaet
+        self.qualitaet = qualitaet
+        self.auto_qualitaet = auto_qualitaet
+        self.ruhige_frames = 0
+
+        # Vorgerenderte Kreise je (Farbe, Radius)
+        self.kreise = {}
+
+        # Zustand je Platz
+        self.x = np.zeros(kapazitaet)
+        self.y = np.zeros(kapazitaet)
+        self.x_vel = np.zeros(kapazitaet)
+        self.y_vel = np.zeros(kapazitaet)
+        self.radius = np.zeros(kapazitaet)
+        self.lebensdauer = np.zeros(kapazitaet, dtype=np.int32)
+        self.farbe = np.zeros((kapazitaet, 3), dtype=np.uint8)
+        self.geboren = np.zeros(kapazitaet, dtype=np.int64)  # Erzeugungsnummer für die Verdrängung
+        self.aktiv = np.zeros(kapazitaet, dtype=bool)
+
+        self.frei = list(range(kapazitaet - 1, -1, -1))
+        self.zaehler = 0
+
+    def __len__(self):
+        """Anzahl der lebenden Partikel"""
+        return self.kapazitaet - len(self.frei)
+
+    def leeren(self):
+        """Entfernt alle Partikel"""
+        self.aktiv[:] = False
+        self.frei = list(range(self.kapazitaet - 1, -1, -1))
+
+    def erstellen(self, x, y, farbe, anzahl=10):
+        """Erzeugt anzahl Partikel an der Position, die in zufällige Richtungen auseinanderfliegen"""
+        anzahl = min(round(anzahl * self.qualitaet), MAX_PARTIKEL_PRO_EFFEKT, self.kapazitaet)
+        if anzahl <= 0:
+            return
+
+        # Pool voll: die ältesten Partikel freigeben
+        fehlend = anzahl - len(self.frei)
+        if fehlend > 0:
+            lebend = np.flatnonzero(self.aktiv)
+            aelteste = lebend[np.argsort(self.geboren[lebend], kind="stable")[:fehlend]]
+            self.aktiv[aelteste] = False
+            self.frei.extend(aelteste.tolist())
+
+        plaetze = np.array([self.frei.pop() for _ in range(anzahl)])
+        winkel = self.rng.uniform(0, 2 * np.pi, anzahl)
+        geschwindigkeit = self.rng.uniform(1, 3, anzahl)
+
+        self.x[plaetze] = x
+        self.y[plaetze] = y
+        self.x_vel[plaetze] = geschwindigkeit * np.cos(winkel)
+        self.y_vel[plaetze] = geschwindigkeit * np.sin(winkel)
+        self.radius[plaetze] = self.rng.uniform(2, 5, anzahl)
+        self.lebensdauer[plaetze] = self.rng.integers(20, 41, anzahl)
+        self.farbe[plaetze] = farbe
+        self.geboren[plaetze] = self.zaehler + np.arange(anzahl)
+        self.aktiv[plaetze] = True
+        self.zaehler += anzahl
+
+    def bewegen(self):
+        """Bewegt alle Partikel einen Frame weiter und gibt abgelaufene Plätze frei"""
+        if len(self.frei) == self.kapazitaet:
+            return
+
+        # Freie Plätze werden mitgerechnet; das ist billiger als jedes Mal zu maskieren
+        self.x += self.x_vel
+        self.y += self.y_vel
+        self.radius *= SCHRUMPF_FAKTOR
+        self.lebensdauer -= 1
+
+        abgelaufen = self.aktiv & ((self.lebensdauer <= 0) | (self.radius <= MIN_RADIUS))
+        if abgelaufen.any():
+            self.aktiv &= ~abgelaufen
+            self.frei.extend(np.flatnonzero(abgelaufen).tolist())
+
+    def _lebende(self):
+        """Gibt Positionen, Radien und Farben der lebenden Partikel als Python-Listen zurück"""
+        idx = np.flatnonzero(self.aktiv)
+        return (self.x[idx].astype(int).tolist(), self.y[idx].astype(int).tolist(),
+                self.radius[idx].astype(int).tolist(), self.farbe[idx].tolist())
+
+    def zeichnen(self, screen):
+        """Zeichnet alle lebenden Partikel als Kreise in einem Aufruf"""
+        screen.blits([(self.kreis(farbe, radius), (x - radius, y - radius))
+                      for x, y, radius, farbe in zip(*self._lebende())], False)
+
+    def kreis(self, farbe, radius):
+        """Gibt einen vorgerenderten Kreis zurück (Hintergrund per Colorkey transparent)"""
+        farbe = tuple(farbe)
+        schluessel = (farbe, radius)
+        sprite = self.kreise.get(schluessel)
+        if sprite is None:
+            colorkey = (0, 0, 0) if farbe != (0, 0, 0) else (255, 255, 255)
+            sprite = pygame.Surface((2 * radius + 1, 2 * radius + 1))
+            sprite.fill(colorkey)
+            pygame.draw.circle(sprite, farbe, (radius, radius), radius)
+            sprite.set_colorkey(colorkey, pygame.RLEACCEL)
+            self.kreise[schluessel] = sprite
+        return sprite
+
+    def frame_zeit_melden(self, arbeitszeit):
+        """Passt die Qualität an die Rechenzeit des letzten Frames (ohne Warten) an"""
+        if not self.auto_qualitaet:
+            return
+
+        if arbeitszeit > FRAME_BUDGET * LAST_GRENZE_HOCH:
+            self.qualitaet = max(MIN_QUALITAET, self.qualitaet / 2)
+            self.ruhige_frames = 0
+        elif arbeitszeit < FRAME_BUDGET * LAST_GRENZE_NIEDRIG:
+            self.ruhige_frames += 1
+            if self.ruhige_frames >= RUHIGE_FRAMES:
+                self.qualitaet = min(self.max_qualitaet, self.qualitaet * 2)
+                self.ruhige_frames = 0
+        else:
+            self.ruhige_frames = 0
+
+    def rechtecke(self):
+        """Gibt die Bildschirmbereiche aller lebenden Partikel zurück"""
+        xs, ys, radien, _ = self._lebende()
+        return [pygame.Rect(x - r, y - r, 2 * r + 1, 2 * r + 1) for x, y, r in zip(xs, ys, radien)]
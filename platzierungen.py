@@ -0,0 +1,243 @@
+"""
+Erreichbare Endpositionen eines Tetrominos: Breitensuche über (x, y, Rotation) mit Eingabepfad
+
+Die Suche arbeitet spaltenweise mit Bitmasken: für jede Rotation und x-Position ist eine
+Maske der freien y-Positionen vorberechnet, und alle y einer Spalte werden gemeinsam
+verschoben, fallen gelassen oder gedreht. Die Bewegungsregeln entsprechen denen von
+TetrisEngine.tetromino_bewegen() und tetromino_rotieren() (Drehen mit Verschiebung um ±1/±2).
+"""
+
+from collections import namedtuple
+from config import SPALTEN, ZEILEN
+from engine import AKTION_LINKS, AKTION_RECHTS, AKTION_RUNTER, AKTION_DREHEN
+from formen import FORM_TABELLEN
+
+# Eine erreichbare Endposition; pfad (Tupel von Aktionen) führt vom Start dorthin, danach
+# fixiert AKTION_RUNTER den Stein; zellen sind die absoluten (x, y)-Positionen der Blöcke
+Platzierung = namedtuple("Platzierung", ["x", "y", "rotation", "pfad", "zellen"])
+
+# Verschiebungen beim Drehen in der Reihenfolge, in der die Engine sie probiert
+DREH_VERSCHIEBUNGEN = (0, 1, -1, 2, -2)
+
+# Bit b einer Spaltenmaske steht für y = b - Y_VERSATZ (Formen ragen bis zu 4 Zeilen über den Rand)
+Y_VERSATZ = 5
+Y_BITS = ZEILEN + Y_VERSATZ
+ALLE_Y = (1 << Y_BITS) - 1
+
+# Index i einer Spaltenliste steht für x = i - X_VERSATZ
+X_VERSATZ = 4
+X_ANZAHL = SPALTEN + X_VERSATZ
+
+# Das ganze Spielfeld liegt spaltenweise in einer Zahl: Spur c (je SPUR_BITS Bits) enthält die
+# y-Maske von Spalte c - X_VERSATZ. Wände links/rechts sind vollständig belegte Spuren, der
+# Boden sind die Bits oberhalb von ALLE_Y. So gilt eine Verschiebung für alle Spalten zugleich.
+SPUR_BITS = 32
+_SPUR = (1 << SPUR_BITS) - 1
+_WAENDE = sum(_SPUR << (spur * SPUR_BITS) for spur in range(2 * X_VERSATZ + SPALTEN)
+              if not X_VERSATZ <= spur < X_VERSATZ + SPALTEN)
+_BODEN = sum((_SPUR & ~ALLE_Y) << ((x + X_VERSATZ) * SPUR_BITS) for x in range(SPALTEN))
+
+# Reihenmaske -> Bit 0 jeder belegten Spur
+_VERTEILT = [sum(1 << ((x + X_VERSATZ) * SPUR_BITS) for x in range(SPALTEN) if maske >> x & 1)
+             for maske in range(1 << SPALTEN)]
+
+# Umriss jeder Rotation relativ zu ihrer Begrenzungsbox (gleich bei symmetrischen Rotationen)
+_UMRISSE = [[frozenset((dx - daten.box[0], dy - daten.box[1]) for dx, dy in daten.zellen)
+             for daten in tabellen] for tabellen in FORM_TABELLEN]
+
+# Formen, bei denen zwei Rotationen denselben Umriss haben und Endpositionen doppelt vorkommen können
+_SYMMETRISCH = [len(set(umrisse)) < len(umrisse) for umrisse in _UMRISSE]
+
+
+def _feld_packen(reihen):
+    """Überträgt die Reihenmasken in die spaltenweise Darstellung mit Wänden und Boden"""
+    feld = _WAENDE | _BODEN
+    for y, reihe in enumerate(reihen):
+        if reihe:
+            feld |= _VERTEILT[reihe] << (y + Y_VERSATZ)
+    return feld
+
+
+def _freie_positionen(feld, daten):
+    """Gibt je x-Position die Maske der y zurück, an denen die Form nicht kollidiert (0 an den Wänden)"""
+    belegt = 0
+    for dx, dy in daten.zellen:
+        belegt |= feld >> (dx * SPUR_BITS + dy)
+    return [~(belegt >> (i * SPUR_BITS)) & ALLE_Y for i in range(X_ANZAHL)]
+
+
+def platzierungen(spielfeld, form_idx, rotation=0, x=SPALTEN // 2 - 2, y=0, mit_pfad=True):
+    """Gibt alle Endpositionen zurück, die ein Tetromino von (x, y, rotation) aus erreichen kann
+
+    Endpositionen mit gleichen Zellen (z.B. symmetrische Rotationen) werden nur einmal geliefert,
+    jeweils mit dem zuerst gefundenen Pfad. Kollidiert schon die Startposition, ist die Liste leer.
+    """
+    return reihen_platzierungen(spielfeld.reihen, form_idx, rotation, x, y, mit_pfad)
+
+
+def reihen_platzierungen(reihen, form_idx, rotation=0, x=SPALTEN // 2 - 2, y=0, mit_pfad=True):
+    """Wie platzierungen(), aber auf einer Liste von Reihenmasken; mit_pfad=False spart die Pfade (pfad=None)"""
+    tabellen = FORM_TABELLEN[form_idx]
+    feld = _feld_packen(reihen)
+    frei = [_freie_positionen(feld, daten) for daten in tabellen]
+    herkunft = {} if mit_pfad else None
+    erreicht = _suchen(frei, rotation, x, y, herkunft)
+    if erreicht is None:
+        return []
+
+    ergebnisse = []
+    start = (rotation, x + X_VERSATZ, 1 << (y + Y_VERSATZ))
+    pfade = {}
+    for r, i, bit, px, py in _ruhende_positionen(form_idx, frei, erreicht):
+        pfad = _pfad_rekonstruieren(herkunft, erreicht, r, i, bit, start, pfade) if mit_pfad else None
+        zellen = tuple((px + dx, py + dy) for dx, dy in tabellen[r].zellen)
+        ergebnisse.append(Platzierung(px, py, r, pfad, zellen))
+    return ergebnisse
+
+
+def endpositionen(reihen, form_idx, rotation=0, x=SPALTEN // 2 - 2, y=0):
+    """Gibt nur (rotation, x, y) der erreichbaren Endpositionen zurück (schnellste Variante für Suchen)"""
+    feld = _feld_packen(reihen)
+    frei = [_freie_positionen(feld, daten) for daten in FORM_TABELLEN[form_idx]]
+    erreicht = _suchen(frei, rotation, x, y)
+    if erreicht is None:
+        return []
+    return [(r, px, py) for r, _, _, px, py in _ruhende_positionen(form_idx, frei, erreicht)]
+
+
+def _suchen(frei, rotation, x, y, herkunft=None):
+    """Breitensuche über alle Spalten (rotation, x); gibt je Spalte die Maske der erreichten y zurück
+
+    Mit herkunft (dict) wird je Spalte festgehalten, welche Bits über welche Aktion woher kamen:
+    herkunft[(r, i)] = [(bits, aktion, (r, i) davor), ...]. None, wenn der Start kollidiert.
+    """
+    anzahl_rotationen = len(frei)
+    start_i = x + X_VERSATZ
+    if not (0 <= start_i < X_ANZAHL and 0 <= y + Y_VERSATZ < Y_BITS):
+        return None
+    start_bit = 1 << (y + Y_VERSATZ)
+    if not frei[rotation][start_i] & start_bit:
+        return None
+
+    erreicht = [[0] * X_ANZAHL for _ in range(anzahl_rotationen)]
+    erreicht[rotation][start_i] = start_bit
+
+    # Noch nicht weiterverfolgte Bits je Spalte; kommen vorher weitere hinzu, werden sie zusammengefasst
+    offen = {(rotation, start_i): start_bit}
+
+    while offen:
+        (r, i), neu = offen.popitem()
+        frei_r = frei[r]
+        erreicht_r = erreicht[r]
+        ziele = []
+
+        # Fallen lassen: neu innerhalb der freien Positionen nach unten (höhere y) ausbreiten, mit
+        # Schritten von 1, 2, 4, ... Bits; die Herkunft ist implizit die Position darüber in derselben Spalte
+        durchlass = frei_r[i]
+        gefallen = neu | durchlass & (neu << 1)
+        durchlass &= durchlass << 1
+        gefallen |= durchlass & (gefallen << 2)
+        durchlass &= durchlass << 2
+        gefallen |= durchlass & (gefallen << 4)
+        durchlass &= durchlass << 4
+        gefallen |= durchlass & (gefallen << 8)
+        durchlass &= durchlass << 8
+        gefallen |= durchlass & (gefallen << 16)
+        gefallen &= ~erreicht_r[i]
+        if gefallen:
+            erreicht_r[i] |= gefallen
+            neu |= gefallen
+
+        # Seitlich verschieben
+        if i > 0:
+            ziele.append((r, i - 1, neu & frei_r[i - 1], AKTION_LINKS))
+        if i + 1 < X_ANZAHL:
+            ziele.append((r, i + 1, neu & frei_r[i + 1], AKTION_RECHTS))
+
+        # Drehen: je y gilt die erste Verschiebung, an der die neue Rotation frei ist
+        if anzahl_rotationen > 1:
+            ziel = (r + 1) % anzahl_rotationen
+            frei_ziel = frei[ziel]
+            rest = neu
+            for dx in DREH_VERSCHIEBUNGEN:
+                j = i + dx
+                if 0 <= j < X_ANZAHL and rest & frei_ziel[j]:
+                    moeglich = rest & frei_ziel[j]
+                    rest &= ~moeglich
+                    ziele.append((ziel, j, moeglich, AKTION_DREHEN))
+                    if not rest:
+                        break
+
+        for zr, zi, bits, aktion in ziele:
+            bits &= ~erreicht[zr][zi]
+            if bits:
+                erreicht[zr][zi] |= bits
+                if herkunft is not None:
+                    herkunft.setdefault((zr, zi), []).append((bits, aktion, (r, i)))
+                offen[(zr, zi)] = offen.get((zr, zi), 0) | bits
+    return erreicht
+
+
+def _ruhende_positionen(form_idx, frei, erreicht):
+    """Liefert (r, i, bit, x, y) aller erreichten Positionen, unter denen es nicht weitergeht
+
+    Positionen mit gleichem Umriss an gleicher Stelle belegen dieselben Zellen und kommen nur einmal.
+    """
+    tabellen = FORM_TABELLEN[form_idx]
+    gesehen = set() if _SYMMETRISCH[form_idx] else None
+    for r, erreicht_r in enumerate(erreicht):
+        box = tabellen[r].box
+        umriss = _UMRISSE[form_idx][r]
+        frei_r = frei[r]
+        for i, bits in enumerate(erreicht_r):
+            ruhend = bits & ~(frei_r[i] >> 1)
+            while ruhend:
+                bit = ruhend & -ruhend
+                ruhend ^= bit
+                px, py = i - X_VERSATZ, bit.bit_length() - 1 - Y_VERSATZ
+                if gesehen is not None:
+                    schluessel = (umriss, px + box[0], py + box[1])
+                    if schluessel in gesehen:
+                        continue
+                    gesehen.add(schluessel)
+                yield r, i, bit, px, py
+
+
+def _pfad_rekonstruieren(herkunft, erreicht, r, i, bit, start, pfade):
+    """Verfolgt die Herkunft einer Position bis zum Start zurück und gibt die Aktionen zurück
+
+    Solange die Position darüber erreicht ist, geht es in derselben Spalte nach oben: der Pfad
+    richtet den Stein so früh wie möglich aus und lässt ihn danach fallen, wie es ein Spieler
+    vor einem Hard Drop tut. pfade merkt sich bereits bekannte Teilpfade, da sich viele
+    Endpositionen den Anfang teilen.
+    """
+    zustand = (r, i, bit)
+    pfad = pfade.get(zustand)
+    if pfad is not None:
+        return pfad
+    if zustand == start:
+        return ()
+
+    erreicht_ri = erreicht[r][i]
+    if erreicht_ri & (bit >> 1):
+        oben = bit >> 1
+        while erreicht_ri & (oben >> 1):
+            oben >>= 1
+        fall = bit.bit_length() - oben.bit_length()
+        pfad = _pfad_rekonstruieren(herkunft, erreicht, r, i, oben, start, pfade) + (AKTION_RUNTER,) * fall
+    else:
+        for bits, aktion, quelle in herkunft[(r, i)]:
+            if bits & bit:
+                break
+        pfad = _pfad_rekonstruieren(herkunft, erreicht, quelle[0], quelle[1], bit, start, pfade) + (aktion,)
+    pfade[zustand] = pfad
+    return pfad
+
+
+def platzierungen_fuer(engine, tetromino=None):
+    """Gibt die Endpositionen des (aktuellen) Tetrominos einer Engine zurück"""
+    tetromino = tetromino or engine.aktuelles_tetromino
+    if tetromino is None:
+        return []
+    return platzierungen(engine.spielfeld, tetromino.form_idx, tetromino.aktuelle_rotation,
+                         tetromino.x, tetromino.y)
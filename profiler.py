@@ -0,0 +1,183 @@
+"""
+Frame-Profiler: misst die Phasen jedes Frames in Ringpuffern und zeigt sie als Overlay an
+"""
+
+import csv
+import time
+import numpy as np
+import pygame
+from config import MAX_FPS, TICK_RATE, UI_TEXT, UI_AKZENT, SCHWARZ
+from texte import text_rendern
+
+# Gemessene Phasen eines Frames in ihrer Reihenfolge
+PHASEN = ("ereignisse", "update", "spielfeld", "ui", "anzeige")
+
+# Anzahl gespeicherter Frames pro Ringpuffer
+PROFIL_FRAMES = 600
+
+# Overlay: Position/Größe (links oben, neben dem Spielfeld) und Aktualisierung der Zahlen
+OVERLAY_RECT = pygame.Rect(5, 5, 235, 215)
+OVERLAY_HINTERGRUND = (15, 15, 25)
+OVERLAY_TEXT_INTERVALL = 30  # Frames zwischen zwei Aktualisierungen der Perzentile
+GRAPH_HOEHE = 60
+GRAPH_MAX_MS = 50.0
+
+class Startmessung:
+    """Hält fest, wie lange der Programmstart bis zu einzelnen Phasen braucht (Importe, Initialisierung, erstes Bild)
+
+    Jede Phase zählt nur beim ersten markieren(), der Aufruf darf also in Schleifen stehen.
+    start ist der Zeitpunkt (time.perf_counter), ab dem gemessen wird.
+    """
+
+    def __init__(self, start=None, uhr=time.perf_counter):
+        self.uhr = uhr
+        self.start = uhr() if start is None else start
+        self.phasen = {}  # name -> Sekunden seit start, in der Reihenfolge der Phasen
+        self.ausgeben = False  # Bericht beim ersten Bild ausgeben
+
+    def markieren(self, name):
+        """Hält das Ende einer Phase fest; gibt False zurück, wenn sie schon gemessen wurde"""
+        if name in self.phasen:
+            return False
+        self.phasen[name] = self.uhr() - self.start
+        return True
+
+    def erstes_bild(self):
+        """Nach dem ersten angezeigten Bild aufrufen; gibt den Bericht einmalig aus, wenn gewünscht"""
+        if self.markieren("erstes Bild") and self.ausgeben:
+            print(self.bericht())
+
+    def bericht(self):
+        """Dauer jeder Phase und Gesamtzeit als Text"""
+        teile = []
+        vorher = 0.0
+        for name, zeit in self.phasen.items():
+            teile.append(f"{name} {(zeit - vorher) * 1000:.0f} ms")
+            vorher = zeit
+        return f"Startzeit: {', '.join(teile)} (gesamt {vorher * 1000:.0f} ms)"
+
+class FrameProfiler:
+    """Nimmt pro Frame die Dauer jeder Phase sowie den Abstand zum vorigen Frame auf
+
+    Ablauf pro Frame: frame_beginnen(), nach jeder Phase markieren(name), am Ende
+    frame_beenden(). Die Werte liegen in Millisekunden in einem Ringpuffer.
+    """
+
+    def __init__(self, groesse=PROFIL_FRAMES, uhr=time.perf_counter):
+        self.groesse = groesse
+        self.uhr = uhr
+        self.spalten = PHASEN + ("frame",)
+        self.index = {name: i for i, name in enumerate(self.spalten)}
+        self.werte = np.zeros((groesse, len(self.spalten)))
+        self.anzahl = 0  # Insgesamt aufgenommene Frames
+        self.aktuell = np.zeros(len(self.spalten))
+        self.letzter_start = None
+        self.letzte_marke = None
+
+        # Alle Rohdaten für den CSV-Export (nur wenn gewünscht, der Ringpuffer überschreibt)
+        self.rohdaten = None
+
+        # Overlay
+        self.overlay_aktiv = False
+        self._overlay_text = None
+
+    def rohdaten_sammeln(self):
+        """Hebt zusätzlich alle Frames für den CSV-Export auf"""
+        if self.rohdaten is None:
+            self.rohdaten = []
+
+    def frame_beginnen(self):
+        """Startet die Messung eines neuen Frames"""
+        jetzt = self.uhr()
+        self.aktuell[:] = 0.0
+        if self.letzter_start is not None:
+            self.aktuell[-1] = (jetzt - self.letzter_start) * 1000.0
+        self.letzter_start = jetzt
+        self.letzte_marke = jetzt
+
+    def markieren(self, phase):
+        """Schließt die angegebene Phase ab (Zeit seit der letzten Marke)"""
+        jetzt = self.uhr()
+        self.aktuell[self.index[phase]] += (jetzt - self.letzte_marke) * 1000.0
+        self.letzte_marke = jetzt
+
+    def frame_beenden(self):
+        """Schreibt den Frame in den Ringpuffer"""
+        self.werte[self.anzahl % self.groesse] = self.aktuell
+        self.anzahl += 1
+        if self.rohdaten is not None:
+            self.rohdaten.append(self.aktuell.tolist())
+
+    def puffer(self):
+        """Gibt die gespeicherten Frames in zeitlicher Reihenfolge zurück"""
+        if self.anzahl < self.groesse:
+            return self.werte[:self.anzahl]
+        start = self.anzahl % self.groesse
+        return np.concatenate((self.werte[start:], self.werte[:start]))
+
+    def perzentile(self):
+        """Gibt je Spalte (p50, p95, p99) in Millisekunden zurück"""
+        werte = self.puffer()
+        if len(werte) == 0:
+            return {}
+        p = np.percentile(werte, (50, 95, 99), axis=0)
+        return {name: tuple(p[:, i]) for i, name in enumerate(self.spalten)}
+
+    def csv_schreiben(self, pfad):
+        """Schreibt alle Rohdaten (oder den Ringpuffer) als CSV mit einer Zeile pro Frame"""
+        zeilen = self.rohdaten if self.rohdaten is not None else self.puffer().tolist()
+        erster = self.anzahl - len(zeilen)
+        with open(pfad, "w", newline="") as datei:
+            schreiber = csv.writer(datei)
+            schreiber.writerow(("frame",) + tuple(f"{name}_ms" for name in self.spalten))
+            for i, zeile in enumerate(zeilen):
+                schreiber.writerow([erster + i] + [f"{wert:.4f}" for wert in zeile])
+        return len(zeilen)
+
+    def overlay_umschalten(self):
+        """Blendet das Overlay ein oder aus"""
+        self.overlay_aktiv = not self.overlay_aktiv
+        self._overlay_text = None
+        return self.overlay_aktiv
+
+    def overlay_zeichnen(self, screen):
+        """Zeichnet Perzentile je Phase und einen Graphen der Frame-Zeiten; gibt den Bereich zurück"""
+        if not self.overlay_aktiv:
+            return None
+
+        # Der Hintergrund ist deckend, damit sich das Overlay ohne Neuzeichnen darunter überschreibt
+        screen.fill(OVERLAY_HINTERGRUND, OVERLAY_RECT)
+        pygame.draw.rect(screen, UI_AKZENT, OVERLAY_RECT, 1)
+
+        if self._overlay_text is None or self.anzahl % OVERLAY_TEXT_INTERVALL == 0:
+            self._overlay_text = self._text_zeilen()
+        y = OVERLAY_RECT.y + 6
+        for text, farbe in self._overlay_text:
+            screen.blit(text_rendern(text, farbe, 16, name=None), (OVERLAY_RECT.x + 6, y))
+            y += 16
+
+        self._graph_zeichnen(screen, pygame.Rect(OVERLAY_RECT.x + 6, OVERLAY_RECT.bottom - GRAPH_HOEHE - 6,
+                                                 OVERLAY_RECT.width - 12, GRAPH_HOEHE))
+        return OVERLAY_RECT
+
+    def _text_zeilen(self):
+        """Erstellt die Textzeilen des Overlays aus den aktuellen Perzentilen"""
+        zeilen = [(f"{'Phase':<10} {'p50':>6} {'p95':>6} {'p99':>6}  ms", UI_AKZENT)]
+        for name, (p50, p95, p99) in self.perzentile().items():
+            zeilen.append((f"{name:<10} {p50:6.2f} {p95:6.2f} {p99:6.2f}", UI_TEXT))
+        return zeilen
+
+    def _graph_zeichnen(self, screen, rect):
+        """Zeichnet die letzten Frame-Abstände als Linie mit Budget-Markierung"""
+        pygame.draw.rect(screen, SCHWARZ, rect)
+        werte = self.puffer()[-rect.width:, -1]
+
+        # Budget der Zielbildrate (bzw. des Simulationstakts bei unbegrenzter Bildrate)
+        budget = 1000.0 / (MAX_FPS or TICK_RATE)
+        budget_y = rect.bottom - 1 - int(min(budget, GRAPH_MAX_MS) / GRAPH_MAX_MS * (rect.height - 1))
+        pygame.draw.line(screen, (120, 60, 60), (rect.left, budget_y), (rect.right - 1, budget_y))
+
+        if len(werte) > 1:
+            hoehen = np.minimum(werte, GRAPH_MAX_MS) / GRAPH_MAX_MS * (rect.height - 1)
+            punkte = [(rect.left + i, rect.bottom - 1 - int(h)) for i, h in enumerate(hoehen.tolist())]
+            pygame.draw.lines(screen, (100, 255, 200), False, punkte)
@@ -0,0 +1,201 @@
+"""
+Renderer mit Dirty-Rectangles: zeichnet pro Frame nur die Bereiche neu, die sich geändert haben
+"""
+
+import pygame
+from config import BREITE, HOEHE, SPALTEN, ZEILEN, BLOCK_GROESSE, SPIELFELD_X, SPIELFELD_Y, SCHWARZ, UI_HINTERGRUND
+from formen import KEINE_ZELLEN
+from game import FELD_RECT, RAHMEN_RECT, VORSCHAU_RECT
+
+# Rechter Bereich mit Vorschaubox (inkl. Titel) und Infoanzeige; beide überlappen sich
+SEITENLEISTE_RECT = pygame.Rect(VORSCHAU_RECT.x, VORSCHAU_RECT.y - 40,
+                                BREITE - VORSCHAU_RECT.x, HOEHE - VORSCHAU_RECT.y + 40)
+
+
+def _zellen_rect(spalte, zeile, anzahl=1):
+    """Bildschirmbereich von anzahl nebeneinanderliegenden Zellen"""
+    return pygame.Rect(SPIELFELD_X + spalte * BLOCK_GROESSE, SPIELFELD_Y + zeile * BLOCK_GROESSE,
+                       anzahl * BLOCK_GROESSE, BLOCK_GROESSE)
+
+
+def _zellen_in(rect):
+    """Gibt alle Spielfeldzellen zurück, die ein Bildschirmbereich berührt"""
+    rect = rect.clip(FELD_RECT)
+    if not rect.width or not rect.height:
+        return set()
+    spalte_von = (rect.left - SPIELFELD_X) // BLOCK_GROESSE
+    spalte_bis = (rect.right - 1 - SPIELFELD_X) // BLOCK_GROESSE
+    zeile_von = (rect.top - SPIELFELD_Y) // BLOCK_GROESSE
+    zeile_bis = (rect.bottom - 1 - SPIELFELD_Y) // BLOCK_GROESSE
+    return {(x, y) for y in range(zeile_von, zeile_bis + 1) for x in range(spalte_von, spalte_bis + 1)}
+
+
+class SpielRenderer:
+    """Zeichnet ein TetrisSpiel inkrementell und sammelt die geänderten Bildschirmbereiche
+
+    Pro Frame werden spielfeld_zeichnen() und ui_zeichnen() aufgerufen und die Bereiche aus
+    rechtecke_abholen() an pygame.display.update() übergeben.
+    """
+
+    def __init__(self, spiel, hintergrund=UI_HINTERGRUND):
+        self.spiel = spiel
+        self.hintergrund = hintergrund
+        self.rechtecke = []
+        self.alles_neu()
+
+    def alles_neu(self):
+        """Erzwingt beim nächsten Frame ein vollständiges Neuzeichnen (z.B. nach einem Dialog)"""
+        self._voll = True
+        self._seitenleiste_neu = True
+        self._reihen = [None] * ZEILEN
+        self._stein = None
+        self._geist = (KEINE_ZELLEN, None)
+        self._vorschau = None
+        self._info = None
+        self._overlay = None
+        self._partikel = []
+
+    def rechtecke_abholen(self):
+        """Gibt die seit dem letzten Aufruf gezeichneten Bereiche zurück"""
+        rechtecke = self.rechtecke
+        self.rechtecke = []
+        return rechtecke
+
+    def spielfeld_zeichnen(self, screen):
+        """Zeichnet Spielfeld, Tetrominos, Vorschau und Partikel, soweit sie sich geändert haben"""
+        spiel = self.spiel
+        tetromino = spiel.aktuelles_tetromino
+        naechstes = spiel.naechstes_tetromino
+
+        # Aktueller Stand aller Bildbestandteile
+        stein = None
+        if tetromino and spiel.spiel_aktiv:
+            stein = (tetromino.zellen(), tetromino.farbe, tetromino.ist_spezial)
+        geist = (spiel.geist_zellen(), tetromino.farbe if tetromino else None)
+        vorschau = None
+        if naechstes:
+            vorschau = (naechstes.form_idx, naechstes.farbe, naechstes.ist_spezial, naechstes.gimmick_effekt)
+        info = spiel.info_stand()
+        overlay = (spiel.spiel_aktiv, spiel.pause)
+
+        alte_partikel = self._partikel
+        neue_partikel = spiel.partikel_rechtecke()
+
+        if overlay != self._overlay:
+            self._voll = True
+
+        if not self._voll:
+            schmutzig = self._geaenderte_zellen()
+
+            # Spezialsteine glühen und ändern sich daher in jedem Frame
+            if stein != self._stein or (stein and stein[2]):
+                for stand in (self._stein, stein):
+                    if stand:
+                        schmutzig |= stand[0]
+            if geist != self._geist:
+                schmutzig |= self._geist[0] | geist[0]
+
+            seitenleiste = vorschau != self._vorschau or info != self._info
+            rahmen = False
+            for rect in alte_partikel:
+                schmutzig |= _zellen_in(rect)
+                if rect.colliderect(SEITENLEISTE_RECT):
+                    seitenleiste = True
+                if rect.colliderect(RAHMEN_RECT) and not FELD_RECT.contains(rect):
+                    rahmen = True
+
+            # Game Over und Pause liegen über dem Spielfeld: dann lieber komplett neu zeichnen
+            if not (spiel.spiel_aktiv and not spiel.pause) and (schmutzig or seitenleiste or alte_partikel):
+                self._voll = True
+        else:
+            self._geaenderte_zellen()
+
+        if self._voll:
+            self._alles_zeichnen(screen)
+            self.rechtecke = [screen.get_rect()]
+            seitenleiste = True
+        else:
+            # Alte Partikel übermalen, danach die betroffenen Bereiche wiederherstellen
+            for rect in alte_partikel:
+                screen.fill(self.hintergrund, rect)
+            if seitenleiste:
+                screen.fill(self.hintergrund, SEITENLEISTE_RECT)
+                spiel.vorschau_zeichnen(screen)
+                self.rechtecke.append(SEITENLEISTE_RECT.copy())
+            if rahmen:
+                pygame.draw.rect(screen, SCHWARZ, RAHMEN_RECT, 2)
+                self.rechtecke.append(RAHMEN_RECT.copy())
+
+            self._zellen_zeichnen(screen, schmutzig)
+            if schmutzig:
+                spiel.geist_zeichnen(screen, schmutzig)
+            if stein and schmutzig & stein[0]:
+                tetromino.zeichnen(screen, SPIELFELD_X, SPIELFELD_Y)
+
+            spiel.partikel_zeichnen(screen)
+            self.rechtecke.extend(alte_partikel)
+            self.rechtecke.extend(neue_partikel)
+
+        self._stein = stein
+        self._geist = geist
+        self._vorschau = vorschau
+        self._info = info
+        self._overlay = overlay
+        self._partikel = neue_partikel
+        self._seitenleiste_neu = seitenleiste
+
+    def ui_zeichnen(self, screen):
+        """Zeichnet die Infoanzeige (und bei Vollbild-Updates die Overlays)"""
+        if self._voll:
+            self.spiel.zeichne_ui(screen)
+            self._voll = False
+        elif self._seitenleiste_neu:
+            self.spiel.info_zeichnen(screen)
+        self._seitenleiste_neu = False
+
+    def _alles_zeichnen(self, screen):
+        """Zeichnet das komplette Spielfeld inkl. Hintergrund"""
+        spiel = self.spiel
+        screen.fill(self.hintergrund)
+        spiel.rahmen_zeichnen(screen)
+        for zeile in range(ZEILEN):
+            for spalte in range(SPALTEN):
+                spiel.zelle_zeichnen(screen, spalte, zeile)
+        spiel.geist_zeichnen(screen)
+        if spiel.aktuelles_tetromino and spiel.spiel_aktiv:
+            spiel.aktuelles_tetromino.zeichnen(screen, SPIELFELD_X, SPIELFELD_Y)
+        spiel.vorschau_zeichnen(screen)
+        spiel.partikel_zeichnen(screen)
+
+    def _geaenderte_zellen(self):
+        """Vergleicht das Spielfeld reihenweise mit dem letzten Frame und merkt sich den Stand"""
+        spiel = self.spiel
+        werte, farben, gimmicks = spiel.spielfeld.werte, spiel.spielfeld_farben, spiel.spielfeld_gimmicks
+        geaendert = set()
+        for y in range(ZEILEN):
+            alt = self._reihen[y]
+            if alt and alt[0] == werte[y] and alt[1] == farben[y] and alt[2] == gimmicks[y]:
+                continue
+            for x in range(SPALTEN):
+                if not alt or alt[0][x] != werte[y][x] or alt[1][x] != farben[y][x] or alt[2][x] != gimmicks[y][x]:
+                    geaendert.add((x, y))
+            self._reihen[y] = (list(werte[y]), list(farben[y]), list(gimmicks[y]))
+        return geaendert
+
+    def _zellen_zeichnen(self, screen, zellen):
+        """Zeichnet die angegebenen Zellen und fasst sie reihenweise zu Rechtecken zusammen"""
+        if not zellen:
+            return
+        for spalte, zeile in zellen:
+            if 0 <= zeile < ZEILEN and 0 <= spalte < SPALTEN:
+                self.spiel.zelle_zeichnen(screen, spalte, zeile)
+
+        for zeile in range(ZEILEN):
+            start = None
+            for spalte in range(SPALTEN + 1):
+                drin = spalte < SPALTEN and (spalte, zeile) in zellen
+                if drin and start is None:
+                    start = spalte
+                elif not drin and start is not None:
+                    self.rechtecke.append(_zellen_rect(start, zeile, spalte - start))
+                    start = None
@@ -0,0 +1,297 @@
+"""
+Aufzeichnungen: ein Spiel als Seed plus Eingabeprotokoll mit Zeitstempeln
+
+Formen und Gimmicks kommen aus dem Zufallsgenerator der Engine (engine.rng), Zeit vergeht nur
+in festen Ticks. Ein Spiel ist damit durch Seed, Regeln und die Liste (Tick, Aktion) seiner
+Eingaben vollständig bestimmt; abgespielt wird es wieder über TetrisEngine.step() und tick().
+
+Damit man in langen Aufnahmen springen kann, ohne alles von vorn zu simulieren, wird alle
+REPLAY_KEYFRAME_STEINE fixierten Steine ein vollständiger Spielstand (spielstand.kodieren)
+abgelegt. springen() setzt am nächstgelegenen Keyframe davor auf und simuliert nur den Rest.
+Keyframes entstehen immer am Ende eines Ticks, also vor den Eingaben des nächsten: genau der
+Stand, den auch das lineare Abspielen bei diesem Tick hat.
+
+Dateiformat (little-endian):
+    Kopf:      KOPF (Kennung b"TRPL", Formatversion, Seed, End-Tick, Anzahl Eingaben,
+               Anzahl Keyframes, Länge der Regeln), danach die Regeln als JSON
+    Eingaben:  je EINGABE (Tick, Index in AKTIONEN)
+    Keyframes: je KEYFRAME (Tick, Anzahl bis dahin ausgeführter Eingaben, Steine, Länge),
+               danach der Spielstand
+
+Beispiel:
+    python main.py --aufnahme spiel.trpl
+    python replay.py spiel.trpl --springe 36000
+    python main.py --replay spiel.trpl
+"""
+
+import argparse
+import json
+import os
+import struct
+import time
+from array import array
+from bisect import bisect_right
+from collections import namedtuple
+from config import SPALTEN, REPLAY_KEYFRAME_STEINE
+from engine import TetrisEngine, AKTIONEN
+from formen import Stein
+from zeitschritt import FesterZeitschritt, TICK_DAUER
+import spielstand
+
+KENNUNG = b"TRPL"
+FORMAT_VERSION = 1
+
+# kennung, version, seed, ende, anzahl eingaben, anzahl keyframes, länge der regeln
+KOPF = struct.Struct("<4sHQIIIH")
+# tick, aktion
+EINGABE = struct.Struct("<IB")
+# tick, eingabe, steine, länge des spielstands
+KEYFRAME = struct.Struct("<IIII")
+
+_AKTION_INDEX = {aktion: i for i, aktion in enumerate(AKTIONEN)}
+
+Keyframe = namedtuple("Keyframe", ["tick", "eingabe", "steine", "daten"])
+# ticks und aktionen sind parallel: Eingabe i ist AKTIONEN[aktionen[i]] vor Tick ticks[i]
+Aufnahme = namedtuple("Aufnahme", ["seed", "regeln", "ende", "ticks", "aktionen", "keyframes"])
+
+
+class Aufzeichnung:
+    """Schreibt die Eingaben einer Engine mit; die Engine meldet sich über engine.aufzeichnung"""
+
+    def __init__(self, engine, keyframe_steine=REPLAY_KEYFRAME_STEINE):
+        """Beginnt beim aktuellen Zustand der Engine (auch mitten im Spiel, z.B. nach dem Fortsetzen)"""
+        self.engine = engine
+        self.keyframe_steine = keyframe_steine
+        self.seed = engine.seed
+        self.regeln = dict(engine.regeln)
+        self.ticks = array("I")
+        self.aktionen = bytearray()
+        self.keyframes = []
+        self.keyframe_faellig = False
+        self.keyframe_setzen()
+        engine.aufzeichnung = self
+
+    def eingabe(self, aktion):
+        """Wird von TetrisEngine.step() vor jeder Aktion aufgerufen"""
+        index = _AKTION_INDEX.get(aktion)
+        if index is None:
+            return  # step() lehnt die Aktion gleich mit ValueError ab
+        self.ticks.append(self.engine.ticks)
+        self.aktionen.append(index)
+
+    def stein_fixiert(self):
+        """Wird nach jedem fixierten Stein aufgerufen; merkt alle keyframe_steine Steine einen Keyframe vor
+
+        Fixiert wird oft mitten in den Eingaben eines Ticks (z.B. per Hard Drop). Abgelegt wird
+        der Keyframe daher erst in tick_beendet(), damit er auf einer Tick-Grenze liegt.
+        """
+        if self.engine.steine - self.keyframes[-1].steine >= self.keyframe_steine:
+            self.keyframe_faellig = True
+
+    def tick_beendet(self):
+        """Wird am Ende von TetrisEngine.tick() aufgerufen; legt einen vorgemerkten Keyframe ab"""
+        if self.keyframe_faellig:
+            self.keyframe_faellig = False
+            self.keyframe_setzen()
+
+    def keyframe_setzen(self):
+        """Legt den aktuellen Spielstand als Keyframe ab"""
+        engine = self.engine
+        self.keyframes.append(Keyframe(engine.ticks, len(self.aktionen), engine.steine,
+                                       spielstand.kodieren(engine)))
+
+    def beenden(self):
+        """Meldet die Aufzeichnung von der Engine ab"""
+        if self.engine.aufzeichnung is self:
+            self.engine.aufzeichnung = None
+
+    def aufnahme(self):
+        """Gibt den bisherigen Stand als Aufnahme zurück (endet beim aktuellen Tick)"""
+        return Aufnahme(self.seed, self.regeln, self.engine.ticks, self.ticks, bytes(self.aktionen),
+                        list(self.keyframes))
+
+    def speichern(self, pfad):
+        """Schreibt die Aufnahme; über eine temporäre Datei wie spielstand.speichern()"""
+        temp = pfad + ".tmp"
+        with open(temp, "wb") as datei:
+            datei.write(kodieren(self.aufnahme()))
+        os.replace(temp, pfad)
+
+
+def kodieren(aufnahme):
+    """Gibt eine Aufnahme als bytes zurück"""
+    regeln = json.dumps(aufnahme.regeln, sort_keys=True).encode("utf-8")
+    teile = [KOPF.pack(KENNUNG, FORMAT_VERSION, aufnahme.seed, aufnahme.ende, len(aufnahme.ticks),
+                       len(aufnahme.keyframes), len(regeln)), regeln]
+    teile.extend(EINGABE.pack(tick, aktion) for tick, aktion in zip(aufnahme.ticks, aufnahme.aktionen))
+    for keyframe in aufnahme.keyframes:
+        teile.append(KEYFRAME.pack(keyframe.tick, keyframe.eingabe, keyframe.steine, len(keyframe.daten)))
+        teile.append(keyframe.daten)
+    return b"".join(teile)
+
+
+def dekodieren(daten):
+    """Liest eine Aufnahme aus kodieren() (ValueError bei fremden oder beschädigten Daten)"""
+    try:
+        return _dekodieren(daten)
+    except (struct.error, UnicodeDecodeError) as e:
+        raise ValueError(f"Aufnahme ist beschädigt: {e}") from e
+
+
+def _dekodieren(daten):
+    """Zerlegt die Datei in Kopf, Eingaben und Keyframes"""
+    kennung, version, seed, ende, anzahl_eingaben, anzahl_keyframes, regeln_laenge = KOPF.unpack_from(daten)
+    if kennung != KENNUNG:
+        raise ValueError("Keine Aufnahme-Datei")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Nicht unterstützte Aufnahme-Version: {version}")
+    versatz = KOPF.size
+    regeln = json.loads(daten[versatz:versatz + regeln_laenge].decode("utf-8"))
+    versatz += regeln_laenge
+
+    ticks = array("I")
+    aktionen = bytearray()
+    for tick, aktion in EINGABE.iter_unpack(daten[versatz:versatz + anzahl_eingaben * EINGABE.size]):
+        if aktion >= len(AKTIONEN):
+            raise ValueError(f"Unbekannte Aktion in der Aufnahme: {aktion}")
+        ticks.append(tick)
+        aktionen.append(aktion)
+    versatz += anzahl_eingaben * EINGABE.size
+
+    keyframes = []
+    for _ in range(anzahl_keyframes):
+        tick, eingabe, steine, laenge = KEYFRAME.unpack_from(daten, versatz)
+        versatz += KEYFRAME.size
+        keyframes.append(Keyframe(tick, eingabe, steine, daten[versatz:versatz + laenge]))
+        versatz += laenge
+    if len(ticks) != anzahl_eingaben or not keyframes or versatz != len(daten):
+        raise ValueError("Aufnahme ist unvollständig")
+    return Aufnahme(seed, regeln, ende, ticks, bytes(aktionen), keyframes)
+
+
+def laden(pfad):
+    """Lädt eine Aufnahme aus einer Datei"""
+    with open(pfad, "rb") as datei:
+        return dekodieren(datei.read())
+
+
+class Wiedergabe:
+    """Spielt eine Aufnahme in einer eigenen Engine ab, Tick für Tick oder per Sprung"""
+
+    def __init__(self, aufnahme, stein_klasse=Stein):
+        self.aufnahme = aufnahme
+        self.engine = TetrisEngine(stein_klasse=stein_klasse, regeln=aufnahme.regeln, seed=aufnahme.seed)
+        self.keyframe_ticks = [keyframe.tick for keyframe in aufnahme.keyframes]
+        self.index = 0  # nächste auszuführende Eingabe
+        self._keyframe_laden(aufnahme.keyframes[0])
+
+    def _keyframe_laden(self, keyframe):
+        """Setzt die Engine auf einen Keyframe zurück"""
+        spielstand.dekodieren(keyframe.daten, self.engine)
+        self.index = keyframe.eingabe
+
+    def fertig(self):
+        """True, wenn die Aufnahme zu Ende gespielt ist"""
+        engine = self.engine
+        return (self.index >= len(self.aufnahme.ticks)
+                and (engine.ticks >= self.aufnahme.ende or not engine.spiel_aktiv))
+
+    def tick(self):
+        """Führt die fälligen Eingaben und einen Tick aus; gibt False zurück, wenn nichts mehr kommt"""
+        engine = self.engine
+        ticks = self.aufnahme.ticks
+        aktionen = self.aufnahme.aktionen
+        while self.index < len(ticks) and ticks[self.index] <= engine.ticks:
+            engine.step(AKTIONEN[aktionen[self.index]])
+            self.index += 1
+        if engine.ticks >= self.aufnahme.ende or not engine.spiel_aktiv:
+            return False
+        engine.tick(TICK_DAUER)
+        return True
+
+    def springen(self, tick):
+        """Springt zu einem Tick: ab dem letzten Keyframe davor (oder der aktuellen Stelle) simulieren
+
+        Ereignisse der übersprungenen Ticks werden verworfen.
+        """
+        engine = self.engine
+        keyframe = self.aufnahme.keyframes[max(0, bisect_right(self.keyframe_ticks, tick) - 1)]
+        # Weiter vorn als der Keyframe und nicht hinter dem Ziel: von hier aus weiterspielen
+        if engine.ticks > tick or (engine.ticks, self.index) < (keyframe.tick, keyframe.eingabe):
+            self._keyframe_laden(keyframe)
+        while engine.ticks < tick and self.tick():
+            pass
+        engine.ereignisse = []
+
+    def abspielen(self, echtzeit=False, bei_tick=None):
+        """Spielt bis zum Ende; echtzeit hält den Takt von TICK_RATE, sonst so schnell wie möglich
+
+        bei_tick(engine) wird nach jedem Tick aufgerufen (z.B. für eine Anzeige).
+        """
+        zeitschritt = FesterZeitschritt() if echtzeit else None
+        while True:
+            schritte = 1
+            if zeitschritt:
+                time.sleep(TICK_DAUER / 2)
+                schritte = zeitschritt.schritte()
+            for _ in range(schritte):
+                if not self.tick():
+                    return
+                self.engine.ereignisse = []
+                if bei_tick:
+                    bei_tick(self.engine)
+
+
+def als_text(engine):
+    """Stellt Spielfeld (mit aktivem Stein) und Werte als Text dar"""
+    zellen = [["#" if wert else "." for wert in zeile] for zeile in engine.spielfeld.werte]
+    tetromino = engine.aktuelles_tetromino
+    if tetromino and engine.spiel_aktiv:
+        for x, y in tetromino.get_positions():
+            if 0 <= y < len(zellen) and 0 <= x < SPALTEN:
+                zellen[y][x] = "@"
+    zeilen = [f"Tick {engine.ticks}  Score {engine.score}  Linien {engine.linien}  Steine {engine.steine}"]
+    zeilen.extend("|" + "".join(zeile) + "|" for zeile in zellen)
+    return "\n".join(zeilen)
+
+
+def main():
+    """Kommandozeilen-Einstieg: spielt eine Aufnahme ohne Fenster ab"""
+    parser = argparse.ArgumentParser(description="Tetris-Aufnahme abspielen")
+    parser.add_argument("datei", help="Aufnahme (z.B. von main.py --aufnahme)")
+    parser.add_argument("--springe", type=int, metavar="TICK", help="Zuerst zu diesem Tick springen")
+    parser.add_argument("--echtzeit", action="store_true", help="Im Spieltakt abspielen und als Text anzeigen")
+    args = parser.parse_args()
+
+    try:
+        aufnahme = laden(args.datei)
+    except (OSError, ValueError) as e:
+        print(f"Fehler beim Laden der Aufnahme: {e}")
+        return 1
+    print(f"Seed {aufnahme.seed}, {aufnahme.ende} Ticks, {len(aufnahme.ticks)} Eingaben, "
+          f"{len(aufnahme.keyframes)} Keyframes")
+
+    wiedergabe = Wiedergabe(aufnahme)
+    start = time.perf_counter()
+    if args.springe is not None:
+        wiedergabe.springen(args.springe)
+        print(f"Sprung zu Tick {wiedergabe.engine.ticks}: {time.perf_counter() - start:.3f} s")
+
+    anzeige = None
+    if args.echtzeit:
+        def anzeige(engine):
+            if engine.ticks % 4 == 0:
+                print("\033[H\033[J" + als_text(engine), flush=True)
+    start = time.perf_counter()
+    try:
+        wiedergabe.abspielen(args.echtzeit, anzeige)
+    except KeyboardInterrupt:
+        pass
+    engine = wiedergabe.engine
+    print(f"Ende bei Tick {engine.ticks}: Score {engine.score}, Linien {engine.linien}, "
+          f"Steine {engine.steine} ({time.perf_counter() - start:.3f} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,210 @@
+"""
+Bitboard-Spielfeld für den Tetris-Klon: eine Bitmaske pro Reihe
+"""
+
+from config import SPALTEN, ZEILEN
+from zobrist import reihen_hash, reihe_aendern
+
+# Bitmaske einer vollständig belegten Reihe (Bit x = Spalte x)
+VOLLE_REIHE = (1 << SPALTEN) - 1
+
+
+def maske_verschieben(maske, x):
+    """Verschiebt eine Formzeilen-Maske an Spalte x (None, wenn sie links herausragt)"""
+    if x >= 0:
+        return maske << x
+    if maske & ((1 << -x) - 1):
+        return None
+    return maske >> -x
+
+
+def reihen_verdichten(raster, entfernen, neue_reihe):
+    """Entfernt die Reihen mit Index in entfernen in einem Durchgang; oben rücken neue Reihen nach
+
+    Die übrigen Reihenobjekte werden nur verschoben, nicht kopiert. raster wird in-place geändert.
+    """
+    raster[:] = [neue_reihe() for _ in entfernen] + [reihe for y, reihe in enumerate(raster) if y not in entfernen]
+
+
+def bits_zaehlen(maske):
+    """Anzahl gesetzter Bits einer Reihenmaske"""
+    return bin(maske).count("1")
+
+
+# Ab Python 3.10 zählt int.bit_count() direkt
+if hasattr(int, "bit_count"):
+    bits_zaehlen = int.bit_count
+
+
+class SpielfeldZeile:
+    """Kompatibilitätsansicht auf eine Reihe, damit spielfeld[y][x] weiter funktioniert"""
+
+    __slots__ = ("_feld", "_y")
+
+    def __init__(self, feld, y):
+        self._feld = feld
+        self._y = y
+
+    def __getitem__(self, x):
+        return self._feld.werte[self._y][x]
+
+    def __setitem__(self, x, wert):
+        self._feld.setzen(x, self._y, wert)
+
+    def __len__(self):
+        return SPALTEN
+
+    def __iter__(self):
+        return iter(self._feld.werte[self._y])
+
+
+class Spielfeld:
+    """Belegung als Bitmaske pro Reihe plus Formwert (1-7) pro Zelle für die Darstellung
+
+    Zusätzlich wird pro Reihe die Anzahl belegter Zellen mitgeführt, sodass volle Reihen
+    schon beim Fixieren bekannt sind und nicht gesucht werden müssen. Pro Spalte wird die
+    oberste belegte Zeile gehalten (ZEILEN bei leerer Spalte), daraus ergibt sich die
+    Fallhöhe eines Tetrominos ohne Kollisionsschleife. version zählt jede Änderung,
+    hash ist der Zobrist-Hash der Belegung und wird bei jeder Änderung fortgeschrieben.
+    """
+
+    def __init__(self):
+        """Initialisiert ein leeres Spielfeld"""
+        self.reihen = [0] * ZEILEN
+        self.werte = [[0] * SPALTEN for _ in range(ZEILEN)]
+        self.fuellstand = [0] * ZEILEN
+        self.volle = set()
+        self.oberflaeche = [ZEILEN] * SPALTEN
+        self.version = 0
+        self.hash = 0
+        # Die Zeilenansichten verweisen nur auf den Index und bleiben daher gültig
+        self._zeilen = [SpielfeldZeile(self, y) for y in range(ZEILEN)]
+
+    def __getitem__(self, y):
+        return self._zeilen[y]
+
+    def __len__(self):
+        return ZEILEN
+
+    def __iter__(self):
+        return iter(self._zeilen)
+
+    def belegt(self, x, y):
+        """Gibt zurück, ob die Zelle (x, y) belegt ist"""
+        return bool(self.reihen[y] >> x & 1)
+
+    def setzen(self, x, y, wert):
+        """Setzt den Wert einer einzelnen Zelle (0 = leer)"""
+        vorher = self.reihen[y]
+        if wert:
+            self.reihen[y] |= 1 << x
+        else:
+            self.reihen[y] &= ~(1 << x)
+        self.werte[y][x] = wert
+
+        if self.reihen[y] != vorher:
+            self.hash = reihe_aendern(self.hash, y, vorher, self.reihen[y])
+            self.fuellstand[y] += 1 if wert else -1
+            if self.fuellstand[y] == SPALTEN:
+                self.volle.add(y)
+            else:
+                self.volle.discard(y)
+
+            if wert:
+                self.oberflaeche[x] = min(self.oberflaeche[x], y)
+            elif self.oberflaeche[x] == y:
+                self._oberflaeche_berechnen(x)
+        self.version += 1
+
+    def kollidiert(self, masken, x, y):
+        """Prüft, ob eine Form (Folge von (zeilen_offset, maske)) an (x, y) kollidiert"""
+        reihen = self.reihen
+        for i, maske in masken:
+            zeile = maske_verschieben(maske, x)
+            # Außerhalb der Grenzen (links, rechts oder unten)
+            if zeile is None or zeile & ~VOLLE_REIHE:
+                return True
+            ry = y + i
+            if ry >= ZEILEN:
+                return True
+            # Kollision mit einem bereits platzierten Block
+            if ry >= 0 and reihen[ry] & zeile:
+                return True
+        return False
+
+    def fixieren(self, masken, x, y, wert):
+        """Schreibt eine Form per ODER-Verknüpfung ins Spielfeld (Zellen mit y < 0 entfallen)"""
+        for i, maske in masken:
+            ry = y + i
+            if not 0 <= ry < ZEILEN:
+                continue
+            zeile = maske_verschieben(maske, x) & VOLLE_REIHE
+            neu = zeile & ~self.reihen[ry]
+            if neu:
+                self.hash = reihe_aendern(self.hash, ry, self.reihen[ry], self.reihen[ry] | neu)
+                self.reihen[ry] |= neu
+                self.fuellstand[ry] += bits_zaehlen(neu)
+                if self.fuellstand[ry] == SPALTEN:
+                    self.volle.add(ry)
+            werte_zeile = self.werte[ry]
+            oberflaeche = self.oberflaeche
+            while zeile:
+                bit = zeile & -zeile
+                spalte = bit.bit_length() - 1
+                werte_zeile[spalte] = wert
+                if ry < oberflaeche[spalte]:
+                    oberflaeche[spalte] = ry
+                zeile ^= bit
+        self.version += 1
+
+    def volle_reihen(self):
+        """Gibt die Indizes aller vollständig belegten Reihen aufsteigend zurück"""
+        return sorted(self.volle)
+
+    def reihen_entfernen(self, volle_reihen):
+        """Entfernt die angegebenen Reihen und lässt die darüberliegenden nachrutschen"""
+        entfernen = set(volle_reihen)
+        if not entfernen:
+            return
+        # Nur die Reihen bis zur untersten entfernten verschieben sich, darunter bleibt der Hash gleich
+        unterste = max(entfernen) + 1
+        self.hash ^= reihen_hash(self.reihen[:unterste])
+        reihen_verdichten(self.reihen, entfernen, int)
+        self.hash ^= reihen_hash(self.reihen[:unterste])
+        reihen_verdichten(self.werte, entfernen, lambda: [0] * SPALTEN)
+        reihen_verdichten(self.fuellstand, entfernen, int)
+        self.volle = {y for y, anzahl in enumerate(self.fuellstand) if anzahl == SPALTEN}
+        for x in range(SPALTEN):
+            self._oberflaeche_berechnen(x)
+        self.version += 1
+
+    def _oberflaeche_berechnen(self, x):
+        """Sucht die oberste belegte Zeile von Spalte x neu"""
+        bit = 1 << x
+        for y, reihe in enumerate(self.reihen):
+            if reihe & bit:
+                self.oberflaeche[x] = y
+                return
+        self.oberflaeche[x] = ZEILEN
+
+    def fall_distanz(self, daten, x, y):
+        """Gibt zurück, wie viele Zeilen eine Form (FormDaten) an (x, y) fallen kann
+
+        Liegt die Form in jeder ihrer Spalten über der Oberfläche, folgt die Distanz direkt
+        aus dem Bodenprofil. Steckt sie unter einem Überhang, wird Zeile für Zeile geprüft.
+        """
+        distanz = ZEILEN
+        for spalte, unterste in daten.profil:
+            frei = self.oberflaeche[x + spalte] - (y + unterste) - 1
+            if frei < 0:
+                break
+            if frei < distanz:
+                distanz = frei
+        else:
+            return distanz
+
+        # Unter einem Überhang: schrittweise bis zur ersten Kollision
+        distanz = 0
+        while distanz < ZEILEN and not self.kollidiert(daten.masken, x, y + distanz + 1):
+            distanz += 1
+        return distanz
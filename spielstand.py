@@ -0,0 +1,206 @@
+"""
+Spielstand: speichert und lädt den vollständigen Zustand einer TetrisEngine in einem kompakten Binärformat
+
+Aufbau (little-endian):
+    Kopf:     Kennung b"TSST", Formatversion (u16)
+    Spiel:    SPIEL (Seed und Tick-Zähler der Engine)
+    Gimmicks: GIMMICKS (ausgelöste Gimmicks je Typ)
+    Werte:    WERTE (Punkte, Level, Linien, Timer, Gravitation, Status)
+    Steine:   aktuelles und nächstes Tetromino, je STEIN (Form -1 = keiner)
+    Palette:  Anzahl Farben (u8), danach je Farbe R, G, B (u8)
+    Zellen:   ZEILEN * SPALTEN Bytes: Formwert (0-7) in den unteren 4 Bits, Gimmick + 1 in den oberen
+    Farben:   ZEILEN * SPALTEN Bytes: Palettenindex je Zelle
+    Zufall:   Zustand von engine.rng (ZUFALL_KOPF, danach 625 u32)
+
+Gespeichert wird ein Palettenindex statt eines RGB-Tupels pro Zelle. Laden ist ein paar
+struct.unpack_from und Slices, es gibt nichts zu parsen.
+"""
+
+import os
+import random
+import struct
+from array import array
+from config import SPALTEN, ZEILEN, FARBEN, SPEZIAL_FARBEN, SCHWARZ
+from spielfeld import Spielfeld
+
+KENNUNG = b"TSST"
+FORMAT_VERSION = 1
+
+KOPF = struct.Struct("<4sH")
+# seed, ticks
+SPIEL = struct.Struct("<QI")
+# gimmick_zaehler
+GIMMICKS = struct.Struct(f"<{len(SPEZIAL_FARBEN)}I")
+# score, linien, steine, level, fallzeit, fall_timer, zeitfaktor, zeitfaktor_timer,
+# gravitation_richtung, gravitation_timer, status (Bit 0: aktiv, 1: Pause, 2: automatisch fallen)
+WERTE = struct.Struct("<IIIHdddHBHB")
+# form_idx, rotation, x, y, spezial (Bit 0), spezial_typ, Palettenindex der Farbe
+STEIN = struct.Struct("<bBbbBBB")
+# Version des Generatorzustands, gauss_next vorhanden (u8), gauss_next
+ZUFALL_KOPF = struct.Struct("<BBd")
+ZELLEN = ZEILEN * SPALTEN
+
+# Farben, die ohnehin vorkommen; weitere werden beim Speichern angehängt
+GRUND_PALETTE = [tuple(SCHWARZ)] + [tuple(farbe) for farbe in FARBEN] + [tuple(farbe) for farbe in SPEZIAL_FARBEN]
+
+
+def kodieren(engine):
+    """Gibt den Zustand der Engine als bytes zurück"""
+    palette = list(GRUND_PALETTE)
+    index = {farbe: i for i, farbe in enumerate(palette)}
+
+    def farb_index(farbe):
+        farbe = tuple(farbe)
+        i = index.get(farbe)
+        if i is None:
+            i = index[farbe] = len(palette)
+            palette.append(farbe)
+        return i
+
+    teile = [
+        KOPF.pack(KENNUNG, FORMAT_VERSION),
+        SPIEL.pack(engine.seed, engine.ticks),
+        GIMMICKS.pack(*engine.gimmick_zaehler),
+        WERTE.pack(engine.score, engine.linien, engine.steine, engine.level,
+                   engine.fallzeit, engine.fall_timer, engine.aktiver_zeitfaktor, engine.zeitfaktor_timer,
+                   engine.gravitation_richtung, engine.gravitation_timer,
+                   engine.spiel_aktiv | engine.pause << 1 | engine.automatisch_fallen << 2),
+    ]
+    for stein in (engine.aktuelles_tetromino, engine.naechstes_tetromino):
+        if stein is None:
+            teile.append(STEIN.pack(-1, 0, 0, 0, 0, 0, 0))
+        else:
+            teile.append(STEIN.pack(stein.form_idx, stein.aktuelle_rotation, stein.x, stein.y,
+                                    stein.ist_spezial, stein.spezial_typ, farb_index(stein.farbe)))
+
+    zellen = bytes([wert | (gimmick + 1) << 4
+                    for werte_zeile, gimmick_zeile in zip(engine.spielfeld.werte, engine.spielfeld_gimmicks)
+                    for wert, gimmick in zip(werte_zeile, gimmick_zeile)])
+    try:
+        farben = bytes([index[farbe] for farb_zeile in engine.spielfeld_farben for farbe in farb_zeile])
+    except (KeyError, TypeError):
+        # Farbe außerhalb der Grundpalette (oder als Liste): einzeln einsortieren
+        farben = bytes([farb_index(farbe) for farb_zeile in engine.spielfeld_farben for farbe in farb_zeile])
+
+    version, intern, gauss_next = engine.rng.getstate()
+    teile.append(bytes([len(palette)]))
+    teile.extend(bytes(farbe) for farbe in palette)
+    teile.append(zellen)
+    teile.append(farben)
+    teile.append(ZUFALL_KOPF.pack(version, gauss_next is not None, gauss_next or 0.0))
+    teile.append(array("I", intern).tobytes())
+    return b"".join(teile)
+
+
+def dekodieren(daten, engine):
+    """Stellt den Zustand aus kodieren() in der Engine wieder her (ValueError bei fremden Daten)"""
+    try:
+        _dekodieren(daten, engine)
+    except (struct.error, IndexError) as e:
+        raise ValueError(f"Spielstand ist beschädigt: {e}") from e
+
+
+def _dekodieren(daten, engine):
+    """Liest alle Teile und übernimmt sie erst danach in die Engine"""
+    kennung, version = KOPF.unpack_from(daten)
+    if kennung != KENNUNG:
+        raise ValueError("Keine Spielstand-Datei")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Nicht unterstützte Spielstand-Version: {version}")
+    versatz = KOPF.size
+
+    seed, ticks = SPIEL.unpack_from(daten, versatz)
+    versatz += SPIEL.size
+    gimmick_zaehler = list(GIMMICKS.unpack_from(daten, versatz))
+    versatz += GIMMICKS.size
+
+    (score, linien, steine, level, fallzeit, fall_timer, zeitfaktor, zeitfaktor_timer,
+     gravitation_richtung, gravitation_timer, status) = WERTE.unpack_from(daten, versatz)
+    versatz += WERTE.size
+    stein_werte = [STEIN.unpack_from(daten, versatz), STEIN.unpack_from(daten, versatz + STEIN.size)]
+    versatz += 2 * STEIN.size
+
+    anzahl = daten[versatz]
+    versatz += 1
+    palette = [tuple(daten[versatz + 3 * i:versatz + 3 * i + 3]) for i in range(anzahl)]
+    versatz += 3 * anzahl
+    zellen = daten[versatz:versatz + ZELLEN]
+    farben = daten[versatz + ZELLEN:versatz + 2 * ZELLEN]
+    versatz += 2 * ZELLEN
+
+    zufall_version, hat_gauss, gauss_next = ZUFALL_KOPF.unpack_from(daten, versatz)
+    versatz += ZUFALL_KOPF.size
+    intern = array("I")
+    intern.frombytes(daten[versatz:])
+    if len(intern) != 625 or len(farben) != ZELLEN:
+        raise ValueError("Spielstand ist unvollständig")
+
+    # Generatorzustand vorab an einem Ersatzgenerator prüfen, damit ein ungültiger Zustand
+    # die Engine nicht halb geladen zurücklässt
+    zufall_zustand = (zufall_version, tuple(intern), gauss_next if hat_gauss else None)
+    try:
+        random.Random().setstate(zufall_zustand)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Spielstand ist beschädigt: Zufallszustand ungültig ({e})") from e
+
+    # Spielfeld und Zellfarben/Gimmicks
+    spielfeld = Spielfeld()
+    spielfeld_farben = []
+    spielfeld_gimmicks = []
+    for y in range(ZEILEN):
+        start = y * SPALTEN
+        spielfeld_farben.append([palette[i] for i in farben[start:start + SPALTEN]])
+        spielfeld_gimmicks.append([(zelle >> 4) - 1 for zelle in zellen[start:start + SPALTEN]])
+        for x, zelle in enumerate(zellen[start:start + SPALTEN]):
+            if zelle & 0x0F:
+                spielfeld.setzen(x, y, zelle & 0x0F)
+    engine.spielfeld = spielfeld
+    engine.spielfeld_farben = spielfeld_farben
+    engine.spielfeld_gimmicks = spielfeld_gimmicks
+
+    # Steine (aus_zustand zieht keine Zufallszahlen, engine.rng bleibt unberührt)
+    steine_neu = []
+    for form_idx, rotation, x, y, spezial, spezial_typ, farbe in stein_werte:
+        if form_idx < 0:
+            steine_neu.append(None)
+            continue
+        stein = engine.stein_klasse.aus_zustand(form_idx, rotation, x, y, spezial_typ if spezial else -1,
+                                                palette[farbe])
+        stein.spezial_typ = spezial_typ
+        steine_neu.append(stein)
+    engine.aktuelles_tetromino, engine.naechstes_tetromino = steine_neu
+
+    engine.score = score
+    engine.linien = linien
+    engine.steine = steine
+    engine.level = level
+    engine.fallzeit = fallzeit
+    engine.fall_timer = fall_timer
+    engine.aktiver_zeitfaktor = zeitfaktor
+    engine.zeitfaktor_timer = zeitfaktor_timer
+    engine.gravitation_richtung = gravitation_richtung
+    engine.gravitation_timer = gravitation_timer
+    engine.spiel_aktiv = bool(status & 1)
+    engine.pause = bool(status & 2)
+    engine.automatisch_fallen = bool(status & 4)
+    engine.ereignisse = []
+
+    engine.seed = seed
+    engine.ticks = ticks
+    engine.gimmick_zaehler = gimmick_zaehler
+    engine.rng.setstate(zufall_zustand)
+
+
+def speichern(engine, pfad):
+    """Schreibt den Spielstand; über eine temporäre Datei, damit ein Absturz keinen halben Stand hinterlässt"""
+    os.makedirs(os.path.dirname(pfad) or ".", exist_ok=True)
+    temp = pfad + ".tmp"
+    with open(temp, "wb") as datei:
+        datei.write(kodieren(engine))
+    os.replace(temp, pfad)
+
+
+def laden(pfad, engine):
+    """Lädt einen Spielstand aus einer Datei in die Engine"""
+    with open(pfad, "rb") as datei:
+        dekodieren(datei.read(), engine)
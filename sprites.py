@@ -0,0 +1,155 @@
+"""
+Sprite-Atlas mit vorgerenderten Blöcken für Spielfeld, Tetrominos und Vorschau
+"""
+
+import pygame
+from config import BLOCK_GROESSE, FARBEN, SPEZIAL_FARBEN, SCHWARZ, WEISS, DUNKELGRAU
+
+# Anzahl der Glühstufen: glow_step läuft in Schritten von 0.05 zwischen 0 und 1
+GLUEH_STUFEN = 20
+
+def hellere_farbe(farbe, faktor=1.3):
+    """Gibt eine hellere Version der Farbe zurück"""
+    r, g, b = farbe
+    return (min(255, int(r * faktor)),
+            min(255, int(g * faktor)),
+            min(255, int(b * faktor)))
+
+def dunklere_farbe(farbe, faktor=0.7):
+    """Gibt eine dunklere Version der Farbe zurück"""
+    r, g, b = farbe
+    return (max(0, int(r * faktor)),
+            max(0, int(g * faktor)),
+            max(0, int(b * faktor)))
+
+def glueh_farbe(farbe, stufe):
+    """Gibt die Farbe eines Spezialblocks in der angegebenen Glühstufe (0 bis GLUEH_STUFEN) zurück"""
+    r, g, b = farbe
+    glow_intensity = abs(stufe / GLUEH_STUFEN - 0.5) * 0.7 + 0.3  # 0.3 - 0.65
+
+    # Begrenzen der Werte auf 0-255
+    return (min(255, int(r * glow_intensity)),
+            min(255, int(g * glow_intensity)),
+            min(255, int(b * glow_intensity)))
+
+def gimmick_symbol_zeichnen(surface, rect, gimmick_typ):
+    """Zeichnet das Symbol eines Gimmick-Blocks"""
+    center_x = rect.left + BLOCK_GROESSE // 2
+    center_y = rect.top + BLOCK_GROESSE // 2
+    radius = BLOCK_GROESSE // 4
+
+    if gimmick_typ == 0:  # Zeitlupe
+        # Sanduhr-Symbol
+        pygame.draw.polygon(surface, WEISS,
+                            [(center_x - radius, center_y - radius),
+                             (center_x + radius, center_y - radius),
+                             (center_x, center_y)])
+        pygame.draw.polygon(surface, WEISS,
+                            [(center_x - radius, center_y + radius),
+                             (center_x + radius, center_y + radius),
+                             (center_x, center_y)])
+
+    elif gimmick_typ == 1:  # Zeitraffer
+        # Blitz-Symbol
+        pygame.draw.polygon(surface, WEISS,
+                            [(center_x, center_y - radius),
+                             (center_x - radius//2, center_y),
+                             (center_x, center_y),
+                             (center_x - radius//2, center_y + radius)])
+
+    elif gimmick_typ == 2:  # Linienexplosion
+        # Stern-Symbol
+        for i in range(8):
+            angle = i * 3.14159 / 4
+            end_x = center_x + int(radius * 1.2 * (1 if i % 2 == 0 else 0.5) * (
+                -1 if angle > 3.14159 and angle < 2 * 3.14159 else 1))
+            end_y = center_y + int(radius * 1.2 * (1 if i % 2 == 0 else 0.5) * (
+                -1 if angle > 0 and angle < 3.14159 else 1))
+            pygame.draw.line(surface, WEISS,
+                             (center_x, center_y), (end_x, end_y), 2)
+
+    elif gimmick_typ == 3:  # Gravitation ändern
+        # Pfeil-Symbol
+        pygame.draw.polygon(surface, WEISS,
+                            [(center_x, center_y - radius),
+                             (center_x + radius, center_y),
+                             (center_x - radius, center_y)])
+
+class BlockAtlas:
+    """Hält je (Farbe, Gimmick, Gitter) eine fertig gezeichnete Block-Surface im Bildschirmformat
+
+    erstellen() rendert alle Blöcke, die im Spiel vorkommen, einmalig vor. Unbekannte
+    Kombinationen werden beim ersten Zugriff gezeichnet und ebenfalls gespeichert.
+    """
+
+    def __init__(self):
+        self.sprites = {}
+
+    def erstellen(self):
+        """Rendert alle Spielblöcke vor (nach pygame.display.set_mode aufrufen)"""
+        self.sprites = {}
+        self.leere_zelle()
+
+        # Normale Blöcke: als Tetromino und als fixierter Block im Spielfeld
+        for farbe in FARBEN:
+            self.block(farbe)
+            self.block(farbe, gitter=True)
+
+        # Spezialblöcke: jede Glühstufe des fallenden Steins und die fixierte Variante
+        for gimmick_typ, farbe in enumerate(SPEZIAL_FARBEN):
+            for stufe in range(GLUEH_STUFEN + 1):
+                self.block(glueh_farbe(farbe, stufe), gimmick_typ)
+            self.block(farbe, gimmick_typ, gitter=True)
+
+    def block(self, farbe, gimmick_typ=-1, gitter=False):
+        """Gibt die Surface eines Blocks zurück (gitter=True für die Darstellung im Spielfeld)"""
+        schluessel = (farbe, gimmick_typ, gitter)
+        sprite = self.sprites.get(schluessel)
+        if sprite is None:
+            sprite = self._block_rendern(farbe, gimmick_typ, gitter)
+            self.sprites[schluessel] = sprite
+        return sprite
+
+    def leere_zelle(self):
+        """Gibt die Surface einer leeren Spielfeldzelle zurück"""
+        sprite = self.sprites.get(None)
+        if sprite is None:
+            sprite = self._neue_surface()
+            sprite.fill(DUNKELGRAU)
+            pygame.draw.rect(sprite, SCHWARZ, sprite.get_rect(), 1)
+            self.sprites[None] = self._bildschirmformat(sprite)
+        return self.sprites[None]
+
+    def _block_rendern(self, farbe, gimmick_typ, gitter):
+        """Zeichnet einen Block mit 3D-Kanten, Gimmick-Symbol und optional Gitterlinie"""
+        sprite = self._neue_surface()
+        rect = sprite.get_rect()
+        sprite.fill(farbe)
+
+        # Hellerer Rand oben links, dunklerer Rand unten rechts (3D-Effekt)
+        hell = hellere_farbe(farbe)
+        dunkel = dunklere_farbe(farbe)
+        pygame.draw.line(sprite, hell, (rect.left, rect.top), (rect.right, rect.top), 2)
+        pygame.draw.line(sprite, hell, (rect.left, rect.top), (rect.left, rect.bottom), 2)
+        pygame.draw.line(sprite, dunkel, (rect.right, rect.top), (rect.right, rect.bottom), 2)
+        pygame.draw.line(sprite, dunkel, (rect.left, rect.bottom), (rect.right, rect.bottom), 2)
+
+        if gimmick_typ >= 0:
+            gimmick_symbol_zeichnen(sprite, rect, gimmick_typ)
+
+        if gitter:
+            pygame.draw.rect(sprite, SCHWARZ, rect, 1)
+        return self._bildschirmformat(sprite)
+
+    def _neue_surface(self):
+        """Erstellt eine leere Surface in Blockgröße"""
+        return pygame.Surface((BLOCK_GROESSE, BLOCK_GROESSE))
+
+    def _bildschirmformat(self, sprite):
+        """Wandelt eine Surface ins Bildschirmformat um, sofern schon ein Fenster existiert"""
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            return sprite.convert()
+        return sprite
+
+# Gemeinsamer Atlas für alle Zeichenfunktionen
+ATLAS = BlockAtlas()
@@ -0,0 +1,174 @@
+"""
+Regressionstests für den Spielkern (TetrisEngine mit Bitboard-Spielfeld)
+
+Der Differenztest spielt Eingaben parallel in der Engine und in einem schlichten
+Referenzmodell mit Zellenraster, das die ursprünglichen Spielregeln direkt aus den
+Form-Grafiken in TETROMINOS nachbildet. Nach jeder Eingabe müssen Spielfeld, Stein und
+Spielwerte übereinstimmen. Gimmicks sind dabei abgeschaltet; sie und die Schwerkraft deckt
+der Golden-State-Test ab, der ein festes Spiel gegen gespeicherte Endwerte prüft.
+
+    python -m pytest -q test_engine.py
+"""
+
+import random
+import zlib
+
+import pytest
+
+from config import SPALTEN, ZEILEN, PUNKTE_EINE_REIHE, PUNKTE_ZWEI_REIHEN, PUNKTE_DREI_REIHEN, PUNKTE_VIER_REIHEN
+from autoplayer import Autoplayer
+from engine import TetrisEngine, AKTIONEN, AKTION_LINKS, AKTION_RECHTS, AKTION_RUNTER, AKTION_DREHEN
+from formen import TETROMINOS
+from zeitschritt import TICK_DAUER
+
+PUNKTE = {1: PUNKTE_EINE_REIHE, 2: PUNKTE_ZWEI_REIHEN, 3: PUNKTE_DREI_REIHEN, 4: PUNKTE_VIER_REIHEN}
+
+
+class Referenz:
+    """Spielregeln auf einem Raster aus Listen, ohne Bitmasken und ohne vorberechnete Tabellen"""
+
+    def __init__(self, form_idx):
+        self.raster = [[0] * SPALTEN for _ in range(ZEILEN)]
+        self.score = 0
+        self.linien = 0
+        self.level = 1
+        self.aktiv = True
+        self.spawnen(form_idx)
+
+    def spawnen(self, form_idx):
+        self.form_idx, self.rotation, self.x, self.y = form_idx, 0, SPALTEN // 2 - 2, 0
+
+    def zellen(self, rotation=None, x=None, y=None):
+        rotation = self.rotation if rotation is None else rotation
+        x = self.x if x is None else x
+        y = self.y if y is None else y
+        form = TETROMINOS[self.form_idx][rotation]
+        return [(x + j, y + i) for i, zeile in enumerate(form) for j, zelle in enumerate(zeile) if zelle == "O"]
+
+    def kollidiert(self, **stand):
+        for x, y in self.zellen(**stand):
+            if x < 0 or x >= SPALTEN or y >= ZEILEN:
+                return True
+            if y >= 0 and self.raster[y][x]:
+                return True
+        return False
+
+    def bewegen(self, dx, dy, naechste_form):
+        if not self.kollidiert(x=self.x + dx, y=self.y + dy):
+            self.x += dx
+            self.y += dy
+        elif dy > 0:
+            self.fixieren(naechste_form)
+
+    def drehen(self):
+        rotation = (self.rotation + 1) % len(TETROMINOS[self.form_idx])
+        for dx in (0, 1, -1, 2, -2):
+            if not self.kollidiert(rotation=rotation, x=self.x + dx):
+                self.rotation, self.x = rotation, self.x + dx
+                return
+
+    def hard_drop(self, naechste_form):
+        y = self.y
+        while not self.kollidiert(y=y + 1):
+            y += 1
+        if y != self.y:
+            self.y = y
+            self.fixieren(naechste_form)
+
+    def fixieren(self, naechste_form):
+        zellen = self.zellen()
+        if any(y < 0 for _, y in zellen):
+            self.aktiv = False
+            return
+        for x, y in zellen:
+            self.raster[y][x] = self.form_idx + 1
+
+        volle = [y for y in range(ZEILEN) if all(self.raster[y])]
+        if volle:
+            self.score += PUNKTE[len(volle)] * self.level
+            for reihe in volle:
+                del self.raster[reihe]
+                self.raster.insert(0, [0] * SPALTEN)
+            self.linien += len(volle)
+            self.level = max(self.level, self.linien // 10 + 1)
+
+        self.spawnen(naechste_form)
+        if self.kollidiert():
+            self.aktiv = False
+
+
+def _eingaben(engine, seed, stoerung=0.1):
+    """Eingaben des Autoplayers (damit Reihen voll werden), durchsetzt mit zufälligen Aktionen"""
+    spieler = Autoplayer(vorausschau=False)
+    zufall = random.Random(seed)
+    tetromino, plan = None, []
+    while engine.spiel_aktiv:
+        if engine.aktuelles_tetromino is not tetromino or not plan:
+            tetromino = engine.aktuelles_tetromino
+            plan = spieler.planen(engine)
+            plan.reverse()
+        if zufall.random() < stoerung:
+            yield zufall.choice(AKTIONEN)
+        else:
+            yield plan.pop()
+
+
+def _zustand_engine(engine):
+    tetromino = engine.aktuelles_tetromino
+    return (engine.spielfeld.werte, (tetromino.form_idx, tetromino.aktuelle_rotation, tetromino.x, tetromino.y),
+            engine.score, engine.linien, engine.level, engine.spiel_aktiv)
+
+
+def _zustand_referenz(referenz):
+    return (referenz.raster, (referenz.form_idx, referenz.rotation, referenz.x, referenz.y),
+            referenz.score, referenz.linien, referenz.level, referenz.aktiv)
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_engine_wie_referenz(seed):
+    """Gestörte Autoplayer-Eingaben ergeben in Engine und Referenzmodell denselben Zustand"""
+    engine = TetrisEngine(regeln={"SPEZIAL_CHANCE": 0}, seed=seed)
+    referenz = Referenz(engine.aktuelles_tetromino.form_idx)
+
+    for schritt, aktion in zip(range(3000), _eingaben(engine, seed)):
+        engine.step(aktion)
+        # Das nächste Tetromino ist schon vor der Eingabe gezogen; nach dem Fixieren ist es das aktuelle
+        naechste_form = engine.aktuelles_tetromino.form_idx
+        if aktion == AKTION_LINKS:
+            referenz.bewegen(-1, 0, naechste_form)
+        elif aktion == AKTION_RECHTS:
+            referenz.bewegen(1, 0, naechste_form)
+        elif aktion == AKTION_RUNTER:
+            referenz.bewegen(0, 1, naechste_form)
+        elif aktion == AKTION_DREHEN:
+            referenz.drehen()
+        else:
+            referenz.hard_drop(naechste_form)
+        assert _zustand_engine(engine) == _zustand_referenz(referenz), f"Abweichung nach Schritt {schritt}"
+
+    assert engine.linien > 0
+
+
+def test_engine_golden_state():
+    """Ein festes Spiel mit Gimmicks und Schwerkraft endet immer im selben Zustand"""
+    engine = TetrisEngine(seed=2024)
+    spieler = Autoplayer()
+    zufall = random.Random(7)
+    for _ in range(5000):
+        if zufall.random() < 0.02:
+            engine.step(zufall.choice(AKTIONEN))
+        else:
+            spieler.zug(engine)
+        engine.tick(TICK_DAUER)
+
+    zellen = bytes(wert for zeile in engine.spielfeld.werte for wert in zeile)
+    gimmicks = bytes(gimmick + 1 for zeile in engine.spielfeld_gimmicks for gimmick in zeile)
+    assert (engine.score, engine.linien, engine.steine, engine.level, engine.ticks,
+            tuple(engine.gimmick_zaehler), engine.spiel_aktiv) == GOLDEN_WERTE
+    assert (zlib.crc32(zellen), zlib.crc32(gimmicks)) == GOLDEN_FELD
+
+
+# Endwerte von test_engine_golden_state (score, linien, steine, level, ticks, gimmicks, aktiv) und
+# CRC32 von Zellen und Gimmicks. Nur bei gewollten Änderungen an Regeln oder Autoplayer neu erzeugen.
+GOLDEN_WERTE = (496750, 291, 745, 30, 5000, (28, 32, 18, 44), True)
+GOLDEN_FELD = (2141266687, 2703135350)
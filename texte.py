@@ -0,0 +1,104 @@
+"""
+Schriftarten-Registry und Cache für gerenderte Texte
+"""
+
+import json
+import os
+import pygame
+from collections import OrderedDict
+from config import SCHRIFT_KLEIN, SCHRIFT_CACHE_DATEI
+
+# Maximale Anzahl gespeicherter Text-Surfaces (älteste werden zuerst verworfen)
+TEXT_CACHE_GROESSE = 256
+
+# Geladene Schriftarten: (name, groesse, fett) -> pygame.font.Font
+_schriften = {}
+
+# Aufgelöste Schriftdateien: "name|fett" -> [pfad oder None, fett simulieren]; None = noch nicht gelesen
+_schrift_pfade = None
+
+def schrift_pfad(name, fett=False):
+    """Sucht die Datei einer Systemschrift wie pygame.font.SysFont, aber über SCHRIFT_CACHE_DATEI
+
+    Die erste Suche lässt pygame alle Systemschriften aufzählen (je nach System mehrere
+    Sekunden); das Ergebnis wird gespeichert, spätere Starts lesen nur die Datei.
+    Gibt (pfad, fett_simulieren) zurück; pfad None bedeutet Pygame-Standardschrift.
+    """
+    global _schrift_pfade
+    if _schrift_pfade is None:
+        try:
+            with open(SCHRIFT_CACHE_DATEI, encoding="utf-8") as datei:
+                _schrift_pfade = json.load(datei)
+        except (OSError, ValueError):
+            _schrift_pfade = {}
+
+    schluessel = f"{name.lower()}|{int(fett)}"
+    eintrag = _schrift_pfade.get(schluessel)
+    if eintrag is not None and (eintrag[0] is None or os.path.exists(eintrag[0])):
+        return tuple(eintrag)
+
+    # Wie SysFont: fehlt der fette Schnitt, liefert match_font den normalen, der dann fett gerendert wird
+    pfad = pygame.font.match_font(name, bold=fett)
+    simulieren = fett and (pfad is None or pfad == pygame.font.match_font(name))
+    if pfad is None:
+        print(f"Warnung: Schriftart {name} nicht gefunden, verwende Systemstandard")
+
+    _schrift_pfade[schluessel] = [pfad, simulieren]
+    try:
+        os.makedirs(os.path.dirname(SCHRIFT_CACHE_DATEI) or ".", exist_ok=True)
+        with open(SCHRIFT_CACHE_DATEI, "w", encoding="utf-8") as datei:
+            json.dump(_schrift_pfade, datei, indent=1)
+    except OSError as e:
+        print(f"Schriftarten-Cache konnte nicht gespeichert werden: {e}")
+    return pfad, simulieren
+
+def schrift(groesse=SCHRIFT_KLEIN, name="Arial", fett=False):
+    """Gibt eine Schriftart zurück und lädt sie nur beim ersten Aufruf (name=None: Pygame-Standard)"""
+    schluessel = (name, groesse, fett)
+    font = _schriften.get(schluessel)
+    if font is None:
+        try:
+            if name is None:
+                font = pygame.font.Font(None, groesse)
+                font.set_bold(fett)
+            else:
+                pfad, simulieren = schrift_pfad(name, fett)
+                font = pygame.font.Font(pfad, groesse)
+                font.set_bold(simulieren)
+        except Exception as e:
+            print(f"Fehler beim Laden der Schriftart {name}: {e}")
+            font = pygame.font.Font(None, groesse)
+        _schriften[schluessel] = font
+    return font
+
+class TextCache:
+    """Speichert gerenderte Texte je (Schriftart, Text, Farbe) mit LRU-Verdrängung"""
+
+    def __init__(self, groesse=TEXT_CACHE_GROESSE):
+        self.groesse = groesse
+        self.texte = OrderedDict()
+
+    def rendern(self, font, text, farbe):
+        """Gibt den Text als Surface zurück und rendert ihn nur, wenn er noch nicht im Cache liegt"""
+        schluessel = (font, text, farbe)
+        surface = self.texte.get(schluessel)
+        if surface is not None:
+            self.texte.move_to_end(schluessel)
+            return surface
+
+        surface = font.render(text, True, farbe)
+        self.texte[schluessel] = surface
+        if len(self.texte) > self.groesse:
+            self.texte.popitem(last=False)
+        return surface
+
+    def leeren(self):
+        """Verwirft alle gespeicherten Texte"""
+        self.texte.clear()
+
+# Gemeinsamer Cache für alle Textanzeigen
+TEXT_CACHE = TextCache()
+
+def text_rendern(text, farbe, groesse=SCHRIFT_KLEIN, name="Arial", fett=False):
+    """Rendert einen Text mit einer registrierten Schriftart über den gemeinsamen Cache"""
+    return TEXT_CACHE.rendern(schrift(groesse, name, fett), text, farbe)
@@ -0,0 +1,235 @@
+"""
+Selbstspiel- und Turnier-Runner: verteilt gesetzte Spiele über alle CPU-Kerne
+
+Beispiel:
+    python turnier.py --spiele 2000 --strategie zufall --regel SPEZIAL_CHANCE=0.2
+    python turnier.py --spiele 100 --strategie heuristik
+    python turnier.py --spiele 100000 --strategie heuristik --bestenliste
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter, namedtuple
+from engine import (
+    TetrisEngine, STANDARD_REGELN,
+    AKTION_LINKS, AKTION_RECHTS, AKTION_RUNTER, AKTION_DREHEN, AKTION_HARD_DROP
+)
+from zeitschritt import TICK_DAUER
+from autoplayer import Autoplayer
+from bestenliste import Bestenliste, Eintrag
+from config import BESTENLISTE_DATEI
+
+# Kompaktes Ergebnis eines Spiels, wie es aus den Worker-Prozessen zurückkommt
+Ergebnis = namedtuple("Ergebnis", ["seed", "score", "linien", "level", "steine", "ticks", "gimmicks"])
+
+# Simulierte Zeit pro Spieleraktion (ein Tick des festen Simulationstakts)
+ZUG_DAUER = TICK_DAUER
+
+# Registrierte Strategien: name -> funktion(engine, rng) -> Aktionen für das aktuelle Tetromino
+STRATEGIEN = {}
+
+
+def strategie(name):
+    """Registriert eine Spielstrategie unter dem angegebenen Namen"""
+    def registrieren(funktion):
+        STRATEGIEN[name] = funktion
+        return funktion
+    return registrieren
+
+
+@strategie("zufall")
+def zufall_strategie(engine, rng):
+    """Dreht und verschiebt das Tetromino zufällig und lässt es dann fallen"""
+    aktionen = [AKTION_DREHEN] * rng.randrange(4)
+    aktionen += [rng.choice((AKTION_LINKS, AKTION_RECHTS))] * rng.randrange(6)
+    aktionen += [AKTION_HARD_DROP, AKTION_RUNTER]
+    return aktionen
+
+
+# Ein Autoplayer pro Prozess; er hält keinen Zustand zwischen den Planungen
+_AUTOPLAYER = Autoplayer()
+
+
+@strategie("heuristik")
+def heuristik_strategie(engine, rng):
+    """Legt das Tetromino an die beste Stelle laut Spielfeldbewertung (mit einem Stein Vorausschau)"""
+    return _AUTOPLAYER.planen(engine)
+
+
+def spiel_ausfuehren(engine, strategie_funktion, seed, max_steine):
+    """Spielt ein Spiel mit der Strategie; jede Aktion kostet einen Tick Spielzeit"""
+    rng = random.Random(seed)  # Entscheidungen der Strategie
+    engine.neustart(seed)  # Formen und Gimmicks der Tetrominos
+
+    while engine.spiel_aktiv and engine.steine < max_steine:
+        stein = engine.aktuelles_tetromino
+        for aktion in strategie_funktion(engine, rng):
+            if engine.aktuelles_tetromino is not stein or not engine.spiel_aktiv:
+                break
+            engine.step(aktion)
+            engine.tick(ZUG_DAUER)
+        else:
+            # Stein liegt noch (z.B. leerer Plan): Zeit laufen lassen, bis die Schwerkraft greift
+            engine.tick(ZUG_DAUER)
+
+    return Ergebnis(seed, engine.score, engine.linien, engine.level, engine.steine, engine.ticks,
+                    tuple(engine.gimmick_zaehler))
+
+
+# Zustand je Worker-Prozess: eine Engine, die zwischen den Spielen wiederverwendet wird
+_worker_engine = None
+_worker_strategie = None
+
+
+def _worker_starten(regeln, strategie_name):
+    """Initialisiert einen Worker einmalig mit Engine und Strategie"""
+    global _worker_engine, _worker_strategie
+    _worker_engine = TetrisEngine(regeln=regeln)
+    _worker_strategie = STRATEGIEN[strategie_name]
+
+
+def _worker_spiel(auftrag):
+    """Spielt ein Spiel im Worker und gibt ein kompaktes Tupel zurück"""
+    seed, max_steine = auftrag
+    return tuple(spiel_ausfuehren(_worker_engine, _worker_strategie, seed, max_steine))
+
+
+def turnier(seeds, strategie_name="zufall", regeln=None, max_steine=1000, prozesse=None):
+    """Spielt alle Seeds parallel und liefert die Ergebnisse in Fertigstellungsreihenfolge"""
+    if strategie_name not in STRATEGIEN:
+        raise ValueError(f"Unbekannte Strategie: {strategie_name}")
+    # Regeln früh prüfen, statt in jedem Worker zu scheitern
+    TetrisEngine(regeln=regeln)
+
+    auftraege = [(seed, max_steine) for seed in seeds]
+    prozesse = prozesse or os.cpu_count() or 1
+    chunksize = max(1, min(32, len(auftraege) // (prozesse * 8)))
+
+    with multiprocessing.Pool(prozesse, initializer=_worker_starten,
+                              initargs=(regeln, strategie_name)) as pool:
+        for ergebnis in pool.imap_unordered(_worker_spiel, auftraege, chunksize):
+            yield Ergebnis(*ergebnis)
+
+
+class Auswertung:
+    """Sammelt Ergebnisse laufend und berechnet Verteilungen von Punkten, Linien und Level"""
+
+    def __init__(self):
+        self.scores = []
+        self.linien = Counter()
+        self.level = Counter()
+        self.steine = 0
+
+    def hinzufuegen(self, ergebnis):
+        """Nimmt ein einzelnes Ergebnis auf"""
+        self.scores.append(ergebnis.score)
+        self.linien[ergebnis.linien] += 1
+        self.level[ergebnis.level] += 1
+        self.steine += ergebnis.steine
+
+    def zusammenfassung(self):
+        """Gibt die aggregierten Verteilungen als Dictionary zurück"""
+        scores = sorted(self.scores)
+        if not scores:
+            return {"spiele": 0}
+
+        def perzentil(p):
+            return scores[min(len(scores) - 1, int(p / 100 * len(scores)))]
+
+        linien = list(self.linien.elements())
+        return {
+            "spiele": len(scores),
+            "steine": self.steine,
+            "score": {
+                "mittel": statistics.fmean(scores),
+                "min": scores[0],
+                "p10": perzentil(10),
+                "p50": perzentil(50),
+                "p90": perzentil(90),
+                "max": scores[-1],
+            },
+            "linien": {
+                "mittel": statistics.fmean(linien),
+                "verteilung": dict(sorted(self.linien.items())),
+            },
+            "level": dict(sorted(self.level.items())),
+        }
+
+
+def _regel_parsen(text):
+    """Liest eine Regel im Format NAME=WERT"""
+    name, _, wert = text.partition("=")
+    if name not in STANDARD_REGELN:
+        raise argparse.ArgumentTypeError(f"Unbekannte Spielregel: {name}")
+    return name, type(STANDARD_REGELN[name])(wert)
+
+
+def main():
+    """Kommandozeilen-Einstieg für Turniere"""
+    parser = argparse.ArgumentParser(description="Tetris-Selbstspiel über alle CPU-Kerne")
+    parser.add_argument("--spiele", type=int, default=1000, help="Anzahl der Spiele")
+    parser.add_argument("--seed", type=int, default=0, help="Erster Seed")
+    parser.add_argument("--strategie", default="zufall", choices=sorted(STRATEGIEN))
+    parser.add_argument("--max-steine", type=int, default=1000, help="Abbruch nach so vielen Steinen")
+    parser.add_argument("--prozesse", type=int, default=None, help="Anzahl Worker (Standard: alle Kerne)")
+    parser.add_argument("--regel", type=_regel_parsen, action="append", default=[],
+                        help="Regel überschreiben, z.B. SPEZIAL_CHANCE=0.2 (mehrfach möglich)")
+    parser.add_argument("--json", action="store_true", help="Zusammenfassung als JSON ausgeben")
+    parser.add_argument("--bestenliste", nargs="?", const=BESTENLISTE_DATEI, metavar="DATEI",
+                        help=f"Alle Spiele in die Bestenliste schreiben (Standard {BESTENLISTE_DATEI})")
+    parser.add_argument("--spieler", help="Name in der Bestenliste (Standard: turnier-STRATEGIE)")
+    args = parser.parse_args()
+    if args.spiele < 1:
+        print("Keine Spiele angegeben (--spiele muss mindestens 1 sein)", file=sys.stderr)
+        return 1
+
+    bestenliste = None
+    if args.bestenliste:
+        bestenliste = Bestenliste(args.bestenliste)
+        if not bestenliste.starten():
+            return 1
+    spieler = args.spieler or f"turnier-{args.strategie}"
+
+    auswertung = Auswertung()
+    start = time.perf_counter()
+    seeds = range(args.seed, args.seed + args.spiele)
+    for i, ergebnis in enumerate(turnier(seeds, args.strategie, dict(args.regel),
+                                         args.max_steine, args.prozesse), 1):
+        auswertung.hinzufuegen(ergebnis)
+        if bestenliste:
+            bestenliste.eintragen(Eintrag(spieler, ergebnis.score, ergebnis.level, ergebnis.linien, ergebnis.steine,
+                                          ergebnis.ticks * ZUG_DAUER, ergebnis.gimmicks, ergebnis.seed,
+                                          time.time()), warten=True)
+        if not args.json and i % max(1, args.spiele // 10) == 0:
+            print(f"{i}/{args.spiele} Spiele fertig", file=sys.stderr)
+    if bestenliste:
+        bestenliste.beenden()
+    dauer = time.perf_counter() - start
+
+    zusammenfassung = auswertung.zusammenfassung()
+    if not zusammenfassung["spiele"]:
+        print("Keine Ergebnisse: es wurde kein Spiel beendet", file=sys.stderr)
+        return 1
+    zusammenfassung["dauer_s"] = dauer
+    zusammenfassung["regeln"] = dict(args.regel)
+    if args.json:
+        print(json.dumps(zusammenfassung, indent=2))
+    else:
+        score = zusammenfassung["score"]
+        print(f"{zusammenfassung['spiele']} Spiele, {zusammenfassung['steine']} Steine in {dauer:.1f}s "
+              f"({zusammenfassung['steine'] / dauer:.0f} Steine/s)")
+        print(f"Punkte: Mittel {score['mittel']:.0f}, p10 {score['p10']}, p50 {score['p50']}, "
+              f"p90 {score['p90']}, max {score['max']}")
+        print(f"Linien: Mittel {zusammenfassung['linien']['mittel']:.1f}")
+        print(f"Level-Verteilung: {zusammenfassung['level']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,51 @@
+"""
+Fester Simulationstakt: entkoppelt Spiellogik-Ticks von der Bildrate
+"""
+
+import time
+from config import TICK_RATE, MAX_AUFHOLSCHRITTE
+
+# Dauer eines Simulationsschritts in Sekunden
+TICK_DAUER = 1.0 / TICK_RATE
+
+class FesterZeitschritt:
+    """Sammelt vergangene Zeit in einem Akkumulator und gibt sie in festen Schritten aus
+
+    Pro Frame liefert schritte() die Anzahl fälliger Ticks. Nach langsamen Frames werden
+    bis zu max_aufholen Ticks nachgeholt; darüber hinaus wird die Zeit verworfen, damit
+    das Spiel nach längeren Hängern (z.B. Fenster verschieben) nicht davonläuft.
+    """
+
+    def __init__(self, schritt=TICK_DAUER, max_aufholen=MAX_AUFHOLSCHRITTE, uhr=time.perf_counter):
+        self.schritt = schritt
+        self.max_aufholen = max_aufholen
+        self.uhr = uhr
+        self.zuruecksetzen()
+
+    def zuruecksetzen(self):
+        """Verwirft angesammelte Zeit und misst ab jetzt neu"""
+        self.letzte_zeit = self.uhr()
+        self.akkumulator = 0.0
+
+    def schritte(self):
+        """Gibt die Anzahl der Ticks zurück, die seit dem letzten Aufruf fällig sind"""
+        jetzt = self.uhr()
+        dt = jetzt - self.letzte_zeit
+        self.letzte_zeit = jetzt
+        return self.vorruecken(dt)
+
+    def vorruecken(self, dt):
+        """Fügt dt Sekunden hinzu und gibt die Anzahl fälliger Ticks zurück"""
+        self.akkumulator += max(0.0, dt)
+        anzahl = int(self.akkumulator / self.schritt)
+        if anzahl > self.max_aufholen:
+            anzahl = self.max_aufholen
+            self.akkumulator = 0.0
+        else:
+            self.akkumulator -= anzahl * self.schritt
+        return anzahl
+
+    @property
+    def anteil(self):
+        """Anteil des angebrochenen Ticks (0 bis 1), z.B. zum Interpolieren beim Zeichnen"""
+        return self.akkumulator / self.schritt
@@ -0,0 +1,132 @@
+"""
+Zobrist-Hashing: 64-Bit-Schlüssel für Spielfelder und Steinpositionen plus Transpositionstabelle
+
+Jede Zelle und jedes Merkmal einer Steinposition (Form und Rotation, x, y) hat einen festen
+Zufallsschlüssel; der Hash eines Zustands ist das XOR der Schlüssel aller zutreffenden
+Merkmale. Ändert sich eine Reihe, wird nur ihr alter Beitrag heraus- und der neue
+hineingerechnet (zobrist.reihe_aendern), statt das ganze Feld neu zu hashen.
+"""
+
+import random
+from collections import OrderedDict
+from config import SPALTEN, ZEILEN, TT_GROESSE, TT_VERDRAENGUNG
+from formen import FORM_TABELLEN
+
+# Fester Seed: alle Prozesse (z.B. Turnier-Worker) erzeugen dieselben Schlüssel
+ZOBRIST_SEED = 0x5A0B8157
+
+# Steinpositionen dürfen so weit über die Ränder hinausragen (Formen sind 5x5 groß)
+STEIN_RAND = 5
+
+_zufall = random.Random(ZOBRIST_SEED)
+
+
+def _schluessel():
+    """Ein neuer 64-Bit-Zufallsschlüssel"""
+    return _zufall.getrandbits(64)
+
+
+# Ein Schlüssel pro Zelle [y][x]
+ZELLEN_SCHLUESSEL = [[_schluessel() for _ in range(SPALTEN)] for _ in range(ZEILEN)]
+
+
+def _reihen_schluessel(zellen):
+    """Berechnet für jede Reihenmaske das XOR der Schlüssel ihrer belegten Zellen vorab"""
+    tabelle = [0] * (1 << SPALTEN)
+    for maske in range(1, 1 << SPALTEN):
+        bit = maske & -maske
+        tabelle[maske] = tabelle[maske ^ bit] ^ zellen[bit.bit_length() - 1]
+    return tabelle
+
+
+# Beitrag einer ganzen Reihe [y][maske]: ein Nachschlagen statt bis zu SPALTEN XORs
+REIHEN_SCHLUESSEL = [_reihen_schluessel(zellen) for zellen in ZELLEN_SCHLUESSEL]
+
+# Merkmale einer Steinposition
+FORM_SCHLUESSEL = [[_schluessel() for _ in tabellen] for tabellen in FORM_TABELLEN]
+X_SCHLUESSEL = [_schluessel() for _ in range(SPALTEN + 2 * STEIN_RAND)]
+Y_SCHLUESSEL = [_schluessel() for _ in range(ZEILEN + 2 * STEIN_RAND)]
+
+
+def reihen_hash(reihen):
+    """Hash eines Spielfelds aus seinen Reihenmasken (vollständig berechnet)"""
+    wert = 0
+    for y, reihe in enumerate(reihen):
+        if reihe:
+            wert ^= REIHEN_SCHLUESSEL[y][reihe]
+    return wert
+
+
+def reihe_aendern(wert, y, alt, neu):
+    """Aktualisiert einen Spielfeld-Hash, wenn Reihe y von alt zu neu wechselt"""
+    schluessel = REIHEN_SCHLUESSEL[y]
+    return wert ^ schluessel[alt] ^ schluessel[neu]
+
+
+def stein_hash(form_idx, rotation, x, y):
+    """Hash einer Steinposition (Form, Rotation, x, y); per XOR mit einem Spielfeld-Hash kombinierbar"""
+    return FORM_SCHLUESSEL[form_idx][rotation] ^ X_SCHLUESSEL[x + STEIN_RAND] ^ Y_SCHLUESSEL[y + STEIN_RAND]
+
+
+# Verdrängungsstrategien der Transpositionstabelle, wenn sie voll ist
+VERDRAENGUNGEN = ("lru", "fifo")
+
+
+class Transpositionstabelle:
+    """Begrenzter Cache für Bewertungen und Suchergebnisse, adressiert über Zobrist-Hashes
+
+    verdraengung "lru" wirft den am längsten nicht mehr gelesenen Eintrag hinaus, "fifo" den
+    ältesten (Lesen kostet dann nur ein Nachschlagen). Einträge merken sich die Suchtiefe,
+    mit der sie berechnet wurden; nachschlagen() liefert nur Ergebnisse, die mindestens so
+    tief gesucht wurden wie verlangt.
+    """
+
+    def __init__(self, groesse=TT_GROESSE, verdraengung=TT_VERDRAENGUNG):
+        if verdraengung not in VERDRAENGUNGEN:
+            raise ValueError(f"Unbekannte Verdrängungsstrategie: {verdraengung}")
+        self.groesse = groesse
+        self.verdraengung = verdraengung
+        self.eintraege = OrderedDict()  # schluessel -> (wert, tiefe)
+        self.treffer = 0
+        self.fehlschlaege = 0
+
+    def __len__(self):
+        return len(self.eintraege)
+
+    def nachschlagen(self, schluessel, tiefe=0):
+        """Gibt den gespeicherten Wert zurück oder None, wenn keiner (tief genug) vorliegt"""
+        eintrag = self.eintraege.get(schluessel)
+        if eintrag is None or eintrag[1] < tiefe:
+            self.fehlschlaege += 1
+            return None
+        self.treffer += 1
+        if self.verdraengung == "lru":
+            self.eintraege.move_to_end(schluessel)
+        return eintrag[0]
+
+    def speichern(self, schluessel, wert, tiefe=0):
+        """Legt einen Wert ab; ist die Tabelle voll, wird nach der Verdrängungsstrategie Platz gemacht"""
+        eintraege = self.eintraege
+        vorher = eintraege.get(schluessel)
+        if vorher is not None:
+            # Ein tiefer gesuchtes Ergebnis wird nicht durch ein flacheres ersetzt
+            if vorher[1] > tiefe:
+                return
+            if self.verdraengung == "lru":
+                eintraege.move_to_end(schluessel)
+        elif len(eintraege) >= self.groesse:
+            if not eintraege:
+                return  # groesse 0: Tabelle abgeschaltet
+            eintraege.popitem(last=False)
+        eintraege[schluessel] = (wert, tiefe)
+
+    def leeren(self):
+        """Entfernt alle Einträge und setzt die Statistik zurück"""
+        self.eintraege.clear()
+        self.treffer = 0
+        self.fehlschlaege = 0
+
+    def trefferquote(self):
+        """Anteil der erfolgreichen Nachschlagevorgänge (0 bis 1)"""
+        gesamt = self.treffer + self.fehlschlaege
+        return self.treffer / gesamt if gesamt else 0.0
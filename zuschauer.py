@@ -0,0 +1,427 @@
+"""
+Zuschauer-Stream: veröffentlicht den Spielzustand über einen lokalen TCP- oder Unix-Socket
+
+Andere Prozesse können so ein laufendes Spiel verfolgen, ohne den Bildschirm abzugreifen.
+Jeder Zuschauer erhält zuerst einen Keyframe mit dem vollständigen Zustand, danach nur noch
+die seit dem letzten Paket geänderten Felder und Zellen.
+
+Paketformat (little-endian), jedem Paket geht seine Länge als u16 voraus:
+    Kopf:     typ (u8: 0 = Keyframe, 1 = Delta), nummer (u32)
+    Keyframe: alle FELDER in ihrer Reihenfolge, danach ZEILEN * SPALTEN Zellbytes
+    Delta:    Maske der geänderten FELDER (u16), deren Werte, Anzahl geänderter Zellen (u8),
+              je Zelle Index y * SPALTEN + x (u8) und Zellbyte (u8)
+Zellbyte: Formwert (0 = leer, 1-7) in den unteren 4 Bits, Gimmick + 1 in den oberen 4 Bits.
+
+Beispiel:
+    python main.py --zuschauer 127.0.0.1:7777
+    python zuschauer.py 127.0.0.1:7777
+"""
+
+import argparse
+import os
+import queue
+import socket
+import stat
+import struct
+import threading
+from collections import deque
+from config import SPALTEN, ZEILEN, ZUSCHAUER_ADRESSE, ZUSCHAUER_WARTESCHLANGE, ZUSCHAUER_PUFFER
+
+# Pakettypen
+KEYFRAME = 0
+DELTA = 1
+
+# Übertragene Einzelwerte: (name, struct-Format)
+FELDER = (
+    ("status", "B"),  # Bit 0: Spiel aktiv, Bit 1: Pause
+    ("score", "I"),
+    ("linien", "I"),
+    ("level", "H"),
+    ("stein_form", "b"),  # -1 = kein Stein
+    ("stein_rotation", "b"),
+    ("stein_x", "b"),
+    ("stein_y", "b"),
+    ("stein_gimmick", "b"),
+    ("naechstes_form", "b"),
+    ("naechstes_gimmick", "b"),
+    ("zeitfaktor", "f"),
+    ("zeitfaktor_timer", "H"),
+    ("gravitation_richtung", "B"),
+    ("gravitation_timer", "H"),
+)
+
+LAENGE = struct.Struct("<H")
+KOPF = struct.Struct("<BI")
+ALLE_FELDER = struct.Struct("<" + "".join(format for _, format in FELDER))
+FELD_STRUCTS = [struct.Struct("<" + format) for _, format in FELDER]
+MASKE = struct.Struct("<H")
+ZELLEN = ZEILEN * SPALTEN
+
+
+def adresse_parsen(text):
+    """Liest "host:port" (TCP) oder einen Dateipfad (Unix-Socket)"""
+    host, trenner, port = text.rpartition(":")
+    if trenner and port.isdigit():
+        return socket.AF_INET, (host or "127.0.0.1", int(port))
+    return getattr(socket, "AF_UNIX", None), text  # Unix-Sockets gibt es nicht überall
+
+
+def _socket_datei(pfad):
+    """Kennung (st_dev, st_ino) des Unix-Sockets unter pfad
+
+    None, wenn dort nichts liegt; False, wenn dort etwas anderes als ein Socket liegt.
+    """
+    try:
+        info = os.stat(pfad)
+    except FileNotFoundError:
+        return None
+    if not stat.S_ISSOCK(info.st_mode):
+        return False
+    return info.st_dev, info.st_ino
+
+
+def felder_lesen(engine):
+    """Gibt die Einzelwerte des Spielzustands in der Reihenfolge von FELDER zurück"""
+    stein = engine.aktuelles_tetromino
+    naechstes = engine.naechstes_tetromino
+    if stein:
+        stein_werte = (stein.form_idx, stein.aktuelle_rotation, stein.x, stein.y, stein.gimmick_effekt)
+    else:
+        stein_werte = (-1, 0, 0, 0, -1)
+    if naechstes:
+        naechstes_werte = (naechstes.form_idx, naechstes.gimmick_effekt)
+    else:
+        naechstes_werte = (-1, -1)
+    return ((engine.spiel_aktiv | engine.pause << 1, engine.score, engine.linien, engine.level)
+            + stein_werte + naechstes_werte
+            + (engine.aktiver_zeitfaktor, engine.zeitfaktor_timer,
+               engine.gravitation_richtung, engine.gravitation_timer))
+
+
+def zellen_lesen(engine):
+    """Gibt die Zellbytes des Spielfelds zeilenweise zurück"""
+    zellen = bytearray(ZELLEN)
+    i = 0
+    for werte_zeile, gimmick_zeile in zip(engine.spielfeld.werte, engine.spielfeld_gimmicks):
+        for wert, gimmick in zip(werte_zeile, gimmick_zeile):
+            zellen[i] = wert | (gimmick + 1) << 4
+            i += 1
+    return bytes(zellen)
+
+
+class DeltaKodierer:
+    """Merkt sich den zuletzt gesendeten Zustand und kodiert nur die Änderungen dagegen"""
+
+    def __init__(self):
+        self.nummer = 0
+        self.felder = None
+        self.zellen = None
+
+    def kodieren(self, felder, zellen, keyframe=False):
+        """Gibt das nächste Paket (mit Länge) zurück; None, wenn sich nichts geändert hat"""
+        if keyframe or self.felder is None:
+            rumpf = ALLE_FELDER.pack(*felder) + zellen
+            typ = KEYFRAME
+        else:
+            maske = 0
+            teile = []
+            for i, (alt, neu) in enumerate(zip(self.felder, felder)):
+                if alt != neu:
+                    maske |= 1 << i
+                    teile.append(FELD_STRUCTS[i].pack(neu))
+            geaendert = []
+            if zellen is not self.zellen:
+                for i, (alt, neu) in enumerate(zip(self.zellen, zellen)):
+                    if alt != neu:
+                        geaendert += (i, neu)
+            if not maske and not geaendert:
+                return None
+            rumpf = MASKE.pack(maske) + b"".join(teile) + bytes([len(geaendert) // 2]) + bytes(geaendert)
+            typ = DELTA
+
+        self.felder = felder
+        self.zellen = zellen
+        self.nummer += 1
+        paket = KOPF.pack(typ, self.nummer) + rumpf
+        return LAENGE.pack(len(paket)) + paket
+
+
+class _Zuschauer:
+    """Verbindung zu einem Zuschauer mit eigenem, begrenztem Sendepuffer"""
+
+    def __init__(self, verbindung):
+        self.verbindung = verbindung
+        self.pakete = deque()
+        self.groesse = 0  # Noch zu sendende Bytes
+        self.gesendet = 0  # Bereits gesendete Bytes des ersten Pakets
+        self.wartet_auf_keyframe = True
+
+    def verwerfen(self):
+        """Leert den Puffer; ein angefangenes Paket wird noch zu Ende gesendet, sonst zerfällt der Strom"""
+        kopf = self.pakete[0] if self.gesendet else None
+        self.pakete.clear()
+        self.groesse = 0
+        if kopf is not None:
+            self.pakete.append(kopf)
+            self.groesse = len(kopf) - self.gesendet
+
+
+class ZuschauerServer:
+    """Nimmt Zuschauer an und verteilt die Pakete in einem eigenen Thread
+
+    veroeffentlichen() blockiert nie: Pakete gehen in eine begrenzte Warteschlange. Ist sie
+    voll oder läuft der Puffer eines langsamen Zuschauers über, wird verworfen und danach ein
+    neuer Keyframe angefordert, sodass die Zuschauer wieder aufsetzen können.
+    """
+
+    def __init__(self, adresse=ZUSCHAUER_ADRESSE, warteschlange=ZUSCHAUER_WARTESCHLANGE,
+                 puffer=ZUSCHAUER_PUFFER):
+        self.familie, self.adresse = adresse_parsen(adresse)
+        self.warteschlange = queue.Queue(maxsize=warteschlange)
+        self.max_puffer = puffer
+        self.kodierer = DeltaKodierer()
+        self.keyframe_noetig = threading.Event()
+        self.zuschauer = []
+        self.verworfen = 0  # Pakete, die wegen voller Warteschlange oder Puffer verloren gingen
+        self._socket = None
+        self._socket_datei = None  # (st_dev, st_ino) der selbst angelegten Socket-Datei
+        self._thread = None
+        self._laeuft = False
+
+        # Spielfeld-Zellen nur neu lesen, wenn sich das Spielfeld geändert hat
+        self._spielfeld = None
+        self._version = None
+        self._zellen = None
+
+    def starten(self):
+        """Öffnet den Socket und startet den Sende-Thread; gibt False zurück, wenn das nicht geht"""
+        if self.familie is None:
+            print(f"Unix-Sockets werden hier nicht unterstützt, bitte host:port angeben: {self.adresse}")
+            return False
+        try:
+            if self.familie != socket.AF_INET:
+                vorhanden = _socket_datei(self.adresse)
+                if vorhanden is False:
+                    print(f"Zuschauer-Stream nicht gestartet: {self.adresse} existiert und ist kein Socket")
+                    return False
+                if vorhanden:
+                    os.remove(self.adresse)  # Überbleibsel eines früheren Laufs
+            self._socket = socket.socket(self.familie, socket.SOCK_STREAM)
+            if self.familie == socket.AF_INET:
+                self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self._socket.bind(self.adresse)
+            if self.familie != socket.AF_INET:
+                self._socket_datei = _socket_datei(self.adresse)
+            self._socket.listen()
+            self._socket.setblocking(False)
+        except OSError as e:
+            print(f"Zuschauer-Stream konnte nicht gestartet werden ({self.adresse}): {e}")
+            self._socket = None
+            return False
+
+        self._laeuft = True
+        self._thread = threading.Thread(target=self._senden_schleife, name="zuschauer", daemon=True)
+        self._thread.start()
+        print(f"Zuschauer-Stream auf {self.adresse}")
+        return True
+
+    def beenden(self):
+        """Stoppt den Sende-Thread und schließt alle Verbindungen"""
+        if not self._laeuft:
+            return
+        self._laeuft = False
+        self._thread.join()
+        for zuschauer in self.zuschauer:
+            zuschauer.verbindung.close()
+        self.zuschauer = []
+        self._socket.close()
+        # Nur die eigene Socket-Datei entfernen, nicht was inzwischen an ihrer Stelle liegt
+        if self._socket_datei and _socket_datei(self.adresse) == self._socket_datei:
+            os.remove(self.adresse)
+        self._socket_datei = None
+
+    def veroeffentlichen(self, engine):
+        """Kodiert den Zustand der Engine und reiht das Paket ein (aus der Spielschleife aufrufen)"""
+        if not self._laeuft:
+            return
+        keyframe = self.keyframe_noetig.is_set()
+        if not self.zuschauer and not keyframe:
+            return  # Ohne Zuschauer nichts kodieren; wer sich verbindet, fordert einen Keyframe an
+        if keyframe:
+            self.keyframe_noetig.clear()
+
+        spielfeld = engine.spielfeld
+        if spielfeld is not self._spielfeld or spielfeld.version != self._version:
+            self._spielfeld, self._version = spielfeld, spielfeld.version
+            self._zellen = zellen_lesen(engine)
+
+        paket = self.kodierer.kodieren(felder_lesen(engine), self._zellen, keyframe)
+        if paket is None:
+            return
+        try:
+            self.warteschlange.put_nowait((keyframe, paket))
+        except queue.Full:
+            # Ein verlorenes Delta macht alle folgenden wertlos: neu aufsetzen
+            self.verworfen += 1
+            self.keyframe_noetig.set()
+
+    def _senden_schleife(self):
+        """Sende-Thread: nimmt Zuschauer an, verteilt Pakete und schreibt ohne zu blockieren"""
+        while self._laeuft:
+            self._annehmen()
+            try:
+                keyframe, paket = self.warteschlange.get(timeout=0.05)
+            except queue.Empty:
+                keyframe, paket = False, None
+            if paket is not None:
+                self._verteilen(keyframe, paket)
+            self._schreiben()
+
+    def _annehmen(self):
+        """Nimmt wartende Verbindungen an; jeder neue Zuschauer braucht einen Keyframe"""
+        while True:
+            try:
+                verbindung, _ = self._socket.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                print(f"Fehler beim Annehmen eines Zuschauers: {e}")
+                return
+            verbindung.setblocking(False)
+            self.zuschauer.append(_Zuschauer(verbindung))
+            self.keyframe_noetig.set()
+
+    def _verteilen(self, keyframe, paket):
+        """Hängt ein Paket an die Puffer der Zuschauer an"""
+        for zuschauer in self.zuschauer:
+            if keyframe:
+                zuschauer.wartet_auf_keyframe = False
+                zuschauer.verwerfen()  # Ältere Deltas braucht es nach einem Keyframe nicht mehr
+            elif zuschauer.wartet_auf_keyframe:
+                continue
+            if zuschauer.groesse + len(paket) > self.max_puffer:
+                # Zuschauer kommt nicht hinterher: Puffer verwerfen und mit einem Keyframe neu aufsetzen
+                zuschauer.verwerfen()
+                zuschauer.wartet_auf_keyframe = True
+                self.verworfen += 1
+                self.keyframe_noetig.set()
+                continue
+            zuschauer.pakete.append(paket)
+            zuschauer.groesse += len(paket)
+
+    def _schreiben(self):
+        """Schreibt so viel aus den Puffern, wie die Sockets ohne Warten annehmen"""
+        getrennt = []
+        for zuschauer in self.zuschauer:
+            try:
+                while zuschauer.pakete:
+                    paket = zuschauer.pakete[0]
+                    gesendet = zuschauer.verbindung.send(memoryview(paket)[zuschauer.gesendet:])
+                    zuschauer.groesse -= gesendet
+                    zuschauer.gesendet += gesendet
+                    if zuschauer.gesendet < len(paket):
+                        break  # Socket-Puffer voll
+                    zuschauer.pakete.popleft()
+                    zuschauer.gesendet = 0
+            except (BlockingIOError, InterruptedError):
+                pass
+            except OSError:
+                getrennt.append(zuschauer)
+        for zuschauer in getrennt:
+            zuschauer.verbindung.close()
+            self.zuschauer.remove(zuschauer)
+
+
+class ZuschauerZustand:
+    """Empfangsseite: setzt den Spielzustand aus Keyframes und Deltas wieder zusammen"""
+
+    def __init__(self):
+        self.felder = None
+        self.zellen = None
+        self.nummer = None
+
+    def anwenden(self, paket):
+        """Wendet ein Paket (ohne Längenpräfix) an; Deltas vor dem ersten Keyframe werden ignoriert"""
+        typ, nummer = KOPF.unpack_from(paket)
+        versatz = KOPF.size
+        if typ == KEYFRAME:
+            self.felder = list(ALLE_FELDER.unpack_from(paket, versatz))
+            versatz += ALLE_FELDER.size
+            self.zellen = bytearray(paket[versatz:versatz + ZELLEN])
+        elif self.felder is not None:
+            maske, = MASKE.unpack_from(paket, versatz)
+            versatz += MASKE.size
+            for i, feld_struct in enumerate(FELD_STRUCTS):
+                if maske >> i & 1:
+                    self.felder[i], = feld_struct.unpack_from(paket, versatz)
+                    versatz += feld_struct.size
+            anzahl = paket[versatz]
+            versatz += 1
+            for _ in range(anzahl):
+                self.zellen[paket[versatz]] = paket[versatz + 1]
+                versatz += 2
+        else:
+            return False
+        self.nummer = nummer
+        return True
+
+    def wert(self, name):
+        """Gibt einen Einzelwert nach seinem Namen in FELDER zurück"""
+        for i, (feld_name, _) in enumerate(FELDER):
+            if feld_name == name:
+                return self.felder[i]
+        raise KeyError(name)
+
+    def als_text(self):
+        """Stellt Spielfeld und Werte als Text dar (der aktive Stein ist nicht eingezeichnet)"""
+        zeilen = [f"Score {self.wert('score')}  Linien {self.wert('linien')}  Level {self.wert('level')}"]
+        for y in range(ZEILEN):
+            reihe = self.zellen[y * SPALTEN:(y + 1) * SPALTEN]
+            zeilen.append("|" + "".join("#" if zelle & 0x0F else "." for zelle in reihe) + "|")
+        return "\n".join(zeilen)
+
+
+def pakete_lesen(verbindung):
+    """Liest Pakete (ohne Längenpräfix) aus einer Verbindung, bis sie geschlossen wird"""
+    puffer = bytearray()
+    while True:
+        daten = verbindung.recv(65536)
+        if not daten:
+            return
+        puffer += daten
+        while len(puffer) >= LAENGE.size:
+            laenge, = LAENGE.unpack_from(puffer)
+            if len(puffer) < LAENGE.size + laenge:
+                break
+            yield bytes(puffer[LAENGE.size:LAENGE.size + laenge])
+            del puffer[:LAENGE.size + laenge]
+
+
+def main():
+    """Kommandozeilen-Einstieg: verbindet sich mit einem Spiel und zeigt es als Text an"""
+    parser = argparse.ArgumentParser(description="Einem laufenden Tetris-Spiel zuschauen")
+    parser.add_argument("adresse", nargs="?", default=ZUSCHAUER_ADRESSE,
+                        help="host:port oder Pfad eines Unix-Sockets")
+    args = parser.parse_args()
+
+    familie, adresse = adresse_parsen(args.adresse)
+    if familie is None:
+        print(f"Unix-Sockets werden hier nicht unterstützt, bitte host:port angeben: {args.adresse}")
+        return 1
+    zustand = ZuschauerZustand()
+    try:
+        with socket.socket(familie, socket.SOCK_STREAM) as verbindung:
+            verbindung.connect(adresse)
+            for paket in pakete_lesen(verbindung):
+                if zustand.anwenden(paket):
+                    print("\033[H\033[J" + zustand.als_text(), flush=True)
+    except OSError as e:
+        print(f"Verbindung zu {args.adresse} fehlgeschlagen: {e}")
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())